@@ -0,0 +1,158 @@
+
+import pandas as pd
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from create_proposer_availability import create_proposer_availability
+from conversion_log import MatchSummary, configure_logging
+from schedule_store import ScheduleStore, PROPOSER
+
+def collect_input_files(input_pattern):
+    """
+    Resolve a directory or glob pattern into a sorted list of CSV files.
+
+    Args:
+        input_pattern: Directory containing form exports, or a glob pattern such as "exports/*.csv"
+    """
+    if os.path.isdir(input_pattern):
+        input_pattern = os.path.join(input_pattern, '*.csv')
+
+    return sorted(glob.glob(input_pattern))
+
+def _convert_file(input_file, id_row_name, no_transpose):
+    """Convert a single form export in a worker process."""
+    start = time.perf_counter()
+    timestamps = {}
+    summary = MatchSummary()
+    availability_df = create_proposer_availability(input_file, None, id_row_name, no_transpose, timestamps, summary)
+    return availability_df, timestamps, summary, time.perf_counter() - start
+
+def merge_availability(results):
+    """
+    Merge per-file availability matrices into one matrix.
+
+    When the same proposer ID appears in several files, the submission with the
+    latest timestamp wins. Submissions without a timestamp lose to timestamped
+    ones, and ties are resolved in favour of the file listed last.
+
+    Args:
+        results: List of (input_file, availability_df, timestamps) in file order
+
+    Returns:
+        Tuple of (merged availability DataFrame, number of duplicate IDs resolved)
+    """
+    winners = {}
+    duplicates = 0
+
+    for file_order, (input_file, availability_df, timestamps) in enumerate(results):
+        for proposer_id in availability_df.columns:
+            timestamp = timestamps.get(proposer_id, pd.NaT)
+            key = (pd.notna(timestamp), timestamp if pd.notna(timestamp) else pd.Timestamp.min, file_order)
+
+            if proposer_id in winners:
+                duplicates += 1
+                if key < winners[proposer_id][0]:
+                    continue
+            winners[proposer_id] = (key, availability_df[proposer_id])
+
+    if not winners:
+        return pd.DataFrame(), duplicates
+
+    merged_df = pd.concat([column for _, column in winners.values()], axis=1)
+    merged_df.columns = list(winners.keys())
+
+    return merged_df.fillna(0).astype(int), duplicates
+
+def batch_create_proposer_availability(input_pattern, output_file, id_row_name="ID", no_transpose=False, max_workers=None,
+                                       summary=None, log_level="WARNING", jsonl_log=None):
+    """
+    Convert several Google Form exports concurrently and merge them.
+
+    Args:
+        input_pattern: Directory or glob pattern of input CSV files
+        output_file: Path to save the merged proposer availability CSV
+        id_row_name: Name of the row/column containing proposer IDs
+        no_transpose: If True, assume the input files are not transposed (standard format)
+        max_workers: Number of worker processes (defaults to the number of CPUs)
+        summary: Optional MatchSummary updated with the matching outcome of every proposer
+        log_level: Console log level used in the worker processes
+        jsonl_log: Optional JSONL log path the worker processes append to
+
+    Returns:
+        Tuple of (merged availability DataFrame, list of (input_file, proposers, seconds))
+    """
+    input_files = collect_input_files(input_pattern)
+    if not input_files:
+        raise ValueError(f"No CSV files found for '{input_pattern}'")
+
+    converted = {}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=configure_logging,
+                             initargs=(log_level, jsonl_log, "a")) as executor:
+        futures = {
+            executor.submit(_convert_file, input_file, id_row_name, no_transpose): input_file
+            for input_file in input_files
+        }
+        for future in as_completed(futures):
+            converted[futures[future]] = future.result()
+
+    results = []
+    timings = []
+    for input_file in input_files:
+        availability_df, timestamps, file_summary, elapsed = converted[input_file]
+        if summary is not None:
+            summary.merge(file_summary)
+        results.append((input_file, availability_df, timestamps))
+        timings.append((input_file, len(availability_df.columns), elapsed))
+
+    merged_df, duplicates = merge_availability(results)
+    if duplicates:
+        print(f"Resolved {duplicates} duplicate proposer IDs (latest timestamp wins)")
+
+    merged_df.to_csv(output_file)
+
+    return merged_df, timings
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert multiple Google Form CSV exports into one proposer availability file.')
+    parser.add_argument('--input', required=True, help='Directory or glob pattern of input CSV files from Google Form')
+    parser.add_argument('--output-file', default='proposer_availability.csv', help='Output proposer availability CSV file')
+    parser.add_argument('--id-row', default='ID', help='Name of the row/column containing proposer IDs')
+    parser.add_argument('--no-transpose', action='store_true', help='Set this flag if the input CSVs are not transposed (standard format)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: number of CPUs)')
+    parser.add_argument('--log-level', default='WARNING', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], help='Console log level (DEBUG shows the full matching trace)')
+    parser.add_argument('--jsonl-log', help='Optional path of a machine-readable JSONL log')
+    parser.add_argument('--db', help='Optional SQLite cohort store to also save the availability to')
+
+    args = parser.parse_args()
+
+    configure_logging(args.log_level, args.jsonl_log)
+
+    output_dir = os.path.dirname(args.output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    summary = MatchSummary()
+    availability_df, timings = batch_create_proposer_availability(
+        args.input, args.output_file, args.id_row, args.no_transpose, args.workers,
+        summary, args.log_level, args.jsonl_log)
+
+    if args.db:
+        with ScheduleStore(args.db) as store:
+            store.write_availability_frame(PROPOSER, availability_df)
+
+    print(summary.format())
+
+    print("Per-file conversion time:")
+    for input_file, num_proposers, elapsed in timings:
+        print(f"- {input_file}: {num_proposers} proposers in {elapsed:.2f}s")
+
+    print(f"Proposer availability file created: {args.output_file}")
+    print(f"Number of proposers: {len(availability_df.columns)}")
+    print(f"Number of time slots: {len(availability_df)}")
+    print(f"Total time: {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Decomposition of a cohort into independent scheduling problems.
+
+Mentors and projects are the nodes of the interaction graph and every
+preference (mentor wants to interview project) is an edge. Two connected
+components share no mentor and no project, so they can be scheduled
+separately and the schedules merged without conflicts.
+"""
+
+class UnionFind:
+    """Disjoint sets with path halving and union by size."""
+
+    def __init__(self):
+        self.parent = {}
+        self.size = {}
+
+    def find(self, item):
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+            return item
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+
+def find_components(mentor_preferences):
+    """
+    Split mentor preferences into connected components.
+
+    Args:
+        mentor_preferences: {mentor: [projects]}
+
+    Returns:
+        List of {mentor: [projects]} (mentors and projects in their original order),
+        largest component (by number of requested interviews) first. Mentors
+        without preferences are left out.
+    """
+    sets = UnionFind()
+    for mentor, projects in mentor_preferences.items():
+        for project in projects:
+            # Mentors and projects live in separate namespaces of the same forest
+            sets.union(('mentor', mentor), ('project', project))
+
+    components = {}
+    for mentor, projects in mentor_preferences.items():
+        if projects:
+            components.setdefault(sets.find(('mentor', mentor)), {})[mentor] = projects
+
+    return sorted(components.values(), key=lambda c: sum(len(projects) for projects in c.values()), reverse=True)
+
+def pack_components(components, num_bins):
+    """
+    Group components into at most num_bins subproblems of similar size.
+
+    Each component goes to the currently smallest bin, largest component
+    first, so few large tasks are created instead of one per tiny component.
+
+    Args:
+        components: List of {mentor: [projects]}, largest first
+        num_bins: Maximum number of groups
+
+    Returns:
+        List of {mentor: [projects]}, one per non-empty group
+    """
+    bins = [({}, [0]) for _ in range(max(1, num_bins))]
+    for component in components:
+        preferences, load = min(bins, key=lambda b: b[1][0])
+        preferences.update(component)
+        load[0] += sum(len(projects) for projects in component.values())
+    return [preferences for preferences, _ in bins if preferences]
@@ -0,0 +1,112 @@
+import json
+import logging
+from collections import Counter
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+MATCH_KINDS = ["direct", "comma", "partial", "regex"]
+
+class MatchSummary:
+    """Aggregated counts of how proposers' availability answers were matched."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.failed = []
+
+    def record(self, proposer_id, match_kind):
+        """Record the outcome of process_availability_string for one proposer."""
+        if match_kind:
+            self.counts[match_kind] += 1
+        else:
+            self.counts["failed"] += 1
+            self.failed.append(proposer_id)
+
+    def merge(self, other):
+        """Add the counts of another summary (e.g. from a worker process)."""
+        self.counts.update(other.counts)
+        self.failed.extend(other.failed)
+
+    def as_dict(self):
+        """Return the counts as a plain dictionary, including zero counts."""
+        summary = {kind: self.counts[kind] for kind in MATCH_KINDS}
+        summary["failed"] = self.counts["failed"]
+        return summary
+
+    def format(self):
+        """Return a one-line human readable summary."""
+        counts = ", ".join(f"{kind}: {count}" for kind, count in self.as_dict().items())
+        line = f"Availability matches ({sum(self.counts.values())} proposers) - {counts}"
+        if self.failed:
+            line += f"\nNo matches found for: {', '.join(self.failed)}"
+        return line
+
+class JsonlFormatter(logging.Formatter):
+    """Format log records as one JSON object per line."""
+
+    EXTRA_FIELDS = ["proposer_id", "match", "slots", "input_file"]
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for field in self.EXTRA_FIELDS:
+            if hasattr(record, field):
+                entry[field] = getattr(record, field)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class LockedFileHandler(logging.FileHandler):
+    """
+    Append log records to a file shared by several processes.
+
+    Each record is written and flushed under an exclusive flock, so lines of
+    different worker processes are never interleaved (no locking on Windows).
+    """
+
+    def __init__(self, filename, encoding=None):
+        super().__init__(filename, mode='a', encoding=encoding)
+
+    def emit(self, record):
+        if fcntl is None or self.stream is None:
+            super().emit(record)
+            return
+        fcntl.flock(self.stream.fileno(), fcntl.LOCK_EX)
+        try:
+            super().emit(record)
+        finally:
+            fcntl.flock(self.stream.fileno(), fcntl.LOCK_UN)
+
+def configure_logging(level="WARNING", jsonl_file=None, jsonl_mode="w"):
+    """
+    Configure console and optional JSONL logging for the converters.
+
+    Bulk runs stay quiet with the default WARNING level; use INFO for one line
+    per proposer or DEBUG for the full matching trace.
+
+    Args:
+        level: Console log level name
+        jsonl_file: Optional path of a machine-readable JSONL log (records INFO and above)
+        jsonl_mode: "w" to start a new JSONL log, "a" to append to it (e.g. from
+            worker processes); every process appends with a lock
+    """
+    console = logging.StreamHandler()
+    console.setLevel(level)
+    console.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    handlers = [console]
+    root_level = logging.getLevelName(level)
+
+    if jsonl_file:
+        if jsonl_mode == "w":
+            open(jsonl_file, 'w').close()
+        jsonl = LockedFileHandler(jsonl_file, encoding='utf-8')
+        jsonl.setLevel(logging.INFO)
+        jsonl.setFormatter(JsonlFormatter())
+        handlers.append(jsonl)
+        root_level = min(root_level, logging.INFO)
+
+    logging.basicConfig(level=root_level, handlers=handlers, force=True)
@@ -4,6 +4,8 @@ import argparse
 import os
 import re
 from datetime import datetime, timedelta
+from slot_times import split_into_hourly_slots
+from schedule_store import ScheduleStore, MENTOR
 
 def generate_time_slots():
     """Generate the list of time slots as specified in the requirements."""
@@ -38,8 +40,6 @@ def generate_time_slots():
         "5/6 夜 (19:00 - 21:00)"
     ]
     
-    from generate_test_data import split_into_hourly_slots
-    
     hourly_slots = []
     for slot in original_slots:
         hourly_slots.extend(split_into_hourly_slots(slot))
@@ -85,6 +85,7 @@ def main():
     parser = argparse.ArgumentParser(description='Create mentor availability file from Google Form CSV.')
     parser.add_argument('--input-file', required=True, help='Input CSV file from Google Form')
     parser.add_argument('--output-file', default='mentor_availability.csv', help='Output mentor availability CSV file')
+    parser.add_argument('--db', help='Optional SQLite cohort store to also save the availability to')
     
     args = parser.parse_args()
     
@@ -94,6 +95,10 @@ def main():
     
     availability_df = create_mentor_availability(args.input_file, args.output_file)
     
+    if args.db:
+        with ScheduleStore(args.db) as store:
+            store.write_availability_frame(MENTOR, availability_df)
+    
     print(f"Mentor availability file created: {args.output_file}")
     print(f"Number of mentors: {len(availability_df.columns)}")
     print(f"Number of time slots: {len(availability_df)}")
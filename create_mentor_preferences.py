@@ -2,6 +2,7 @@
 import pandas as pd
 import argparse
 import os
+from schedule_store import ScheduleStore
 
 def create_mentor_preferences(input_file, output_file, id_row_name="ID"):
     """
@@ -62,6 +63,7 @@ def main():
     parser.add_argument('--input-file', required=True, help='Input transposed CSV file')
     parser.add_argument('--output-file', default='mentor_preferences.csv', help='Output mentor preferences CSV file')
     parser.add_argument('--id-row', default='ID', help='Name of the row containing project IDs')
+    parser.add_argument('--db', help='Optional SQLite cohort store to also save the preferences to')
     
     args = parser.parse_args()
     
@@ -71,6 +73,10 @@ def main():
     
     preferences_df = create_mentor_preferences(args.input_file, args.output_file, args.id_row)
     
+    if args.db:
+        with ScheduleStore(args.db) as store:
+            store.write_preferences({mentor: row.dropna().tolist() for mentor, row in preferences_df.iterrows()}, replace=True)
+    
     print(f"Mentor preferences file created: {args.output_file}")
     print(f"Number of mentors: {len(preferences_df)}")
     print(f"Number of preferred projects: {sum(len(row.dropna()) for _, row in preferences_df.iterrows())}")
@@ -4,8 +4,16 @@ import argparse
 import os
 import re
 import sys
+import logging
 from datetime import datetime, timedelta
+from slot_times import split_into_hourly_slots
 from process_availability import process_availability_string
+from conversion_log import MatchSummary, configure_logging
+from schedule_store import ScheduleStore, PROPOSER
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_ROW_NAME = "タイムスタンプ"
 
 def generate_time_slots():
     """Generate the list of time slots as specified in the requirements."""
@@ -40,23 +48,38 @@ def generate_time_slots():
         "5/6 夜 (19:00 - 21:00)"
     ]
     
-    from generate_test_data import split_into_hourly_slots
-    
     hourly_slots = []
     for slot in original_slots:
         hourly_slots.extend(split_into_hourly_slots(slot))
     
     return hourly_slots
 
-def create_proposer_availability(input_file, output_file, id_row_name="ID", no_transpose=False):
+def _column_timestamp(df, col_idx):
+    """
+    Return the submission timestamp of a proposer column, or NaT if unknown.
+    
+    A "タイムスタンプ" row takes precedence; otherwise the column header (the
+    first row of a transposed export) is used.
+    """
+    first_col_values = df.iloc[:, 0].tolist()
+    if TIMESTAMP_ROW_NAME in first_col_values:
+        value = df.iloc[first_col_values.index(TIMESTAMP_ROW_NAME), col_idx]
+    else:
+        # pandas mangles duplicate headers as "name.1", "name.2", ...
+        value = re.sub(r'\.\d+$', '', str(df.columns[col_idx]))
+    return pd.to_datetime(value, errors='coerce')
+
+def create_proposer_availability(input_file, output_file, id_row_name="ID", no_transpose=False, timestamps=None, summary=None):
     """
     Convert Google Form CSV format to proposer availability format.
     
     Args:
         input_file: Path to the input CSV file from Google Form
-        output_file: Path to save the output proposer availability CSV
+        output_file: Path to save the output proposer availability CSV (None to skip saving)
         id_row_name: Name of the row/column containing proposer IDs
         no_transpose: If True, assume the input file is not transposed (standard format)
+        timestamps: Optional dictionary filled with {proposer_id: submission timestamp}
+        summary: Optional MatchSummary updated with the matching outcome of each proposer
     """
     df = pd.read_csv(input_file)
     
@@ -126,7 +149,7 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
             is_transposed = not no_transpose
     
     if is_transposed:
-        print("Processing file as transposed (rows are attributes, columns are proposers)")
+        logger.info("Processing file as transposed (rows are attributes, columns are proposers)")
         
         interview_row_index = None
         
@@ -149,7 +172,7 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
                     if isinstance(cell_value, str) and ("午前" in cell_value or "午後" in cell_value or "夜" in cell_value):
                         if any(f"{month}/{day}" in cell_value for month in ["4", "5"] for day in range(1, 32)):
                             interview_row_index = idx
-                            print(f"Found availability data in row {idx} with first column: {row.iloc[0]}")
+                            logger.info("Found availability data in row %s with first column: %s", idx, row.iloc[0])
                             break
                 if interview_row_index is not None:
                     break
@@ -166,11 +189,11 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
                     values = [v for v in row.iloc[1:] if not pd.isna(v)]
                     if len(values) == len(set(values)) and len(values) > 0:
                         id_row_index = idx
-                        print(f"Using row {idx} with first column '{row.iloc[0]}' as ID row")
+                        logger.info("Using row %s with first column '%s' as ID row", idx, row.iloc[0])
                         break
         
         if id_row_index is None:
-            print("Could not find ID row, using column indices as IDs")
+            logger.warning("Could not find ID row, using column indices as IDs")
             for col_idx in range(1, len(df.columns)):
                 proposer_id = f"P{col_idx:03d}"
                 
@@ -180,9 +203,13 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
                     continue
                     
                 availability_df[proposer_id] = False
+                if timestamps is not None:
+                    timestamps[proposer_id] = _column_timestamp(df, col_idx)
                 
                 if isinstance(available_slots_str, str):
-                    process_availability_string(available_slots_str, proposer_id, availability_df, time_slots, original_slots, slot_mapping)
+                    match_kind = process_availability_string(available_slots_str, proposer_id, availability_df, time_slots, original_slots, slot_mapping)
+                    if summary is not None:
+                        summary.record(proposer_id, match_kind)
         else:
             for col_idx in range(1, len(df.columns)):
                 proposer_id = df.iloc[id_row_index, col_idx]
@@ -196,12 +223,16 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
                     continue
                     
                 availability_df[str(proposer_id)] = False
+                if timestamps is not None:
+                    timestamps[str(proposer_id)] = _column_timestamp(df, col_idx)
                 
                 if isinstance(available_slots_str, str):
-                    process_availability_string(available_slots_str, str(proposer_id), availability_df, time_slots, original_slots, slot_mapping)
+                    match_kind = process_availability_string(available_slots_str, str(proposer_id), availability_df, time_slots, original_slots, slot_mapping)
+                    if summary is not None:
+                        summary.record(str(proposer_id), match_kind)
     
     else:
-        print("Processing file as non-transposed (columns are proposers, rows are attributes)")
+        logger.info("Processing file as non-transposed (columns are proposers, rows are attributes)")
         
         interview_row_idx = None
         
@@ -210,11 +241,11 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
             if isinstance(row_name, str):
                 if "二次選考" in row_name and "面接" in row_name:
                     interview_row_idx = idx
-                    print(f"Found interview availability data in row {idx}: '{row_name}'")
+                    logger.info("Found interview availability data in row %s: '%s'", idx, row_name)
                     break
                 elif "可能な日時" in row_name:
                     interview_row_idx = idx
-                    print(f"Found interview availability data in row {idx}: '{row_name}'")
+                    logger.info("Found interview availability data in row %s: '%s'", idx, row_name)
                     break
         
         if interview_row_idx is None:
@@ -224,7 +255,7 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
                     if isinstance(cell_value, str) and ("午前" in cell_value or "午後" in cell_value or "夜" in cell_value):
                         if any(f"{month}/{day}" in cell_value for month in ["4", "5"] for day in range(1, 32)):
                             interview_row_idx = idx
-                            print(f"Found availability data in row {idx} with first column: {row.iloc[0]}")
+                            logger.info("Found availability data in row %s with first column: %s", idx, row.iloc[0])
                             break
                 if interview_row_idx is not None:
                     break
@@ -238,7 +269,7 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
             row_name = row.iloc[0]  # First column contains row names
             if row_name == id_row_name:
                 id_row_idx = idx
-                print(f"Found ID row at index {idx}: '{row_name}'")
+                logger.info("Found ID row at index %s: '%s'", idx, row_name)
                 break
         
         for col_idx in range(1, len(df.columns)):
@@ -255,13 +286,18 @@ def create_proposer_availability(input_file, output_file, id_row_name="ID", no_t
                 continue
                 
             availability_df[str(proposer_id)] = False
+            if timestamps is not None:
+                timestamps[str(proposer_id)] = _column_timestamp(df, col_idx)
             
             if isinstance(available_slots_str, str):
-                process_availability_string(available_slots_str, str(proposer_id), availability_df, time_slots, original_slots, slot_mapping)
+                match_kind = process_availability_string(available_slots_str, str(proposer_id), availability_df, time_slots, original_slots, slot_mapping)
+                if summary is not None:
+                    summary.record(str(proposer_id), match_kind)
     
     availability_df = availability_df.astype(int)
     
-    availability_df.to_csv(output_file)
+    if output_file:
+        availability_df.to_csv(output_file)
     
     return availability_df
 
@@ -271,15 +307,26 @@ def main():
     parser.add_argument('--output-file', default='proposer_availability.csv', help='Output proposer availability CSV file')
     parser.add_argument('--id-row', default='ID', help='Name of the row/column containing proposer IDs')
     parser.add_argument('--no-transpose', action='store_true', help='Set this flag if the input CSV is not transposed (standard format)')
+    parser.add_argument('--log-level', default='WARNING', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], help='Console log level (DEBUG shows the full matching trace)')
+    parser.add_argument('--jsonl-log', help='Optional path of a machine-readable JSONL log')
+    parser.add_argument('--db', help='Optional SQLite cohort store to also save the availability to')
     
     args = parser.parse_args()
     
+    configure_logging(args.log_level, args.jsonl_log)
+    
     output_dir = os.path.dirname(args.output_file)
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
     
-    availability_df = create_proposer_availability(args.input_file, args.output_file, args.id_row, args.no_transpose)
+    summary = MatchSummary()
+    availability_df = create_proposer_availability(args.input_file, args.output_file, args.id_row, args.no_transpose, summary=summary)
+    
+    if args.db:
+        with ScheduleStore(args.db) as store:
+            store.write_availability_frame(PROPOSER, availability_df)
     
+    print(summary.format())
     print(f"Proposer availability file created: {args.output_file}")
     print(f"Number of proposers: {len(availability_df.columns)}")
     print(f"Number of time slots: {len(availability_df)}")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Feasibility pre-analysis of a cohort before scheduling.
+
+With the availability matrices P (slots x projects) and M (slots x mentors)
+and the request matrix R (mentors x projects), a few matrix products give:
+
+- M.T @ P: common slots of every mentor-project pair; requested pairs with
+  none can never be scheduled and are pruned before solving
+- (P @ R.T) * M: per slot, the requested pairs that could meet in it
+  (contention), summed per day
+- per mentor, the feasible requests versus the free slots (capped per day
+  by the load limit), which shows who to ask for more availability
+"""
+
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+class FeasibilityReport:
+    """Result of analyze_feasibility."""
+
+    def __init__(self, mentors, slots, days, infeasible_pairs):
+        # DataFrames with one row per mentor, time slot and day
+        self.mentors = mentors
+        self.slots = slots
+        self.days = days
+        # List of {'Mentor', 'Project ID', 'Reason'} of requests that cannot be scheduled
+        self.infeasible_pairs = infeasible_pairs
+
+    def bottleneck_mentors(self):
+        """Return the mentors with more feasible requests than slots they can take, largest shortfall first."""
+        short = self.mentors[self.mentors['Shortfall'] > 0]
+        return short.sort_values(['Shortfall', 'Mentor'], ascending=[False, True])
+
+    def format_bottlenecks(self, top=5):
+        """Return a human readable summary of the bottlenecks."""
+        lines = []
+
+        short = self.bottleneck_mentors()
+        if len(short):
+            lines.append(f"Mentors with more requests than free slots ({len(short)}), ask them for more availability:")
+            for _, row in short.head(top).iterrows():
+                lines.append(f"- {row['Mentor']}: {row['Feasible Requests']} interviews, "
+                             f"{row['Capacity']} slots available (short {row['Shortfall']})")
+        else:
+            lines.append("Every mentor has at least as many free slots as requested interviews")
+
+        if len(self.days):
+            busiest = self.days.sort_values(['Pairs per Mentor Slot', 'Day'], ascending=[False, True]).head(min(top, 3))
+            lines.append("Most contended days (requested pairs per available mentor slot):")
+            for _, row in busiest.iterrows():
+                lines.append(f"- {row['Day']}: {row['Pairs per Mentor Slot']:.1f} "
+                             f"({row['Competing Pairs']} pairs, {row['Mentor Slots']} mentor slots)")
+
+        if self.infeasible_pairs:
+            examples = ', '.join(f"{pair['Mentor']}/{pair['Project ID']}" for pair in self.infeasible_pairs[:top])
+            lines.append(f"{len(self.infeasible_pairs)} requested interviews cannot be scheduled "
+                         f"(e.g. {examples}); see infeasible_pairs.csv")
+
+        return '\n'.join(lines)
+
+    def save(self, output_dir):
+        """Save the report as CSV files in output_dir."""
+        os.makedirs(output_dir, exist_ok=True)
+        self.mentors.to_csv(os.path.join(output_dir, 'feasibility_mentors.csv'), index=False)
+        self.slots.to_csv(os.path.join(output_dir, 'feasibility_slots.csv'), index=False)
+        self.days.to_csv(os.path.join(output_dir, 'feasibility_days.csv'), index=False)
+        pd.DataFrame(self.infeasible_pairs, columns=['Mentor', 'Project ID', 'Reason']).to_csv(
+            os.path.join(output_dir, 'infeasible_pairs.csv'), index=False)
+
+def analyze_feasibility(proposer_matrix, mentor_matrix, projects, mentors, time_slots, requests,
+                        slot_days=None, max_per_day=None):
+    """
+    Analyze demand, supply and contention of a cohort with matrix products.
+
+    Args:
+        proposer_matrix: Boolean array (slots x projects) of proposer availability
+        mentor_matrix: Boolean array (slots x mentors) of mentor availability
+        projects: Project IDs of the proposer_matrix columns
+        mentors: Mentors of the mentor_matrix columns
+        time_slots: Time slots of the rows
+        requests: {mentor: [projects]} requested interviews
+        slot_days: Optional day label of each slot (defaults to one day per slot)
+        max_per_day: Optional maximum number of interviews per mentor per day
+
+    Returns:
+        FeasibilityReport
+    """
+    if slot_days is None:
+        slot_days = list(time_slots)
+
+    project_pos = {project: i for i, project in enumerate(projects)}
+    mentor_pos = {mentor: j for j, mentor in enumerate(mentors)}
+
+    infeasible_pairs = []
+    requested = np.zeros((len(mentors), len(projects)), dtype=np.float32)
+    for mentor, mentor_projects in requests.items():
+        for project in mentor_projects:
+            if mentor not in mentor_pos:
+                infeasible_pairs.append({'Mentor': mentor, 'Project ID': project, 'Reason': 'Mentor has no availability data'})
+            elif project not in project_pos:
+                infeasible_pairs.append({'Mentor': mentor, 'Project ID': project, 'Reason': 'Project has no availability data'})
+            else:
+                requested[mentor_pos[mentor], project_pos[project]] = 1
+
+    P = proposer_matrix.astype(np.float32)
+    M = mentor_matrix.astype(np.float32)
+
+    # Common slots of every mentor-project pair (mentors x projects)
+    overlap = M.T @ P
+    for j, i in zip(*np.nonzero((requested > 0) & (overlap == 0))):
+        infeasible_pairs.append({'Mentor': mentors[j], 'Project ID': projects[i], 'Reason': 'No common availability'})
+    feasible = requested * (overlap > 0)
+
+    # Days as a one-hot matrix (slots x days)
+    day_labels = list(dict.fromkeys(slot_days))
+    day_pos = {day: d for d, day in enumerate(day_labels)}
+    day_matrix = np.zeros((len(time_slots), len(day_labels)), dtype=np.float32)
+    day_matrix[np.arange(len(time_slots)), [day_pos[day] for day in slot_days]] = 1
+
+    # Slots each mentor can take: free slots, capped per day by the load limit
+    free_slots = M.sum(axis=0)
+    if max_per_day is not None:
+        capacity = np.minimum(M.T @ day_matrix, max_per_day).sum(axis=1)
+    else:
+        capacity = free_slots
+    num_requested = requested.sum(axis=1)
+    num_feasible = feasible.sum(axis=1)
+
+    mentor_report = pd.DataFrame({
+        'Mentor': list(mentors),
+        'Requested': num_requested.astype(int),
+        'Feasible Requests': num_feasible.astype(int),
+        'Free Slots': free_slots.astype(int),
+        'Capacity': capacity.astype(int),
+        'Shortfall': np.maximum(num_feasible - capacity, 0).astype(int),
+        'Utilization (%)': np.round(100.0 * num_feasible / np.maximum(capacity, 1), 1),
+    })
+
+    # Requested pairs that could meet in each slot: (P @ R.T)[s, m] counts the
+    # projects mentor m asked for that are available in s
+    competing = (M * (P @ feasible.T)).sum(axis=1)
+    mentor_slots = M.sum(axis=1)
+    slot_report = pd.DataFrame({
+        'Time Slot': list(time_slots),
+        'Day': list(slot_days),
+        'Available Mentors': mentor_slots.astype(int),
+        'Available Proposers': P.sum(axis=1).astype(int),
+        'Competing Pairs': competing.astype(int),
+        'Pairs per Mentor': np.round(competing / np.maximum(mentor_slots, 1), 2),
+    })
+
+    day_competing = competing @ day_matrix
+    day_mentor_slots = mentor_slots @ day_matrix
+    day_report = pd.DataFrame({
+        'Day': day_labels,
+        'Mentor Slots': day_mentor_slots.astype(int),
+        'Competing Pairs': day_competing.astype(int),
+        'Pairs per Mentor Slot': np.round(day_competing / np.maximum(day_mentor_slots, 1), 2),
+    })
+
+    return FeasibilityReport(mentor_report, slot_report, day_report, infeasible_pairs)
+
+def main():
+    from interview_scheduler import InterviewScheduler
+
+    parser = argparse.ArgumentParser(description='Report scheduling bottlenecks before solving.')
+    parser.add_argument('--proposer-file', required=True, help='CSV file with proposers\' availability')
+    parser.add_argument('--mentor-file', required=True, help='CSV file with mentors\' availability')
+    parser.add_argument('--preference-file', required=True, help='CSV file with mentors\' project preferences')
+    parser.add_argument('--output-dir', default='feasibility_report', help='Directory to save the report files')
+    parser.add_argument('--max-per-day', type=int, default=None, help='Maximum number of interviews per mentor per day')
+    parser.add_argument('--top', type=int, default=5, help='Number of mentors and days to list')
+
+    args = parser.parse_args()
+
+    scheduler = InterviewScheduler(args.proposer_file, args.mentor_file, args.preference_file)
+    scheduler.set_load_limits(args.max_per_day, balance=False)
+    report = scheduler.analyze_feasibility()
+    report.save(args.output_dir)
+
+    print(report.format_bottlenecks(args.top))
+    print(f"Feasibility report saved to {args.output_dir}/")
+
+if __name__ == "__main__":
+    main()
@@ -3,48 +3,10 @@
 
 import pandas as pd
 import numpy as np
-import random
 import argparse
 import os
-import re
-from datetime import datetime, timedelta
-
-def split_into_hourly_slots(time_slot):
-    """
-    Split a time slot into hourly slots.
-    
-    Example: "4/23 夜 (19:00 - 21:00)" -> ["2024/04/23 19:00 PM", "2024/04/23 20:00 PM"]
-    """
-    match = re.match(r'(\d+/\d+)\s+[^\(]+\((\d+:\d+)\s*-\s*(\d+:\d+)\)', time_slot)
-    if not match:
-        return []
-    
-    date_str, start_time, end_time = match.groups()
-    
-    year = "2024"
-    
-    start_hour, start_minute = map(int, start_time.split(':'))
-    end_hour, end_minute = map(int, end_time.split(':'))
-    
-    month, day = map(int, date_str.split('/'))
-    
-    start_datetime = datetime(int(year), month, day, start_hour, start_minute)
-    end_datetime = datetime(int(year), month, day, end_hour, end_minute)
-    
-    hourly_slots = []
-    current_time = start_datetime
-    while current_time < end_datetime:
-        am_pm = "AM" if current_time.hour < 12 else "PM"
-        hour_12 = current_time.hour if current_time.hour <= 12 else current_time.hour - 12
-        if hour_12 == 0:
-            hour_12 = 12
-        
-        slot = f"{year}/{current_time.month:02d}/{current_time.day:02d} {hour_12:02d}:{current_time.minute:02d} {am_pm}"
-        hourly_slots.append(slot)
-        
-        current_time += timedelta(hours=1)
-    
-    return hourly_slots
+from datetime import datetime
+from slot_times import split_into_hourly_slots
 
 def generate_time_slots():
     """Generate the list of time slots as specified in the requirements."""
@@ -85,18 +47,73 @@ def generate_time_slots():
     
     return hourly_slots
 
-def generate_availability_data(num_entities, time_slots, availability_rate=0.3):
+JAPANESE_HOLIDAYS = {(4, 29), (5, 3), (5, 4), (5, 5), (5, 6)}
+
+MENTOR_NAMES = ["田中太郎", "佐藤次郎", "山田三郎", "鈴木四郎", "高橋五郎",
+                "伊藤六郎", "渡辺七郎", "小林八郎", "加藤九郎", "吉田十郎",
+                "松本一郎", "井上二郎", "木村三郎", "林四郎", "清水五郎",
+                "山本六郎", "中村七郎", "石田八郎", "前田九郎", "藤田十郎"]
+
+AVAILABILITY_PATTERNS = ["uniform", "weekend-heavy", "evening-only", "mixed"]
+
+def generate_mentor_ids(num_mentors):
+    """
+    Generate mentor IDs for any number of mentors.
+    
+    The first 20 mentors use the names list as is; further mentors reuse the
+    names with a numeric suffix (e.g. "田中太郎2").
+    """
+    return [MENTOR_NAMES[i % len(MENTOR_NAMES)] + (str(i // len(MENTOR_NAMES) + 1) if i >= len(MENTOR_NAMES) else "")
+            for i in range(num_mentors)]
+
+def slot_pattern_weights(time_slots, pattern):
+    """
+    Return relative availability weights of each time slot for a pattern.
+    
+    Weights are scaled to a mean of 1 so that the overall availability rate is preserved.
+    
+    Args:
+        time_slots: List of hourly time slots ("2024/04/23 07:00 PM" format)
+        pattern: "uniform", "weekend-heavy" or "evening-only"
+    """
+    weights = np.ones(len(time_slots))
+    if pattern == "uniform":
+        return weights
+    
+    for i, slot in enumerate(time_slots):
+        slot_datetime = datetime.strptime(slot, "%Y/%m/%d %I:%M %p")
+        if pattern == "weekend-heavy":
+            is_day_off = slot_datetime.weekday() >= 5 or (slot_datetime.month, slot_datetime.day) in JAPANESE_HOLIDAYS
+            weights[i] = 1.0 if is_day_off else 0.25
+        elif pattern == "evening-only":
+            weights[i] = 1.0 if slot_datetime.hour >= 18 else 0.0
+        else:
+            raise ValueError(f"Unknown availability pattern '{pattern}'")
+    
+    return weights * len(weights) / weights.sum()
+
+def generate_availability_data(num_entities, time_slots, availability_rate=0.3, rng=None, pattern="uniform"):
     """
     Generate random availability data.
     
+    All entities are drawn from a single random matrix. With the "uniform" pattern
+    every slot is available independently with availability_rate; the other patterns
+    weight slots (weekends and holidays, or evenings) and give each entity its own
+    propensity, so that availability is correlated the way real answers are.
+    
     Args:
         num_entities: Number of entities (proposers or mentors)
         time_slots: List of time slots
         availability_rate: Probability of being available for a given time slot
+        rng: numpy Generator (a fresh unseeded one if None)
+        pattern: One of AVAILABILITY_PATTERNS ("mixed" assigns a random pattern per entity)
     
     Returns:
         DataFrame with availability data
     """
+    if rng is None:
+        rng = np.random.default_rng()
+    
     # Create entity IDs
     if num_entities <= 26:
         # Use letters for small numbers
@@ -105,18 +122,26 @@ def generate_availability_data(num_entities, time_slots, availability_rate=0.3):
         # Use numbers for larger sets
         entity_ids = [f"ID{i+1:03d}" for i in range(num_entities)]
     
-    # Generate random availability (True/False)
-    data = {}
-    for entity_id in entity_ids:
-        # Each entity has random availability
-        data[entity_id] = np.random.random(len(time_slots)) < availability_rate
+    if pattern == "uniform":
+        probabilities = np.full((len(time_slots), 1), availability_rate)
+    else:
+        if pattern == "mixed":
+            basis = np.column_stack([slot_pattern_weights(time_slots, p) for p in AVAILABILITY_PATTERNS[:3]])
+            slot_weights = basis[:, rng.integers(0, basis.shape[1], num_entities)]
+        else:
+            slot_weights = slot_pattern_weights(time_slots, pattern)[:, np.newaxis]
+        
+        # Per-entity propensity with mean availability_rate (some people are simply busier)
+        concentration = 4.0
+        propensity = rng.beta(availability_rate * concentration, (1 - availability_rate) * concentration, num_entities)
+        probabilities = np.clip(slot_weights * propensity[np.newaxis, :], 0.0, 1.0)
     
-    # Create DataFrame
-    df = pd.DataFrame(data, index=time_slots)
+    # Generate random availability (True/False) for all entities at once
+    data = rng.random((len(time_slots), num_entities)) < probabilities
     
-    return df
+    return pd.DataFrame(data, index=time_slots, columns=entity_ids)
 
-def generate_preference_data(mentor_ids, project_ids, preference_rate=0.2):
+def generate_preference_data(mentor_ids, project_ids, preference_rate=0.2, rng=None):
     """
     Generate random mentor preferences for projects.
     
@@ -124,71 +149,101 @@ def generate_preference_data(mentor_ids, project_ids, preference_rate=0.2):
         mentor_ids: List of mentor IDs
         project_ids: List of project IDs
         preference_rate: Probability of a mentor being interested in a project
+        rng: numpy Generator (a fresh unseeded one if None)
     
     Returns:
         DataFrame with preference data
     """
-    # Initialize empty DataFrame
-    df = pd.DataFrame(index=mentor_ids)
+    if rng is None:
+        rng = np.random.default_rng()
     
-    # For each mentor, generate random preferences
-    for i, mentor in enumerate(mentor_ids):
-        preferences = []
-        
-        # Determine how many projects this mentor is interested in
-        num_preferences = max(1, int(len(project_ids) * preference_rate))
-        
-        # Randomly select projects
-        selected_projects = random.sample(project_ids, num_preferences)
-        
-        # Add to DataFrame
-        for j, project in enumerate(selected_projects):
-            df.loc[mentor, f"Project{j+1}"] = project
+    # Determine how many projects each mentor is interested in
+    num_preferences = max(1, int(len(project_ids) * preference_rate))
     
-    return df
+    # Randomly select projects for every mentor at once: sorting a row of random
+    # keys gives a random permutation, and its first columns a sample without replacement
+    selected = np.argsort(rng.random((len(mentor_ids), len(project_ids))), axis=1)[:, :num_preferences]
+    
+    return pd.DataFrame(np.asarray(project_ids, dtype=object)[selected], index=mentor_ids,
+                        columns=[f"Project{j+1}" for j in range(num_preferences)])
 
-def main():
-    parser = argparse.ArgumentParser(description='Generate test data for interview scheduler.')
-    parser.add_argument('--num-proposers', type=int, default=100, help='Number of project proposers')
-    parser.add_argument('--num-mentors', type=int, default=20, help='Number of mentors')
-    parser.add_argument('--output-dir', default='test_data', help='Directory to save test data files')
+def generate_cohort(num_proposers, num_mentors, seed=0, proposer_pattern="uniform", mentor_pattern="uniform"):
+    """
+    Generate the availability and preferences of a whole cohort.
     
-    args = parser.parse_args()
+    Args:
+        num_proposers: Number of project proposers
+        num_mentors: Number of mentors
+        seed: Random seed (the same seed always produces the same cohort)
+        proposer_pattern: Availability pattern of proposers
+        mentor_pattern: Availability pattern of mentors
     
-    # Create output directory if it doesn't exist
-    os.makedirs(args.output_dir, exist_ok=True)
+    Returns:
+        Tuple of (proposer availability DataFrame, mentor availability DataFrame,
+        preference DataFrame with one row per mentor)
+    """
+    rng = np.random.default_rng(seed)
     
     # Generate time slots
     time_slots = generate_time_slots()
     
     # Generate project proposer IDs
-    project_ids = [f"P{i+1:03d}" for i in range(args.num_proposers)]
+    project_ids = [f"P{i+1:03d}" for i in range(num_proposers)]
     
     # Generate mentor IDs
-    mentor_ids = ["田中太郎", "佐藤次郎", "山田三郎", "鈴木四郎", "高橋五郎", 
-                 "伊藤六郎", "渡辺七郎", "小林八郎", "加藤九郎", "吉田十郎",
-                 "松本一郎", "井上二郎", "木村三郎", "林四郎", "清水五郎",
-                 "山本六郎", "中村七郎", "石田八郎", "前田九郎", "藤田十郎"][:args.num_mentors]
+    mentor_ids = generate_mentor_ids(num_mentors)
     
     # Generate availability data
-    proposer_availability = generate_availability_data(args.num_proposers, time_slots, 0.3)
+    proposer_availability = generate_availability_data(num_proposers, time_slots, 0.3, rng, proposer_pattern)
     proposer_availability.columns = project_ids
     
-    mentor_availability = generate_availability_data(args.num_mentors, time_slots, 0.4)
+    mentor_availability = generate_availability_data(num_mentors, time_slots, 0.4, rng, mentor_pattern)
     mentor_availability.columns = mentor_ids
     
     # Generate preference data
-    mentor_preferences = generate_preference_data(mentor_ids, project_ids, 0.15)
+    mentor_preferences = generate_preference_data(mentor_ids, project_ids, 0.15, rng)
+    
+    return proposer_availability, mentor_availability, mentor_preferences
+
+def write_matrix_csv(df, file_path):
+    """
+    Write a wide DataFrame of short values to CSV in one pass.
+    
+    Equivalent to df.to_csv(file_path) for values without commas or quotes,
+    but much faster for the very wide matrices of large cohorts.
+    """
+    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(','.join([''] + [str(c) for c in df.columns]) + '\n')
+        for label, row in zip(df.index, df.to_numpy()):
+            f.write(f"{label},{','.join(map(str, row))}\n")
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate test data for interview scheduler.')
+    parser.add_argument('--num-proposers', type=int, default=100, help='Number of project proposers')
+    parser.add_argument('--num-mentors', type=int, default=20, help='Number of mentors')
+    parser.add_argument('--output-dir', default='test_data', help='Directory to save test data files')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (the same seed always produces the same data)')
+    parser.add_argument('--proposer-pattern', default='uniform', choices=AVAILABILITY_PATTERNS, help='Availability pattern of proposers')
+    parser.add_argument('--mentor-pattern', default='uniform', choices=AVAILABILITY_PATTERNS, help='Availability pattern of mentors')
+    
+    args = parser.parse_args()
+    
+    # Create output directory if it doesn't exist
+    os.makedirs(args.output_dir, exist_ok=True)
+    
+    proposer_availability, mentor_availability, mentor_preferences = generate_cohort(
+        args.num_proposers, args.num_mentors, args.seed, args.proposer_pattern, args.mentor_pattern)
     
     # Save to CSV files
-    proposer_availability.to_csv(os.path.join(args.output_dir, 'proposer_availability.csv'))
-    mentor_availability.to_csv(os.path.join(args.output_dir, 'mentor_availability.csv'))
-    mentor_preferences.to_csv(os.path.join(args.output_dir, 'mentor_preferences.csv'))
+    write_matrix_csv(proposer_availability.astype(int), os.path.join(args.output_dir, 'proposer_availability.csv'))
+    write_matrix_csv(mentor_availability.astype(int), os.path.join(args.output_dir, 'mentor_availability.csv'))
+    write_matrix_csv(mentor_preferences, os.path.join(args.output_dir, 'mentor_preferences.csv'))
     
     print(f"Test data generated and saved to {args.output_dir}/")
     print(f"- {args.num_proposers} proposers")
     print(f"- {args.num_mentors} mentors")
-    print(f"- {len(time_slots)} time slots")
+    print(f"- {len(proposer_availability.index)} time slots")
+    print(f"- seed {args.seed}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import hashlib
+import os
+from datetime import datetime, timezone
+from slot_times import DEFAULT_YEAR, DEFAULT_TIMEZONE, slot_epoch_minutes, epoch_minute_datetime
+from schedule_io import read_schedule_csv
+
+EVENT_TEMPLATE = (
+    "BEGIN:VEVENT\r\n"
+    "{uid}\r\n"
+    "DTSTAMP:{stamp}\r\n"
+    "DTSTART:{start}\r\n"
+    "DTEND:{end}\r\n"
+    "{summary}\r\n"
+    "{description}\r\n"
+    "END:VEVENT\r\n"
+)
+
+def _escape(text):
+    """Escape a TEXT value (RFC 5545 section 3.3.11)."""
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+def _fold(line):
+    """Fold a content line at 75 octets without splitting UTF-8 characters."""
+    if len(line.encode('utf-8')) <= 75:
+        return line
+
+    parts = []
+    current = ''
+    current_size = 0
+    limit = 75
+    for char in line:
+        size = len(char.encode('utf-8'))
+        if current_size + size > limit:
+            parts.append(current)
+            current = ''
+            current_size = 0
+            limit = 74  # continuation lines start with a space
+        current += char
+        current_size += size
+    parts.append(current)
+
+    return '\r\n '.join(parts)
+
+def _utc(minute):
+    """Format a UTC epoch minute as an iCalendar UTC timestamp."""
+    return epoch_minute_datetime(minute).strftime('%Y%m%dT%H%M%SZ')
+
+def render_event(time_slot, project, mentors, year=DEFAULT_YEAR, stamp=None, tz=DEFAULT_TIMEZONE):
+    """
+    Render one booking as a VEVENT, or None if the slot label has no time.
+
+    Args:
+        time_slot: Time slot label of the booking
+        project: Project ID
+        mentors: List of mentors interviewing the project
+        year: Year of form windows
+        stamp: DTSTAMP value (defaults to now)
+        tz: IANA time zone of the slot label
+    """
+    start, end = slot_epoch_minutes(time_slot, year, tz)
+    if start is None:
+        return None
+
+    uid = hashlib.sha1(f"{project}|{time_slot}".encode('utf-8')).hexdigest()
+    return EVENT_TEMPLATE.format(
+        uid=f"UID:{uid}@mitoujr-scheduler",
+        stamp=stamp or datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ'),
+        start=_utc(start),
+        end=_utc(end),
+        summary=_fold("SUMMARY:" + _escape(f"二次選考面接 {project} ({', '.join(mentors)})")),
+        description=_fold("DESCRIPTION:" + _escape(f"Project: {project}\nMentors: {', '.join(mentors)}\nTime Slot: {time_slot}")),
+    )
+
+def _calendar_header(name):
+    return ("BEGIN:VCALENDAR\r\n"
+            "VERSION:2.0\r\n"
+            "PRODID:-//mitoujr-scheduler//Interview Schedule//JA\r\n"
+            "CALSCALE:GREGORIAN\r\n"
+            + _fold("X-WR-CALNAME:" + _escape(name)) + "\r\n")
+
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+def export_ics(bookings, output_dir, year=DEFAULT_YEAR, tz=DEFAULT_TIMEZONE):
+    """
+    Write iCalendar files for a schedule in a single pass over the bookings.
+
+    Creates all_interviews.ics (combined feed), mentor_{mentor}.ics and
+    proposer_{project}.ics. Each event is rendered once; the combined feed is
+    streamed to disk while the per-person files collect references to the
+    rendered text.
+
+    Args:
+        bookings: Iterable of (time_slot, project, mentors) in slot order
+        output_dir: Directory to save the .ics files
+        year: Year of form windows
+        tz: IANA time zone of the slot labels
+
+    Returns:
+        Number of events written
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    mentor_events = {}
+    proposer_events = {}
+    num_events = 0
+
+    with open(os.path.join(output_dir, 'all_interviews.ics'), 'w', encoding='utf-8', newline='') as combined:
+        combined.write(_calendar_header("二次選考面接"))
+
+        for time_slot, project, mentors in bookings:
+            event = render_event(time_slot, project, mentors, year, stamp, tz)
+            if event is None:
+                continue
+
+            combined.write(event)
+            proposer_events.setdefault(project, []).append(event)
+            for mentor in mentors:
+                mentor_events.setdefault(mentor, []).append(event)
+            num_events += 1
+
+        combined.write(CALENDAR_FOOTER)
+
+    for prefix, events_by_entity in (('mentor', mentor_events), ('proposer', proposer_events)):
+        for entity, events in events_by_entity.items():
+            with open(os.path.join(output_dir, f'{prefix}_{entity}.ics'), 'w', encoding='utf-8', newline='') as f:
+                f.write(_calendar_header(f"二次選考面接 {entity}"))
+                f.writelines(events)
+                f.write(CALENDAR_FOOTER)
+
+    return num_events
+
+def main():
+    parser = argparse.ArgumentParser(description='Export an interview schedule to iCalendar files.')
+    parser.add_argument('--schedule-file', required=True, help='complete_schedule.csv produced by the scheduler')
+    parser.add_argument('--output-dir', default='calendars', help='Directory to save the .ics files')
+    parser.add_argument('--year', type=int, default=DEFAULT_YEAR, help='Year of the form windows (e.g. "4/23 夜")')
+    parser.add_argument('--timezone', default=DEFAULT_TIMEZONE, help='IANA time zone of the slot labels')
+
+    args = parser.parse_args()
+
+    num_events = export_ics(read_schedule_csv(args.schedule_file), args.output_dir, args.year, args.timezone)
+
+    print(f"Calendar files created in {args.output_dir}/ ({num_events} events)")
+
+if __name__ == "__main__":
+    main()
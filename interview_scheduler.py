@@ -3,13 +3,53 @@
 
 import pandas as pd
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, deque
 import argparse
+import contextlib
+import itertools
 import os
 import re
-from datetime import datetime, timedelta
+import sys
+import json
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from joint_clustering import min_slot_cover, assign_cover, iter_bits
+from components import find_components, pack_components
+from feasibility import analyze_feasibility
+from profiling import PhaseProfiler
+from solvers import GreedySolver, SOLVERS, get_solver
+from ics_export import export_ics
+from xlsx_export import export_workbook
+from validate_schedule import validate_schedule, summarize_violations, write_report
+from schedule_diff import index_bookings, diff_schedules, count_changes, write_changes
+from schedule_io import (Booking, SCHEDULE_COLUMNS, BACKUP_COLUMNS, read_schedule_csv, load_preferences_csv,
+                         load_timezones_csv, write_csv_rows, write_schedule_csv)
+from slot_times import (DEFAULT_YEAR, DEFAULT_TIMEZONE, WINDOW_PATTERN, INTERVAL_SLOT_PATTERN, slot_epoch_minutes,
+                        epoch_minute_datetime, format_local_slot, format_interval_slot, pack_intervals, covered_slots,
+                        split_into_hourly_slots)
+from schedule_store import ScheduleStore, MENTOR, PROPOSER
+
+def _column_bitsets(df):
+    """Convert each boolean column of a DataFrame into an int bitset (bit i = row i)."""
+    packed = np.packbits(df.to_numpy(dtype=bool), axis=0, bitorder='little').T
+    return {column: int.from_bytes(packed[j].tobytes(), 'little') for j, column in enumerate(df.columns)}
+
+def _bitsets_frame(time_slots, bitsets):
+    """Convert {column: int bitset} into a boolean DataFrame with time slots as rows (inverse of _column_bitsets)."""
+    num_bytes = (len(time_slots) + 7) // 8
+    columns = {
+        name: np.unpackbits(np.frombuffer(bits.to_bytes(num_bytes, 'little'), dtype=np.uint8),
+                            bitorder='little')[:len(time_slots)].astype(bool)
+        for name, bits in bitsets.items()
+    }
+    return pd.DataFrame(columns, index=time_slots, dtype=bool)
 
 class InterviewScheduler:
+    # Minimum number of seconds between two progress events
+    PROGRESS_INTERVAL = 0.5
+    
     def __init__(self, proposer_file, mentor_file, preference_file):
         """
         Initialize the scheduler with the input CSV files.
@@ -24,18 +64,436 @@ class InterviewScheduler:
         self.preference_file = preference_file
         
         # Load data
-        self.proposer_availability = self._load_availability(proposer_file)
-        self.mentor_availability = self._load_availability(mentor_file)
-        self.mentor_preferences = self._load_preferences(preference_file)
+        self._init_data(self._load_availability(proposer_file),
+                        self._load_availability(mentor_file),
+                        self._load_preferences(preference_file))
+    
+    @classmethod
+    def from_store(cls, store):
+        """
+        Create a scheduler from a SQLite cohort store instead of CSV files.
+        
+        Args:
+            store: ScheduleStore, or the path of its database file
+        """
+        if not isinstance(store, ScheduleStore):
+            with ScheduleStore(store) as opened:
+                return cls.from_store(opened)
+        
+        time_slots, proposer_bits = store.read_availability(PROPOSER)
+        _, mentor_bits = store.read_availability(MENTOR)
+        scheduler = cls.from_data(_bitsets_frame(time_slots, proposer_bits),
+                                  _bitsets_frame(time_slots, mentor_bits),
+                                  store.read_preferences())
+        scheduler.proposer_file = scheduler.mentor_file = scheduler.preference_file = store.path
+        return scheduler
+    
+    @classmethod
+    def from_data(cls, proposer_availability, mentor_availability, mentor_preferences):
+        """
+        Create a scheduler from data already in memory (e.g. generated cohorts).
+        
+        Args:
+            proposer_availability: DataFrame with time slots as rows and projects as columns
+            mentor_availability: DataFrame with time slots as rows and mentors as columns
+            mentor_preferences: {mentor: [projects]}
+        """
+        scheduler = object.__new__(cls)
+        scheduler.proposer_file = scheduler.mentor_file = scheduler.preference_file = None
+        scheduler._init_data(proposer_availability, mentor_availability, mentor_preferences)
+        return scheduler
+    
+    def _init_data(self, proposer_availability, mentor_availability, mentor_preferences):
+        """Set up the scheduler from loaded availability DataFrames and preferences."""
+        self.proposer_availability = proposer_availability
+        self.mentor_availability = mentor_availability
+        self.mentor_preferences = mentor_preferences
         
         # Extract unique projects and mentors
         self.projects = self.proposer_availability.columns.tolist()
         self.mentors = self.mentor_availability.columns.tolist()
         self.time_slots = self.proposer_availability.index.tolist()
         
+        # Optional cap on the number of mentors interviewing each project
+        self.max_mentors_per_project = None
+        
+        # Optional interview length and buffer packed into the windows (see set_interview_length)
+        self.interview_minutes = None
+        self.buffer_minutes = 0
+        
+        # Optional per-mentor load limits (see set_load_limits)
+        self.balance_load = False
+        self.max_interviews_per_day = None
+        self.max_consecutive = None
+        self.min_break_slots = 1
+        
+        # Optional previous schedule to stay close to (see set_baseline)
+        self.baseline = None
+        
+        # Interviews of earlier selection rounds that keep their mentors and proposers busy,
+        # optional {project: bitset of slots allowed} and the (name, scheduler) of each round (see schedule_round)
+        self.occupied = {}
+        self.slot_masks = None
+        self.rounds = []
+        
+        # Ranked backup slot indices per booked interview and waitlist index (see reserve_backups)
+        self.backups = None
+        self.waitlist = None
+        
+        # Optional profiling.PhaseProfiler the solver passes are measured with (see --profile)
+        self.profiler = None
+        
+        # Requested interviews left out before solving: {(mentor, project): reason} (see analyze_feasibility)
+        self.pruned_pairs = {}
+        
+        # Year of form windows and time zones of the slot labels (see set_timezones)
+        self.year = DEFAULT_YEAR
+        self.timezone = DEFAULT_TIMEZONE
+        self.entity_timezones = {}
+        
         # Store the final schedule
         self.schedule = {}
         
+    def __getstate__(self):
+        # Profilers stay in the process that created them (forks sent to worker processes run unprofiled)
+        state = self.__dict__.copy()
+        state['profiler'] = None
+        return state
+    
+    def _profile(self, phase):
+        """Return a context measuring a block as a profiler phase (does nothing without a profiler)."""
+        return self.profiler.phase(phase) if self.profiler is not None else contextlib.nullcontext()
+    
+    def set_baseline(self, bookings):
+        """
+        Make the solvers keep interviews of a previous schedule where they are still valid.
+        
+        The greedy and lazy solvers book every still-valid baseline interview in its
+        old slot before scheduling the rest; the cpsat solver penalizes each moved
+        interview more than any session or mentor-day saving.
+        
+        Args:
+            bookings: Iterable of (time_slot, project, mentors), e.g. read_schedule_csv(path)
+        """
+        self.baseline = index_bookings(bookings)
+    
+    def set_schedule(self, bookings):
+        """
+        Replace the schedule with a published one, e.g. to handle cancellations without solving again.
+        
+        Args:
+            bookings: Iterable of (time_slot, project, mentors), e.g. read_schedule_csv(path)
+        """
+        self.schedule = {}
+        for time_slot, project, mentors in bookings:
+            self.schedule[(project, time_slot)] = self.schedule.get((project, time_slot), ()) + tuple(mentors)
+        self.backups = self.waitlist = None
+    
+    def set_timezones(self, timezone=DEFAULT_TIMEZONE, entity_timezones=None, year=DEFAULT_YEAR):
+        """
+        Set the time zones the slot labels are written in.
+        
+        Slots are normalized to UTC epoch minutes. The availability of a mentor or
+        proposer with their own time zone is read in that zone and moved onto the
+        cohort's slots: a slot is available if it lies completely inside the
+        person's available time.
+        
+        Args:
+            timezone: IANA time zone of the slot labels (e.g. "Asia/Tokyo")
+            entity_timezones: Optional {mentor or project: IANA time zone} for people
+                who answered in their own local time
+            year: Year of form windows, which only carry month and day
+        """
+        if self.interview_minutes is not None:
+            raise ValueError("Set the time zones before the interview length")
+        if not hasattr(self, '_local_availability'):
+            self._local_availability = (self.proposer_availability, self.mentor_availability)
+        
+        self.timezone = timezone
+        self.year = year
+        self.entity_timezones = dict(entity_timezones or {})
+        self._slot_days_for = None
+        
+        shifted = []
+        for df in self._local_availability:
+            moved = [entity for entity in df.columns if self.entity_timezones.get(entity, timezone) != timezone]
+            if moved:
+                df = df.copy()
+                slot_minutes = [slot_epoch_minutes(slot, year, timezone) for slot in df.index]
+                for entity in moved:
+                    available = [slot_epoch_minutes(slot, year, self.entity_timezones[entity]) for slot in df.index[df[entity]]]
+                    column = np.zeros(len(df), dtype=bool)
+                    column[covered_slots(slot_minutes, [interval for interval in available if interval[0] is not None])] = True
+                    df[entity] = column
+            shifted.append(df)
+        
+        self.proposer_availability, self.mentor_availability = shifted
+    
+    def set_interview_length(self, minutes, buffer_minutes=0):
+        """
+        Pack back-to-back interviews of a fixed length into the availability windows.
+        
+        The slots are replaced by interview slots with exact start and end times
+        (see slot_times.pack_intervals): overlapping and adjacent windows are merged
+        with a sweep line, and each stretch holds as many interviews of the given
+        length, separated by the buffer, as fit. A mentor or proposer is available
+        in an interview slot that lies completely inside their available windows,
+        so a 2-hour evening holds three 30-minute interviews with 10-minute buffers
+        instead of one. Call this after set_timezones.
+        
+        Args:
+            minutes: Interview length in minutes
+            buffer_minutes: Minutes between two interviews of a mentor; interviews
+                separated only by the buffer count as back-to-back
+        
+        Returns:
+            Number of interview slots
+        """
+        if self.interview_minutes is not None:
+            raise ValueError("The interview length is already set")
+        
+        window_minutes = [slot_epoch_minutes(slot, self.year, self.timezone) for slot in self.time_slots]
+        packed = pack_intervals(window_minutes, minutes, buffer_minutes)
+        labels = [format_interval_slot(start, end, self.timezone) for start, end in packed]
+        
+        def repack(df):
+            df = df.reindex(self.time_slots, fill_value=False)
+            columns = {}
+            for entity in df.columns:
+                available = [window_minutes[i] for i in np.flatnonzero(df[entity].to_numpy(dtype=bool))
+                             if window_minutes[i][0] is not None]
+                column = np.zeros(len(packed), dtype=bool)
+                column[covered_slots(packed, available)] = True
+                columns[entity] = column
+            return pd.DataFrame(columns, index=labels, columns=df.columns)
+        
+        self.proposer_availability = repack(self.proposer_availability)
+        self.mentor_availability = repack(self.mentor_availability)
+        self.time_slots = labels
+        self.interview_minutes = minutes
+        self.buffer_minutes = buffer_minutes
+        return len(labels)
+    
+    def set_load_limits(self, max_per_day=None, max_consecutive=None, min_break_slots=1, balance=True):
+        """
+        Enable fairness-aware load balancing across mentors.
+        
+        Args:
+            max_per_day: Maximum number of interviews per mentor per day
+            max_consecutive: Maximum number of back-to-back interviews per mentor
+            min_break_slots: Free slots required between two runs of interviews; runs
+                separated by a shorter gap count as one run for max_consecutive
+            balance: If True, each mentor's interviews are spread evenly over their
+                available days instead of filling the earliest days first
+        """
+        self.max_interviews_per_day = max_per_day
+        self.max_consecutive = max_consecutive
+        self.min_break_slots = min_break_slots
+        self.balance_load = balance
+    
+    def fork(self):
+        """
+        Create a copy-on-write view of this scheduler with an empty schedule.
+        
+        The loaded availability DataFrames and preference lists are shared with the
+        original; scenario deltas replace them with new objects instead of
+        modifying them in place, so forking costs no copying.
+        """
+        forked = object.__new__(InterviewScheduler)
+        forked.__dict__.update(self.__dict__)
+        forked.schedule = {}
+        forked.backups = forked.waitlist = None
+        forked.rounds = []
+        return forked
+    
+    def apply_scenario(self, scenario):
+        """
+        Return a forked scheduler with the deltas of a what-if scenario applied.
+        
+        Args:
+            scenario: Dictionary of deltas, any of:
+                drop_mentors: List of mentors who drop out
+                drop_projects: List of projects that are withdrawn
+                drop_slots: List of time slots that are no longer available
+                add_slots: List of new time slots everyone is available in, or a dictionary
+                    {slot: {"mentors": [...] or "all", "proposers": [...] or "all"}}
+                    Form windows such as "5/7 夜 (19:00 - 21:00)" in drop_slots and
+                    add_slots are split into hourly slots when the cohort's slots are hourly
+                max_mentors_per_project: Maximum number of mentors interviewing each project
+                max_interviews_per_day, max_consecutive, min_break_slots, balance_load:
+                    Mentor load limits (see set_load_limits)
+        """
+        forked = self.fork()
+        
+        drop_mentors = set(scenario.get('drop_mentors', []))
+        if drop_mentors:
+            forked.mentor_availability = forked.mentor_availability.drop(
+                columns=[m for m in drop_mentors if m in forked.mentor_availability.columns])
+            forked.mentor_preferences = {mentor: projects for mentor, projects in forked.mentor_preferences.items()
+                                         if mentor not in drop_mentors}
+        
+        drop_projects = set(scenario.get('drop_projects', []))
+        if drop_projects:
+            forked.proposer_availability = forked.proposer_availability.drop(
+                columns=[p for p in drop_projects if p in forked.proposer_availability.columns])
+            forked.mentor_preferences = {mentor: [p for p in projects if p not in drop_projects]
+                                         for mentor, projects in forked.mentor_preferences.items()}
+        
+        drop_slots = set(slot for window in scenario.get('drop_slots', []) for slot in self._scenario_slots(window))
+        if drop_slots:
+            forked.proposer_availability = forked.proposer_availability.drop(
+                index=[s for s in drop_slots if s in forked.proposer_availability.index])
+            forked.mentor_availability = forked.mentor_availability.drop(
+                index=[s for s in drop_slots if s in forked.mentor_availability.index])
+        
+        add_slots = scenario.get('add_slots', [])
+        if add_slots:
+            if not isinstance(add_slots, dict):
+                add_slots = {slot: {} for slot in add_slots}
+            add_slots = {slot: who for window, who in add_slots.items() for slot in self._scenario_slots(window)}
+            
+            def new_rows(df, available):
+                # Hourly slots of a window that already exist are opened up in place
+                rows = pd.DataFrame(False, index=[slot for slot in add_slots if slot not in df.index], columns=df.columns)
+                df = df.copy() if len(rows) < len(add_slots) else df
+                for slot, who in add_slots.items():
+                    target = df if slot in df.index else rows
+                    entities = who.get(available, 'all')
+                    if entities == 'all':
+                        target.loc[slot, :] = True
+                    else:
+                        target.loc[slot, [e for e in entities if e in df.columns]] = True
+                if not len(rows):
+                    return df
+                # New slots go in chronological order, slots without a time last
+                df = pd.concat([df, rows])
+                starts = [slot_epoch_minutes(slot, self.year, self.timezone)[0] for slot in df.index]
+                return df.iloc[sorted(range(len(starts)), key=lambda i: (starts[i] is None, starts[i] or 0))]
+            
+            forked.proposer_availability = new_rows(forked.proposer_availability, 'proposers')
+            forked.mentor_availability = new_rows(forked.mentor_availability, 'mentors')
+        
+        for option in ('max_mentors_per_project', 'max_interviews_per_day', 'max_consecutive',
+                       'min_break_slots', 'balance_load'):
+            if option in scenario:
+                setattr(forked, option, scenario[option])
+        
+        forked.projects = forked.proposer_availability.columns.tolist()
+        forked.mentors = forked.mentor_availability.columns.tolist()
+        forked.time_slots = forked.proposer_availability.index.tolist()
+        
+        return forked
+    
+    def summarize(self):
+        """Return coverage and mentor workload figures for the current schedule."""
+        requested = sum(len(projects) for projects in self.mentor_preferences.values())
+        scheduled = sum(len(mentors) for mentors in self.schedule.values())
+        
+        self._ensure_slot_days()
+        mentor_days = set()
+        mentor_hours = 0.0
+        for (project, slot), mentors in self.schedule.items():
+            start, end = self.slot_minutes[self.slot_index[slot]]
+            hours = (end - start) / 60.0 if start is not None else 1.0
+            for mentor in mentors:
+                mentor_hours += hours
+                mentor_days.add((mentor, self.slot_day[self.slot_index[slot]]))
+        
+        return {
+            'Requested Interviews': requested,
+            'Scheduled Interviews': scheduled,
+            'Coverage (%)': round(100.0 * scheduled / requested, 1) if requested else 100.0,
+            'Sessions': len(self.schedule),
+            'Mentor Hours': mentor_hours,
+            'Mentor Days': len(mentor_days),
+            'Per-Day Load CV': self.load_balance()['Per-Day Load CV'],
+        }
+    
+    def get_mentor_load(self):
+        """
+        Return the interview load of each mentor.
+        
+        Returns:
+            DataFrame with interviews, active days, maximum interviews per day and
+            longest run of back-to-back interviews per mentor
+        """
+        self._ensure_slot_days()
+        booked = defaultdict(list)
+        for (project, slot), mentors in self.schedule.items():
+            for mentor in mentors:
+                booked[mentor].append(self.slot_index[slot])
+        
+        rows = []
+        for mentor in self.mentors:
+            slot_indices = sorted(booked.get(mentor, []))
+            per_day = defaultdict(int)
+            longest_run = run = 0
+            for k, slot_idx in enumerate(slot_indices):
+                per_day[self.slot_day[slot_idx]] += 1
+                run = run + 1 if k and slot_indices[k - 1] == slot_idx - 1 and self._slot_follows[slot_idx] else 1
+                longest_run = max(longest_run, run)
+            rows.append({
+                'Mentor': mentor,
+                'Interviews': len(slot_indices),
+                'Days': len(per_day),
+                'Max Per Day': max(per_day.values(), default=0),
+                'Longest Run': longest_run,
+            })
+        
+        return pd.DataFrame(rows, columns=['Mentor', 'Interviews', 'Days', 'Max Per Day', 'Longest Run'])
+    
+    def load_balance(self):
+        """
+        Return how evenly interviews are spread over the mentors' working days.
+        
+        The per-day load CV is the coefficient of variation (std / mean) of the
+        number of interviews per mentor per active day; 0 means perfectly even.
+        """
+        self._ensure_slot_days()
+        per_day = defaultdict(int)
+        for (project, slot), mentors in self.schedule.items():
+            for mentor in mentors:
+                per_day[(mentor, self.slot_day[self.slot_index[slot]])] += 1
+        
+        counts = np.array(list(per_day.values()), dtype=float)
+        if not len(counts):
+            return {'Max Per Day': 0, 'Mean Per Day': 0.0, 'Per-Day Load CV': 0.0}
+        
+        return {
+            'Max Per Day': int(counts.max()),
+            'Mean Per Day': round(float(counts.mean()), 2),
+            'Per-Day Load CV': round(float(counts.std() / counts.mean()), 3),
+        }
+    
+    def run_scenarios(self, scenarios, max_workers=None, solver=None):
+        """
+        Solve several what-if scenarios from the already loaded data.
+        
+        Args:
+            scenarios: List of scenario dictionaries (see apply_scenario), each with an optional 'name'
+            max_workers: Number of worker processes (1 solves the scenarios in this process)
+            solver: Scheduling backend used for every scenario (defaults to greedy)
+        
+        Returns:
+            DataFrame comparing coverage and mentor hours, with the unmodified baseline first
+        """
+        variants = [('baseline', self.fork())]
+        for i, scenario in enumerate(scenarios):
+            variants.append((scenario.get('name', f'scenario {i + 1}'), self.apply_scenario(scenario)))
+        
+        if max_workers == 1:
+            summaries = [_solve_scenario(variant, solver) for _, variant in variants]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                summaries = list(executor.map(_solve_scenario, [variant for _, variant in variants],
+                                              [solver] * len(variants)))
+        
+        rows = []
+        for (name, _), summary in zip(variants, summaries):
+            rows.append({'Scenario': name, **summary})
+        
+        return pd.DataFrame(rows)
+        
     def _load_availability(self, file_path):
         """Load and parse availability CSV file."""
         df = pd.read_csv(file_path, index_col=0)
@@ -57,23 +515,173 @@ class InterviewScheduler:
     
     def _get_common_availability(self, project, mentors):
         """Find time slots where both the project proposer and all specified mentors are available."""
-        # Get project proposer's availability
-        proposer_avail = self.proposer_availability[project]
-        
-        # Start with all time slots where the proposer is available
-        common_slots = proposer_avail[proposer_avail].index.tolist()
-        
-        # Filter by each mentor's availability
+        # Intersect the availability bitsets (built by _build_indexes)
+        common = self.proposer_bits.get(project, 0)
         for mentor in mentors:
-            mentor_avail = self.mentor_availability[mentor]
-            # Keep only slots where both are available
-            common_slots = [slot for slot in common_slots if mentor_avail.get(slot, False)]
-            
-            if not common_slots:
+            common &= self.mentor_bits.get(mentor, 0)
+            if not common:
                 # No common slots found
                 break
-                
-        return common_slots
+        
+        return [self.time_slots[slot_idx] for slot_idx in iter_bits(common)]
+    
+    def _ensure_slot_days(self):
+        """
+        Normalize the time slots to UTC epoch minutes once.
+        
+        Sets slot_minutes ((start, end) per slot, None for unknown formats), the
+        local day of each slot and whether it directly follows the previous slot,
+        so that no slot label is parsed again while scheduling.
+        """
+        if getattr(self, '_slot_days_for', None) is self.time_slots:
+            return
+        
+        self.slot_index = {slot: i for i, slot in enumerate(self.time_slots)}
+        self.slot_minutes = [slot_epoch_minutes(slot, self.year, self.timezone) for slot in self.time_slots]
+        # Hourly labels ("2024/04/23 07:00 PM") versus form windows and unknown formats
+        self._slot_hourly = [start is not None and not WINDOW_PATTERN.match(slot) and not INTERVAL_SLOT_PATTERN.match(slot)
+                             for slot, (start, _) in zip(self.time_slots, self.slot_minutes)]
+        
+        day_ids = {}
+        self.slot_day = [
+            day_ids.setdefault(epoch_minute_datetime(start, self.timezone).date() if start is not None else slot, len(day_ids))
+            for slot, (start, _) in zip(self.time_slots, self.slot_minutes)
+        ]
+        # Interviews separated only by the buffer of packed slots are back-to-back
+        self._slot_follows = [
+            i > 0 and self.slot_day[i] == self.slot_day[i - 1] and self.slot_minutes[i][0] is not None
+            and 0 <= self.slot_minutes[i][0] - self.slot_minutes[i - 1][1] <= self.buffer_minutes
+            for i in range(len(self.time_slots))
+        ]
+        self._slot_days_for = self.time_slots
+    
+    def _build_indexes(self):
+        """Build the slot index, availability bitsets and booked-slot bitsets."""
+        self._ensure_slot_days()
+        # The bitsets are reused while the availability DataFrames stay the same (forks, rounds)
+        cached = getattr(self, '_bits_for', None)
+        if (cached is None or cached[0] is not self.proposer_availability
+                or cached[1] is not self.mentor_availability or cached[2] is not self.time_slots):
+            cached = (self.proposer_availability, self.mentor_availability, self.time_slots,
+                      _column_bitsets(self.proposer_availability.reindex(self.time_slots, fill_value=False)),
+                      _column_bitsets(self.mentor_availability.reindex(self.time_slots, fill_value=False)))
+            self._bits_for = cached
+        self.proposer_bits, self.mentor_bits = cached[3], cached[4]
+        
+        # Slots each mentor is already booked in (in this or an earlier round), and interviews per mentor per day
+        self._mentor_booked = defaultdict(int)
+        self._mentor_day_count = defaultdict(int)
+        for bookings in (self.occupied, self.schedule):
+            for (project, slot), mentors in bookings.items():
+                slot_idx = self.slot_index[slot]
+                for mentor in mentors:
+                    self._mentor_booked[mentor] |= 1 << slot_idx
+                    self._mentor_day_count[(mentor, self.slot_day[slot_idx])] += 1
+        
+        # Proposers are busy in their interviews of earlier rounds and limited to their round's slots
+        if self.occupied or self.slot_masks:
+            busy = defaultdict(int)
+            for project, slot in self.occupied:
+                busy[project] |= 1 << self.slot_index[slot]
+            masks = self.slot_masks or {}
+            self.proposer_bits = dict(self.proposer_bits)
+            for project in busy.keys() | masks.keys():
+                if project in self.proposer_bits:
+                    self.proposer_bits[project] &= masks.get(project, -1) & ~busy[project]
+    
+    def _is_mentor_free(self, mentor, slot):
+        """Check that a mentor has no interview in a slot yet."""
+        return not (self._mentor_booked[mentor] >> self.slot_index[slot]) & 1
+    
+    def _book(self, project, slot, mentors):
+        """Book mentors for a project in a slot, joining an existing interview if there is one."""
+        # Mentor tuples are immutable and not over-allocated like lists
+        self.schedule[(project, slot)] = self.schedule.get((project, slot), ()) + tuple(mentors)
+        
+        slot_idx = self.slot_index[slot]
+        day = self.slot_day[slot_idx]
+        for mentor in mentors:
+            self._mentor_booked[mentor] |= 1 << slot_idx
+            self._mentor_day_count[(mentor, day)] += 1
+    
+    def _within_load_limits(self, mentor, slot):
+        """
+        Check that booking a mentor in a slot respects the load limits.
+        
+        The per-day counter is a dictionary lookup, and the run check only walks
+        at most max_consecutive + min_break_slots neighbouring slots.
+        """
+        slot_idx = self.slot_index[slot]
+        
+        if self.max_interviews_per_day is not None:
+            if self._mentor_day_count[(mentor, self.slot_day[slot_idx])] >= self.max_interviews_per_day:
+                return False
+        
+        if self.max_consecutive is not None:
+            booked = self._mentor_booked[mentor]
+            run = 1
+            for step in (-1, 1):
+                i, gap = slot_idx, 0
+                while run <= self.max_consecutive:
+                    # Stop at the end of a day or a gap between windows
+                    if step < 0 and not self._slot_follows[i]:
+                        break
+                    i += step
+                    if i >= len(self.time_slots) or (step > 0 and not self._slot_follows[i]):
+                        break
+                    if (booked >> i) & 1:
+                        run += 1
+                        gap = 0
+                    else:
+                        gap += 1
+                        if gap >= self.min_break_slots:
+                            break
+            if run > self.max_consecutive:
+                return False
+        
+        return True
+    
+    def _cluster_joint_interviews(self, project, mentors):
+        """
+        Group the interested mentors of a project into as few joint interviews as possible.
+        
+        Each slot where the proposer is available becomes a bitset of the mentors
+        free in it, and a minimum set cover of those bitsets picks the slots.
+        Mentors left alone in a slot are not returned; they are scheduled by the
+        later passes, which favour consecutive slots.
+        
+        Returns:
+            List of (slot, [mentors]) joint interviews with at least two mentors
+        """
+        proposer_bits = self.proposer_bits.get(project, 0)
+        free_bits = [self.mentor_bits.get(mentor, 0) & ~self._mentor_booked[mentor] & proposer_bits
+                     for mentor in mentors]
+        
+        any_free = 0
+        for bits in free_bits:
+            any_free |= bits
+        
+        slot_masks = []
+        for slot_idx in iter_bits(any_free):
+            mask = 0
+            for j, bits in enumerate(free_bits):
+                if (bits >> slot_idx) & 1 and self._within_load_limits(mentors[j], self.time_slots[slot_idx]):
+                    mask |= 1 << j
+            if mask:
+                slot_masks.append((slot_idx, mask))
+        
+        if self.balance_load:
+            # Prefer slots on days where the mentors involved have the fewest interviews
+            slot_masks.sort(key=lambda item: (
+                max(self._mentor_day_count[(mentors[j], self.slot_day[item[0]])] for j in iter_bits(item[1])), item[0]))
+        
+        clusters = []
+        for slot_idx, mask in assign_cover(min_slot_cover(slot_masks)):
+            cluster_mentors = [mentors[j] for j in iter_bits(mask)]
+            if len(cluster_mentors) > 1:
+                clusters.append((self.time_slots[slot_idx], cluster_mentors))
+        
+        return clusters
     
     def _get_consecutive_slots(self, available_slots):
         """Group available slots into consecutive blocks."""
@@ -91,40 +699,133 @@ class InterviewScheduler:
             current_slot = current_group[-1]
             next_slot = sorted_slots[i]
             
-            try:
-                current_datetime = datetime.strptime(current_slot, "%Y/%m/%d %I:%M %p")
-                next_datetime = datetime.strptime(next_slot, "%Y/%m/%d %I:%M %p")
-                
-                if next_datetime - current_datetime == timedelta(hours=1):
-                    # Consecutive slot
-                    current_group.append(next_slot)
-                else:
-                    # Start a new group
-                    consecutive_groups.append(current_group)
-                    current_group = [next_slot]
-            except ValueError:
-                current_slot_idx = self.time_slots.index(current_group[-1])
-                next_slot_idx = self.time_slots.index(sorted_slots[i])
-                
-                if next_slot_idx == current_slot_idx + 1:
-                    # Consecutive slot
-                    current_group.append(sorted_slots[i])
-                else:
-                    # Start a new group
-                    consecutive_groups.append(current_group)
-                    current_group = [sorted_slots[i]]
+            current_idx = self.slot_index[current_slot]
+            next_idx = self.slot_index[next_slot]
+            
+            if self._slot_hourly[current_idx] and self._slot_hourly[next_idx]:
+                consecutive = self.slot_minutes[next_idx][0] - self.slot_minutes[current_idx][0] == 60
+            else:
+                consecutive = next_idx == current_idx + 1
+            
+            if consecutive:
+                # Consecutive slot
+                current_group.append(next_slot)
+            else:
+                # Start a new group
+                consecutive_groups.append(current_group)
+                current_group = [next_slot]
                 
         consecutive_groups.append(current_group)
         return consecutive_groups
     
-    def schedule_interviews(self):
+    def _iter_block_placements(self, mentor, remaining_projects, day_limit=None):
         """
-        Schedule interviews based on availability and preferences.
+        Book a mentor's remaining projects slot by slot through their consecutive blocks.
+        
+        This is a generator that yields (project, slot) after each booking.
+        
+        Args:
+            mentor: Mentor to book
+            remaining_projects: Projects still to interview (booked ones are removed)
+            day_limit: Optional soft limit of interviews per day for this round
+        """
+        if not remaining_projects:
+            return
+        
+        # Get all available slots for this mentor
+        mentor_slots = [self.time_slots[slot_idx] for slot_idx in iter_bits(self.mentor_bits.get(mentor, 0))]
+        proposer_bits = self.proposer_bits
+        
+        # Group into consecutive blocks and fill them in order
+        for block in self._get_consecutive_slots(mentor_slots):
+            for slot in block:
+                # Skip if no more projects to schedule
+                if not remaining_projects:
+                    return
+                
+                # Check if this slot is still available (not already scheduled) and within the load limits
+                if not self._is_mentor_free(mentor, slot) or not self._within_load_limits(mentor, slot):
+                    continue
+                if day_limit is not None and self._mentor_day_count[(mentor, self.slot_day[self.slot_index[slot]])] >= day_limit:
+                    continue
+                
+                # Try to schedule the next project in this slot
+                for project in remaining_projects:
+                    # Check if the proposer is available in this slot
+                    if (proposer_bits.get(project, 0) >> self.slot_index[slot]) & 1:
+                        # Schedule this interview (joining an existing interview if any)
+                        self._book(project, slot, [mentor])
+                        
+                        # Mark this project as scheduled
+                        remaining_projects.remove(project)
+                        yield project, slot
+                        break
+    
+    def _book_baseline(self):
+        """
+        Book the baseline interviews that are still requested and feasible in their old slot.
         
-        The algorithm prioritizes:
-        1. Scheduling interviews where multiple mentors want to interview the same project
-        2. Scheduling consecutive interviews for mentors
-        3. Using earlier time slots
+        Returns:
+            Number of baseline interviews booked
+        """
+        if not self.baseline:
+            return 0
+        
+        mentor_to_projects, _ = self._get_interview_requests()
+        requested = {(project, mentor) for mentor, projects in mentor_to_projects.items() for project in projects}
+        
+        kept = 0
+        for (project, mentor), slot in sorted(self.baseline.items(), key=lambda item: self.slot_index.get(item[1], -1)):
+            slot_idx = self.slot_index.get(slot)
+            if (slot_idx is None or (project, mentor) not in requested
+                    or not (self.proposer_bits.get(project, 0) >> slot_idx) & 1
+                    or not (self.mentor_bits.get(mentor, 0) >> slot_idx) & 1):
+                continue
+            if self._is_mentor_free(mentor, slot) and self._within_load_limits(mentor, slot):
+                self._book(project, slot, [mentor])
+                kept += 1
+        
+        return kept
+    
+    def analyze_feasibility(self, prune=False):
+        """
+        Report bottlenecks of the cohort before solving.
+        
+        Compares every mentor's requested interviews with their free slots, counts
+        the requested pairs competing for each slot and day, and finds requested
+        interviews without any common slot (see feasibility.py).
+        
+        Args:
+            prune: If True, leave the requests that can never be scheduled out of
+                the following solves
+        
+        Returns:
+            FeasibilityReport
+        """
+        self._ensure_slot_days()
+        self.pruned_pairs = {}
+        mentor_to_projects, _ = self._get_interview_requests()
+        
+        slot_days = [epoch_minute_datetime(start, self.timezone).strftime('%Y/%m/%d') if start is not None else slot
+                     for slot, (start, _) in zip(self.time_slots, self.slot_minutes)]
+        report = analyze_feasibility(
+            self.proposer_availability.reindex(self.time_slots, fill_value=False).to_numpy(dtype=bool),
+            self.mentor_availability.reindex(self.time_slots, fill_value=False).to_numpy(dtype=bool),
+            self.projects, self.mentors, self.time_slots, mentor_to_projects,
+            slot_days, self.max_interviews_per_day)
+        
+        if prune:
+            self.pruned_pairs = {(pair['Mentor'], pair['Project ID']): pair['Reason'] for pair in report.infeasible_pairs}
+        return report
+    
+    def _get_interview_requests(self):
+        """
+        Build the requested (mentor, project) interviews from the preferences.
+        
+        Returns:
+            Tuple of ({mentor: [projects]}, {project: [mentors]}), with the optional
+            cap on mentors per project applied (in preference file order) and the
+            interviews already in the schedule left out
         """
         # Create a dictionary to track which projects each mentor needs to interview
         mentor_to_projects = defaultdict(list)
@@ -138,245 +839,948 @@ class InterviewScheduler:
             for project in projects:
                 project_to_mentors[project].append(mentor)
         
-        # Sort projects by number of interested mentors (descending)
-        sorted_projects = sorted(project_to_mentors.keys(), 
-                                key=lambda p: len(project_to_mentors[p]), 
-                                reverse=True)
+        # Apply the optional cap on mentors per project (in preference file order)
+        if self.max_mentors_per_project is not None:
+            for project, mentors in project_to_mentors.items():
+                for mentor in mentors[self.max_mentors_per_project:]:
+                    mentor_to_projects[mentor].remove(project)
+                del mentors[self.max_mentors_per_project:]
         
-        # First pass: Try to schedule projects with multiple mentors
-        for project in sorted_projects:
-            mentors = project_to_mentors[project]
-            
-            if len(mentors) > 1:
-                # Try to find slots where all mentors are available
-                common_slots = self._get_common_availability(project, mentors)
-                
-                if common_slots:
-                    # Use the earliest available slot
-                    selected_slot = common_slots[0]
-                    
-                    # Schedule this interview
-                    self.schedule[(project, selected_slot)] = mentors
-                    
-                    # Mark this project as scheduled for these mentors
-                    for mentor in mentors:
-                        if project in mentor_to_projects[mentor]:
-                            mentor_to_projects[mentor].remove(project)
-                else:
-                    # No common slot for all mentors, will handle in second pass
-                    pass
-        
-        # Second pass: Schedule remaining interviews, prioritizing consecutive slots
-        # Sort mentors by number of remaining projects (descending)
-        sorted_mentors = sorted(mentor_to_projects.keys(), 
-                               key=lambda m: len(mentor_to_projects[m]), 
-                               reverse=True)
-        
-        for mentor in sorted_mentors:
-            remaining_projects = mentor_to_projects[mentor]
-            
-            if not remaining_projects:
-                continue
-                
-            # Get all available slots for this mentor
-            mentor_slots = self.mentor_availability[mentor][self.mentor_availability[mentor]].index.tolist()
-            
-            # Group into consecutive blocks
-            consecutive_blocks = self._get_consecutive_slots(mentor_slots)
-            
-            # Try to schedule as many projects as possible in consecutive blocks
-            for block in consecutive_blocks:
-                # Skip if no more projects to schedule
-                if not remaining_projects:
+        # Leave out interviews that can never be scheduled
+        if self.pruned_pairs:
+            for mentor, projects in mentor_to_projects.items():
+                projects[:] = [p for p in projects if (mentor, p) not in self.pruned_pairs]
+            for project, mentors in project_to_mentors.items():
+                mentors[:] = [m for m in mentors if (m, project) not in self.pruned_pairs]
+        
+        # Leave out interviews that are already booked (e.g. kept from a baseline)
+        for (project, slot), mentors in self.schedule.items():
+            for mentor in mentors:
+                if project in mentor_to_projects.get(mentor, ()):
+                    mentor_to_projects[mentor].remove(project)
+                if mentor in project_to_mentors.get(project, ()):
+                    project_to_mentors[project].remove(mentor)
+        
+        return mentor_to_projects, project_to_mentors
+    
+    def schedule_interviews(self, solver=None, progress=None, deadline=None, cancel=None):
+        """
+        Schedule interviews based on availability and preferences.
+        
+        The solvers check regularly whether to stop. When the deadline passes or
+        the cancel event is set, they return early and the interviews booked so
+        far are kept as the (valid, but incomplete) schedule.
+        
+        Args:
+            solver: Scheduling backend (see solvers.py); defaults to the greedy solver
+            progress: Optional callable receiving progress events, dictionaries with
+                phase, done and total (work units of the phase), booked (interviews),
+                elapsed and eta (seconds, None while unknown) and stopped
+            deadline: Optional number of seconds after which the solve stops
+            cancel: Optional threading.Event (or any object with is_set()) that stops the solve
+        
+        Returns:
+            Dictionary of solver statistics, with 'stopped' set to "deadline" or
+            "cancelled" when the solve was stopped early
+        """
+        if solver is None:
+            solver = GreedySolver()
+        
+        # Profile the setup under the solver's name; the passes switch phases in _checkpoint
+        outer_phase = self.profiler.current if self.profiler is not None else None
+        if self.profiler is not None:
+            self.profiler.start(solver.name or 'solve')
+        
+        self._build_indexes()
+        self._start_solve(progress, deadline, cancel)
+        self.solver_stats = solver.solve(self) or {}
+        if self._stop_reason:
+            self.solver_stats['stopped'] = self._stop_reason
+        
+        if self.profiler is not None:
+            # Back to the caller's phase, e.g. cpsat after its greedy warm start
+            if outer_phase is None:
+                self.profiler.stop()
+            else:
+                self.profiler.start(outer_phase)
+        if progress is not None:
+            self._report('done', 1, 1)
+        
+        if self.baseline:
+            counts = count_changes(self.diff_baseline())
+            self.solver_stats.update({'baseline ' + change: count for change, count in counts.items()})
+        
+        return self.solver_stats
+    
+    def subproblem(self, preferences):
+        """
+        Return a forked scheduler restricted to some mentors and their projects.
+        
+        Args:
+            preferences: {mentor: [projects]}, e.g. one component from find_components
+        """
+        forked = self.fork()
+        projects = list(dict.fromkeys(p for ps in preferences.values() for p in ps if p in self.proposer_availability.columns))
+        mentors = [m for m in preferences if m in self.mentor_availability.columns]
+        forked.proposer_availability = self.proposer_availability[projects]
+        forked.mentor_availability = self.mentor_availability[mentors]
+        forked.mentor_preferences = preferences
+        forked.projects = projects
+        forked.mentors = mentors
+        
+        # Indexes and solve state are rebuilt by schedule_interviews
+        for attribute in ('proposer_bits', 'mentor_bits', '_mentor_booked', '_mentor_day_count',
+                          '_progress', '_cancel', '_local_availability', '_bits_for'):
+            forked.__dict__.pop(attribute, None)
+        return forked
+    
+    def round_preferences(self, selection_round):
+        """
+        Return the requested interviews of one selection round.
+        
+        Args:
+            selection_round: Dictionary with any of:
+                preferences: {mentor: [projects]} requested in this round
+                preference_file: Mentor preferences CSV file of this round
+                projects: Shortlist of projects (e.g. those passing the previous round)
+                mentors: Mentors taking part in this round
+                Without preferences or preference_file, the loaded preferences are
+                used; projects and mentors then filter them.
+        
+        Returns:
+            {mentor: [projects]}
+        """
+        if 'preferences' in selection_round:
+            preferences = selection_round['preferences']
+        elif 'preference_file' in selection_round:
+            preferences = load_preferences_csv(selection_round['preference_file'])
+        else:
+            preferences = self.mentor_preferences
+        
+        shortlist = set(selection_round['projects']) if 'projects' in selection_round else None
+        mentors = set(selection_round['mentors']) if 'mentors' in selection_round else None
+        return {mentor: [project for project in projects if shortlist is None or project in shortlist]
+                for mentor, projects in preferences.items() if mentors is None or mentor in mentors}
+    
+    def _slot_window(self, start=None, end=None):
+        """Return the bitset of the slots from start to end (time slot labels, both included)."""
+        self._ensure_slot_days()
+        first = self.slot_index[start] if start is not None else 0
+        last = self.slot_index[end] if end is not None else len(self.time_slots) - 1
+        return ((1 << (last + 1)) - 1) & ~((1 << first) - 1)
+    
+    def schedule_round(self, name, preferences, solver=None, start=None, end=None, progress=None, deadline=None, cancel=None):
+        """
+        Schedule one selection round after the rounds already scheduled in this session.
+        
+        The round is solved on a fork that shares the loaded availability and its
+        bitsets, so only the round's candidates are processed. Interviews of the
+        earlier rounds keep their mentors busy and count toward the per-day and
+        back-to-back limits, and their proposers are not booked again in the
+        same slots. Scheduling the last round again (same name) replaces it.
+        
+        Args:
+            name: Name of the round
+            preferences: {mentor: [projects]} requested in this round (see round_preferences)
+            solver: Scheduling backend (defaults to greedy)
+            start: Optional first time slot of the round
+            end: Optional last time slot of the round
+            progress, deadline, cancel: As for schedule_interviews
+        
+        Returns:
+            Dictionary of solver statistics of the round; self.schedule then holds
+            the interviews of all rounds and self.rounds the scheduler of each round
+        """
+        names = [round_name for round_name, _ in self.rounds]
+        if name in names[:-1]:
+            raise ValueError(f"Round {name} is followed by other rounds; only the last round can be scheduled again")
+        if names and names[-1] == name:
+            self.schedule = self.rounds.pop()[1].occupied
+        
+        forked = self.fork()
+        forked.mentor_preferences = preferences
+        forked.occupied = self.schedule
+        if start is not None or end is not None:
+            window = self._slot_window(start, end)
+            forked.slot_masks = {project: window for projects in preferences.values() for project in projects}
+        stats = forked.schedule_interviews(solver, progress, deadline, cancel)
+        
+        self.rounds.append((name, forked))
+        self.schedule = {**self.schedule, **forked.schedule}
+        return stats
+    
+    def schedule_rounds(self, rounds, solver=None, joint=False, progress=None, deadline=None, cancel=None):
+        """
+        Schedule several selection rounds in one session.
+        
+        In sequence, each round is scheduled around the interviews of the rounds
+        before it (see schedule_round). Jointly, the requests of all rounds are
+        solved as one problem and the bookings are split by round afterwards; a
+        project's interviews of different rounds may then share a session. A
+        project that comes back in a later round (e.g. a shortlist) gets its own
+        copy in that round, so the same mentor can interview it once per round.
+        
+        Args:
+            rounds: List of round dictionaries (see round_preferences), each with an
+                optional 'name' and optional 'start' and 'end' time slots
+            solver: Scheduling backend (defaults to greedy)
+            joint: If True, solve all rounds at once instead of in sequence
+            progress, deadline, cancel: As for schedule_interviews (the deadline applies to each solve)
+        
+        Returns:
+            List of the solver statistics of each round (one for all rounds when joint)
+        """
+        named = [(selection_round.get('name', f'round {i + 1}'), self.round_preferences(selection_round), selection_round)
+                 for i, selection_round in enumerate(rounds)]
+        if not joint:
+            return [self.schedule_round(name, preferences, solver, selection_round.get('start'), selection_round.get('end'),
+                                        progress, deadline, cancel)
+                    for name, preferences, selection_round in named]
+        
+        self._ensure_slot_days()
+        busy = defaultdict(int)
+        for project, slot in self.schedule:
+            busy[project] |= 1 << self.slot_index[slot]
+        
+        # Each round's copy of a project: the project itself in the first round it
+        # appears in, an alias with the same availability in later rounds
+        copies = {}
+        round_of = {}
+        merged = defaultdict(list)
+        masks = {}
+        for name, preferences, selection_round in named:
+            window = self._slot_window(selection_round.get('start'), selection_round.get('end'))
+            for mentor, projects in preferences.items():
+                for project in projects:
+                    if (project, name) not in copies:
+                        first = not any(original == project for original, _ in copies)
+                        copies[(project, name)] = project if first else f"{project}@{name}"
+                    copy = copies[(project, name)]
+                    round_of[copy] = (name, project)
+                    merged[mentor].append(copy)
+                    masks[copy] = masks.get(copy, 0) | window
+        aliases = {copy: project for (project, _), copy in copies.items() if copy != project}
+        for alias, project in aliases.items():
+            # Aliases are not in the earlier bookings, so their proposer's busy slots are masked here
+            masks[alias] &= ~busy[project]
+        
+        forked = self.fork()
+        if aliases:
+            availability = self.proposer_availability
+            forked.proposer_availability = pd.concat(
+                [availability, availability[list(aliases.values())].set_axis(list(aliases), axis=1)], axis=1)
+            forked.projects = forked.proposer_availability.columns.tolist()
+        forked.mentor_preferences = dict(merged)
+        forked.occupied = self.schedule
+        forked.slot_masks = masks
+        stats = forked.schedule_interviews(solver, progress, deadline, cancel)
+        
+        # Split the bookings by round, with the aliases mapped back to their projects
+        parts = {}
+        for name, preferences, selection_round in named:
+            parts[name] = self.fork()
+            parts[name].mentor_preferences = preferences
+            parts[name].occupied = self.schedule
+            self.rounds.append((name, parts[name]))
+        booked = {}
+        for (copy, slot), mentors in forked.schedule.items():
+            name, project = round_of[copy]
+            part = parts[name]
+            part.schedule[(project, slot)] = part.schedule.get((project, slot), ()) + mentors
+            booked[(project, slot)] = booked.get((project, slot), ()) + mentors
+        
+        self.schedule = {**self.schedule, **booked}
+        return [stats]
+    
+    def schedule_components(self, solver=None, max_workers=None, progress=None, deadline=None, cancel=None):
+        """
+        Schedule independent parts of the cohort in parallel and merge the results.
+        
+        The mentor-project interaction graph (one edge per preference) is split
+        into connected components with union-find. Components share no mentor
+        and no project, so each can be solved on its own; small components are
+        packed into a few similarly sized subproblems, solved in worker
+        processes, and the schedules are merged. Greedy results are the same as
+        those of schedule_interviews.
+        
+        Args:
+            solver: Scheduling backend used for every subproblem (defaults to greedy)
+            max_workers: Number of worker processes (1 solves the subproblems in this process)
+            progress: Optional callable receiving an event after each solved subproblem
+            deadline: Optional number of seconds after which the subproblems stop
+            cancel: Optional threading.Event; pending subproblems are dropped when it is set
+        
+        Returns:
+            Dictionary of statistics
+        """
+        if solver is None:
+            solver = GreedySolver()
+        
+        start = time.perf_counter()
+        self._build_indexes()
+        self._start_solve(progress, deadline, cancel)
+        
+        components = find_components(self.mentor_preferences)
+        num_workers = max_workers or os.cpu_count() or 1
+        subproblems = [self.subproblem(preferences)
+                       for preferences in pack_components(components, 1 if num_workers == 1 else num_workers * 4)]
+        
+        # Wall-clock deadline shared by the worker processes
+        remaining = self._remaining_time()
+        deadline_at = time.time() + remaining if remaining is not None else None
+        
+        results = []
+        if num_workers == 1 or len(subproblems) == 1:
+            for k, subproblem in enumerate(subproblems):
+                if self._checkpoint('components', k, len(subproblems)):
                     break
-                    
-                for slot in block:
-                    # Skip if no more projects to schedule
-                    if not remaining_projects:
-                        break
-                        
-                    # Try to schedule the next project in this slot
-                    for project in list(remaining_projects):  # Create a copy to safely modify during iteration
-                        # Check if the proposer is available in this slot
-                        if self.proposer_availability.loc[slot, project]:
-                            # Check if this slot is still available (not already scheduled)
-                            slot_available = True
-                            for scheduled_key in self.schedule:
-                                if scheduled_key[1] == slot and mentor in self.schedule[scheduled_key]:
-                                    slot_available = False
-                                    break
-                                    
-                            if slot_available:
-                                # Schedule this interview
-                                if (project, slot) in self.schedule:
-                                    # Add this mentor to an existing interview
-                                    self.schedule[(project, slot)].append(mentor)
-                                else:
-                                    # Create a new interview
-                                    self.schedule[(project, slot)] = [mentor]
-                                    
-                                # Mark this project as scheduled
-                                remaining_projects.remove(project)
-                                break
-        
-        # Third pass: Handle any remaining unscheduled interviews
-        for mentor, projects in mentor_to_projects.items():
-            for project in projects:
-                # Find common availability
-                common_slots = self._get_common_availability(project, [mentor])
-                
-                if common_slots:
-                    # Use the earliest available slot
-                    for slot in common_slots:
-                        # Check if this slot is still available for this mentor
-                        slot_available = True
-                        for scheduled_key in self.schedule:
-                            if scheduled_key[1] == slot and mentor in self.schedule[scheduled_key]:
-                                slot_available = False
-                                break
-                                
-                        if slot_available:
-                            # Schedule this interview
-                            if (project, slot) in self.schedule:
-                                # Add this mentor to an existing interview
-                                self.schedule[(project, slot)].append(mentor)
-                            else:
-                                # Create a new interview
-                                self.schedule[(project, slot)] = [mentor]
-                            break
+                results.append(_solve_component(subproblem, solver, deadline_at, self._cancel))
+                self.schedule.update(results[-1][0])
+        else:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = [executor.submit(_solve_component, subproblem, solver, deadline_at)
+                           for subproblem in subproblems]
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    results.append(future.result())
+                    self.schedule.update(results[-1][0])
+                    if self._checkpoint('components', len(results), len(subproblems)):
+                        # Drop the subproblems that have not started yet; running ones
+                        # stop at the deadline and their schedules are still merged
+                        for pending in futures:
+                            pending.cancel()
+        
+        stopped = self._stop_reason
+        for _, stats in results:
+            stopped = stopped or stats.get('stopped')
+        self._build_indexes()
+        
+        self.solver_stats = {
+            'solver': solver.name,
+            'components': len(components),
+            'subproblems': len(subproblems),
+            'largest component': sum(len(projects) for projects in components[0].values()) if components else 0,
+            'seconds': round(time.perf_counter() - start, 3),
+        }
+        statuses = sorted({stats['status'] for _, stats in results if 'status' in stats})
+        if statuses:
+            self.solver_stats['status'] = '/'.join(statuses)
+        if stopped:
+            self.solver_stats['stopped'] = stopped
+        if self.baseline:
+            counts = count_changes(self.diff_baseline())
+            self.solver_stats.update({'baseline ' + change: count for change, count in counts.items()})
+        if progress is not None:
+            self._report('done', 1, 1)
+        
+        return self.solver_stats
     
-    def output_schedule(self):
-        """Generate a formatted schedule output."""
-        # Sort by time slot
-        sorted_schedule = sorted(self.schedule.items(), key=lambda x: x[0][1])
-        
-        # Create a DataFrame for the schedule
-        schedule_data = []
-        for (project, slot), mentors in sorted_schedule:
-            schedule_data.append({
-                'Time Slot': slot,
-                'Project ID': project,
-                'Mentors': ', '.join(mentors)
-            })
-            
-        schedule_df = pd.DataFrame(schedule_data)
+    def _start_solve(self, progress=None, deadline=None, cancel=None):
+        """Reset the progress reporting and stop conditions of a solve."""
+        self._progress = progress
+        self._cancel = cancel
+        self._solve_start = time.perf_counter()
+        self._deadline = self._solve_start + deadline if deadline is not None else None
+        self._stop_reason = None
+        self._last_report = self._phase_start = self._solve_start
+        self._phase = None
+    
+    def _remaining_time(self):
+        """Return the seconds left until the deadline, or None without a deadline."""
+        deadline = getattr(self, '_deadline', None)
+        return None if deadline is None else max(0.0, deadline - time.perf_counter())
+    
+    def _checkpoint(self, phase, done, total):
+        """
+        Called by the solvers between units of work.
         
-        # Create a mentor-specific view
-        mentor_schedules = {mentor: [] for mentor in self.mentors}
+        Emits a progress event at most every PROGRESS_INTERVAL seconds and
+        returns True when the solve should stop (deadline passed or cancelled).
+        """
+        if getattr(self, '_stop_reason', None):
+            return True
+        if not hasattr(self, '_solve_start'):
+            return False
         
-        for (project, slot), mentors in sorted_schedule:
-            for mentor in mentors:
-                mentor_schedules[mentor].append({
-                    'Time Slot': slot,
-                    'Project ID': project
-                })
+        now = time.perf_counter()
+        if phase != self._phase:
+            self._phase = phase
+            self._phase_start = now
+        if self.profiler is not None and phase != self.profiler.current:
+            self.profiler.start(phase)
+        
+        if self._cancel is not None and self._cancel.is_set():
+            self._stop_reason = 'cancelled'
+        elif self._deadline is not None and now >= self._deadline:
+            self._stop_reason = 'deadline'
+        
+        if self._progress is not None and (self._stop_reason or now - self._last_report >= self.PROGRESS_INTERVAL):
+            self._report(phase, done, total, now)
+        
+        return self._stop_reason is not None
+    
+    def _report(self, phase, done, total, now=None):
+        """Send a progress event to the progress callback."""
+        now = now or time.perf_counter()
+        self._last_report = now
+        phase_elapsed = now - self._phase_start
+        eta = phase_elapsed * (total - done) / done if done and total else None
+        self._progress({
+            'phase': phase,
+            'done': done,
+            'total': total,
+            'booked': sum(len(mentors) for mentors in self.schedule.values()),
+            'elapsed': round(now - self._solve_start, 3),
+            'eta': round(eta, 3) if eta is not None else None,
+            'stopped': self._stop_reason,
+        })
+    
+    def iter_bookings(self):
+        """
+        Yield the sessions of the schedule as Booking records in chronological order.
+        
+        Only the (project, slot) keys are sorted, by slot_index; each record is
+        created when it is consumed, so no copy of the whole schedule is built.
+        """
+        self._ensure_slot_days()
+        for project, slot in sorted(self.schedule, key=lambda key: self.slot_index[key[1]]):
+            yield Booking(slot, project, self.schedule[(project, slot)])
+    
+    def _mentor_columns(self, mentor):
+        return ['Time Slot', 'Project ID', 'Local Time'] if mentor in self.entity_timezones else ['Time Slot', 'Project ID']
+    
+    def _mentor_rows(self, mentor, bookings):
+        """Yield the rows of a mentor's schedule for their bookings."""
+        timezone = self.entity_timezones.get(mentor)
+        if timezone is not None:
+            self._ensure_slot_days()
+        
+        for booking in bookings:
+            row = {'Time Slot': booking.time_slot, 'Project ID': booking.project}
+            if timezone is not None:
+                # Render the slot in the mentor's own time zone
+                start = self.slot_minutes[self.slot_index[booking.time_slot]][0]
+                row['Local Time'] = format_local_slot(start, timezone) if start is not None else ''
+            yield row
+    
+    def _collect_by_mentor(self, bookings, mentor_bookings):
+        """Pass Booking records through, appending a reference to each to its mentors' lists."""
+        for booking in bookings:
+            for mentor in booking.mentors:
+                mentor_bookings[mentor].append(booking)
+            yield booking
+    
+    def output_schedule(self):
+        """
+        Generate a formatted schedule output.
         
+        save_schedule streams the same rows to the files without building these
+        objects; this is for interactive use.
+        
+        Returns:
+            Tuple of (DataFrame of the complete schedule, {mentor: [row dictionaries]})
+        """
+        mentor_bookings = {mentor: [] for mentor in self.mentors}
+        schedule_df = pd.DataFrame([(slot, project, ', '.join(mentors)) for slot, project, mentors
+                                    in self._collect_by_mentor(self.iter_bookings(), mentor_bookings)],
+                                   columns=SCHEDULE_COLUMNS)
+        mentor_schedules = {mentor: list(self._mentor_rows(mentor, booked)) for mentor, booked in mentor_bookings.items()}
         return schedule_df, mentor_schedules
     
-    def save_schedule(self, output_dir):
-        """Save the schedule to CSV files."""
+    def save_schedule(self, output_dir, store=None):
+        """
+        Save the schedule to CSV files.
+        
+        Rows are written as they are generated from the schedule; the per-mentor
+        files only hold references to the Booking records of the main file.
+        
+        Args:
+            output_dir: Directory to save schedule files
+            store: Optional ScheduleStore the bookings are also written to
+        """
         os.makedirs(output_dir, exist_ok=True)
         
-        # Get schedule data
-        schedule_df, mentor_schedules = self.output_schedule()
+        if store is not None:
+            self.save_to_store(store)
         
-        # Save main schedule
-        schedule_df.to_csv(os.path.join(output_dir, 'complete_schedule.csv'), index=False)
+        # Save main schedule, collecting each mentor's bookings on the way
+        mentor_bookings = {mentor: [] for mentor in self.mentors}
+        write_schedule_csv(self._collect_by_mentor(self.iter_bookings(), mentor_bookings),
+                           os.path.join(output_dir, 'complete_schedule.csv'))
         
         # Save mentor-specific schedules
-        for mentor, schedule in mentor_schedules.items():
-            if schedule:  # Only save if the mentor has interviews
-                mentor_df = pd.DataFrame(schedule)
-                mentor_df.to_csv(os.path.join(output_dir, f'{mentor}_schedule.csv'), index=False)
+        for mentor, booked in mentor_bookings.items():
+            if booked:  # Only save if the mentor has interviews
+                write_csv_rows(os.path.join(output_dir, f'{mentor}_schedule.csv'), self._mentor_columns(mentor),
+                               self._mentor_rows(mentor, booked))
+        
+        # Save the reserved backup slots (see reserve_backups)
+        if self.backups is not None:
+            write_csv_rows(os.path.join(output_dir, 'backup_slots.csv'), BACKUP_COLUMNS,
+                           ({'Project ID': project, 'Mentor': mentor, 'Rank': rank + 1, 'Time Slot': self.time_slots[slot_idx]}
+                            for (project, mentor), slots in self.backups.items() for rank, slot_idx in enumerate(slots)))
+        
+        # Save the mentor load report when load balancing is used
+        if self.balance_load or self.max_interviews_per_day is not None or self.max_consecutive is not None:
+            self.get_mentor_load().to_csv(os.path.join(output_dir, 'mentor_load.csv'), index=False)
         
         # Create a summary of unscheduled interviews
-        unscheduled = self._get_unscheduled_interviews()
-        if unscheduled:
-            unscheduled_df = pd.DataFrame(unscheduled)
-            unscheduled_df.to_csv(os.path.join(output_dir, 'unscheduled_interviews.csv'), index=False)
+        unscheduled = self._iter_unscheduled_interviews()
+        first = next(unscheduled, None)
+        if first is not None:
+            write_csv_rows(os.path.join(output_dir, 'unscheduled_interviews.csv'), ['Mentor', 'Project ID', 'Reason'],
+                           itertools.chain([first], unscheduled))
     
-    def _get_unscheduled_interviews(self):
-        """Identify any interviews that couldn't be scheduled."""
-        unscheduled = []
+    def save_workbook(self, file_path):
+        """
+        Save the schedule as one Excel workbook: a summary, the complete schedule,
+        one sheet per mentor and the unscheduled interviews (requires openpyxl).
         
-        for mentor, projects in self.mentor_preferences.items():
-            for project in projects:
-                # Check if this interview was scheduled
-                scheduled = False
-                for (scheduled_project, _), mentors in self.schedule.items():
-                    if scheduled_project == project and mentor in mentors:
-                        scheduled = True
-                        break
-                        
-                if not scheduled:
-                    unscheduled.append({
-                        'Mentor': mentor,
-                        'Project ID': project,
-                        'Reason': 'No common availability'
-                    })
-                    
-        return unscheduled
+        The sessions are listed in chronological order; the rows are streamed
+        to the file like those of save_schedule.
         
-    def _parse_time_slot(self, time_slot):
+        Returns:
+            Number of mentor sheets written
+        """
+        bookings = list(self.iter_bookings())
+        mentor_bookings = {mentor: [] for mentor in self.mentors}
+        for booking in bookings:
+            for mentor in booking.mentors:
+                mentor_bookings[mentor].append(booking)
+        mentor_sheets = ((mentor, self._mentor_columns(mentor), self._mentor_rows(mentor, booked))
+                         for mentor, booked in mentor_bookings.items() if booked)
+        return export_workbook(bookings, file_path, mentor_sheets, self._iter_unscheduled_interviews(), self.summarize())
+    
+    def save_to_store(self, store):
+        """Replace the bookings of a ScheduleStore with the current schedule."""
+        store.write_bookings((slot, project, mentors) for (project, slot), mentors in self.schedule.items())
+        store.commit()
+    
+    def save_calendars(self, output_dir, year=None):
         """
-        Parse a time slot string and return the date, start time, and end time.
+        Save the schedule as iCalendar files (one per mentor and per proposer, plus a combined feed).
         
-        Example: "4/23 夜 (19:00 - 21:00)" -> (4/23, 19:00, 21:00)
+        Events are written in UTC, so calendar apps show them in each person's time zone.
+        
+        Args:
+            output_dir: Directory to save the .ics files
+            year: Year of form windows (defaults to the scheduler's year)
+        
+        Returns:
+            Number of events written
         """
-        match = re.match(r'(\d+/\d+)\s+[^\(]+\((\d+:\d+)\s*-\s*(\d+:\d+)\)', time_slot)
-        if match:
-            date_str, start_time, end_time = match.groups()
-            return date_str, start_time, end_time
-        return None, None, None
+        return export_ics(self.iter_bookings(), output_dir, year or self.year, self.timezone)
     
-    def _split_into_hourly_slots(self, time_slot):
+    def validate(self):
         """
-        Split a time slot into hourly slots.
+        Check the current schedule against availability and preferences.
         
-        Example: "4/23 夜 (19:00 - 21:00)" -> ["2024/04/23 19:00 PM", "2024/04/23 20:00 PM"]
+        Returns:
+            List of violation dictionaries (see validate_schedule.py)
         """
-        date_str, start_time, end_time = self._parse_time_slot(time_slot)
-        if not (date_str and start_time and end_time):
-            return []
+        self._build_indexes()
+        bookings = ((slot, project, mentors) for (project, slot), mentors in self.schedule.items())
+        return validate_schedule(bookings, self.time_slots, self.proposer_bits, self.mentor_bits, self.mentor_preferences)
+    
+    def reserve_backups(self, num_backups=3, reserved=None):
+        """
+        Rank backup slots for every booked interview and index the waitlist.
         
-        year = "2024"
+        A backup slot is a slot where the proposer and the mentor are available,
+        the mentor is free and within the load limits. Backups are ranked by
+        same day as the interview, adjacency to the mentor's other interviews,
+        then distance from the booked slot. The waitlist maps each (mentor, slot)
+        to the requested but unscheduled projects available then, in preference
+        order, so a slot freed by a cancellation can be offered right away.
         
-        start_hour, start_minute = map(int, start_time.split(':'))
-        end_hour, end_minute = map(int, end_time.split(':'))
+        Args:
+            num_backups: Number of backup slots kept per interview
+            reserved: Optional {(project, mentor): [time slots]} of previously
+                published backups to use instead of ranking new ones
         
-        month, day = map(int, date_str.split('/'))
+        Returns:
+            Number of interviews with at least one backup slot
+        """
+        self._build_indexes()
+        self._booked_slot = {(project, mentor): self.slot_index[slot]
+                             for (project, slot), mentors in self.schedule.items() for mentor in mentors}
         
-        start_datetime = datetime(int(year), month, day, start_hour, start_minute)
-        end_datetime = datetime(int(year), month, day, end_hour, end_minute)
+        self.backups = {}
+        for (project, mentor), slot_idx in self._booked_slot.items():
+            if reserved is not None:
+                self.backups[(project, mentor)] = [self.slot_index[slot] for slot in reserved.get((project, mentor), ())
+                                                   if slot in self.slot_index]
+            else:
+                self.backups[(project, mentor)] = self._rank_backup_slots(project, mentor, slot_idx)[:num_backups]
         
-        hourly_slots = []
-        current_time = start_datetime
-        while current_time < end_datetime:
-            am_pm = "AM" if current_time.hour < 12 else "PM"
-            hour_12 = current_time.hour if current_time.hour <= 12 else current_time.hour - 12
-            if hour_12 == 0:
-                hour_12 = 12
-            
-            slot = f"{year}/{current_time.month:02d}/{current_time.day:02d} {hour_12:02d}:{current_time.minute:02d} {am_pm}"
-            hourly_slots.append(slot)
-            
-            current_time += timedelta(hours=1)
+        self.waitlist = defaultdict(deque)
+        mentor_to_projects, _ = self._get_interview_requests()
+        for mentor, projects in mentor_to_projects.items():
+            for project in projects:
+                for slot_idx in iter_bits(self.proposer_bits.get(project, 0) & self.mentor_bits.get(mentor, 0)):
+                    self.waitlist[(mentor, slot_idx)].append(project)
+        
+        return sum(1 for slots in self.backups.values() if slots)
+    
+    def _rank_backup_slots(self, project, mentor, booked_idx):
+        """Return the slot indices a booked interview could move to, best first."""
+        booked = self._mentor_booked[mentor]
+        candidates = self.proposer_bits.get(project, 0) & self.mentor_bits.get(mentor, 0) & ~booked
+        ranked = []
+        for slot_idx in iter_bits(candidates):
+            if not self._within_load_limits(mentor, self.time_slots[slot_idx]):
+                continue
+            adjacent = ((slot_idx > 0 and self._slot_follows[slot_idx] and (booked >> (slot_idx - 1)) & 1)
+                        or (slot_idx + 1 < len(self.time_slots) and self._slot_follows[slot_idx + 1]
+                            and (booked >> (slot_idx + 1)) & 1))
+            ranked.append((self.slot_day[slot_idx] != self.slot_day[booked_idx], not adjacent,
+                           abs(slot_idx - booked_idx), slot_idx))
+        ranked.sort()
+        return [slot_idx for *_, slot_idx in ranked]
+    
+    def _can_book(self, project, mentor, slot_idx):
+        """Check in constant time that a mentor can interview a project in a slot now."""
+        slot = self.time_slots[slot_idx]
+        return bool((self.proposer_bits.get(project, 0) >> slot_idx) & 1 and (self.mentor_bits.get(mentor, 0) >> slot_idx) & 1
+                    and self._is_mentor_free(mentor, slot) and self._within_load_limits(mentor, slot))
+    
+    def _unbook(self, project, slot, mentor):
+        """Remove one mentor from a session (inverse of _book)."""
+        mentors = tuple(m for m in self.schedule[(project, slot)] if m != mentor)
+        if mentors:
+            self.schedule[(project, slot)] = mentors
+        else:
+            del self.schedule[(project, slot)]
+        
+        slot_idx = self.slot_index[slot]
+        self._mentor_booked[mentor] &= ~(1 << slot_idx)
+        self._mentor_day_count[(mentor, self.slot_day[slot_idx])] -= 1
+    
+    def cancel_interview(self, project, mentor, after=None):
+        """
+        Cancel a booked interview and move it to its best still-valid backup slot.
+        
+        Only the reserved backups of the interview are checked, each in constant
+        time against the free-capacity bitsets, so nothing is solved again. If
+        the freed slot is still usable, it is given to the first waitlisted
+        project of the mentor available then.
         
-        return hourly_slots
+        Args:
+            project: Project ID of the cancelled interview
+            mentor: Mentor of the cancelled interview
+            after: Optional time slot; only later slots are used (e.g. the current
+                slot, or the booked slot itself after a no-show)
+        
+        Returns:
+            Tuple of (replacement time slot or None, waitlisted project that got the
+            freed slot or None)
+        """
+        if self.backups is None:
+            self.reserve_backups()
+        if (project, mentor) not in self._booked_slot:
+            raise KeyError(f"{mentor} has no interview with {project} in the schedule")
+        if after is not None and after not in self.slot_index:
+            raise ValueError(f"Unknown time slot '{after}'")
+        
+        earliest = self.slot_index[after] + 1 if after is not None else 0
+        old_idx = self._booked_slot.pop((project, mentor))
+        self._unbook(project, self.time_slots[old_idx], mentor)
+        
+        replacement = None
+        backups = self.backups.pop((project, mentor), [])
+        for k, slot_idx in enumerate(backups):
+            if slot_idx >= earliest and slot_idx != old_idx and self._can_book(project, mentor, slot_idx):
+                replacement = self.time_slots[slot_idx]
+                self._book(project, replacement, [mentor])
+                self._booked_slot[(project, mentor)] = slot_idx
+                self.backups[(project, mentor)] = backups[:k] + backups[k + 1:]
+                break
+        
+        waitlisted = None
+        if old_idx >= earliest:
+            queue = self.waitlist.get((mentor, old_idx), ())
+            while queue:
+                candidate = queue.popleft()
+                if (candidate, mentor) not in self._booked_slot and self._can_book(candidate, mentor, old_idx):
+                    waitlisted = candidate
+                    self._book(candidate, self.time_slots[old_idx], [mentor])
+                    self._booked_slot[(candidate, mentor)] = old_idx
+                    self.backups[(candidate, mentor)] = []
+                    break
+        
+        return replacement, waitlisted
+    
+    def diff_baseline(self):
+        """
+        List the interviews that moved, were added or were removed compared to the baseline.
+        
+        Returns:
+            List of change dictionaries (see schedule_diff.py)
+        """
+        bookings = ((slot, project, mentors) for (project, slot), mentors in self.schedule.items())
+        return diff_schedules(((slot, project, [mentor]) for (project, mentor), slot in (self.baseline or {}).items()),
+                              bookings)
+    
+    def _get_unscheduled_interviews(self):
+        """Identify any interviews that couldn't be scheduled."""
+        return list(self._iter_unscheduled_interviews())
+    
+    def _iter_unscheduled_interviews(self):
+        """Yield the interviews that couldn't be scheduled, in preference order."""
+        scheduled = {(mentor, project) for (project, _), mentors in self.schedule.items() for mentor in mentors}
+        
+        for mentor, projects in self.mentor_preferences.items():
+            for project in projects:
+                if (mentor, project) not in scheduled:
+                    yield {
+                        'Mentor': mentor,
+                        'Project ID': project,
+                        'Reason': self.pruned_pairs.get((mentor, project), 'No common availability')
+                    }
+        
+    def _scenario_slots(self, time_slot):
+        """Return the slots a scenario label stands for: the hourly slots of a form window if the cohort's slots are hourly."""
+        if not WINDOW_PATTERN.match(time_slot) or any(WINDOW_PATTERN.match(slot) for slot in self.time_slots):
+            return [time_slot]
+        return self._split_into_hourly_slots(time_slot)
+    
+    def _split_into_hourly_slots(self, time_slot):
+        """
+        Split a time slot into hourly slots.
+        
+        Example: "4/23 夜 (19:00 - 21:00)" -> ["2024/04/23 07:00 PM", "2024/04/23 08:00 PM"]
+        """
+        return split_into_hourly_slots(time_slot, self.year)
+
+def _solve_component(scheduler, solver, deadline_at=None, cancel=None):
+    """Solve one subproblem (usually in a worker process) until a wall-clock deadline and return its schedule and statistics."""
+    deadline = max(0.0, deadline_at - time.time()) if deadline_at is not None else None
+    stats = scheduler.schedule_interviews(solver, deadline=deadline, cancel=cancel)
+    return scheduler.schedule, stats
+
+def _solve_scenario(scheduler, solver=None):
+    """Solve one scenario variant (runs in a worker process) and summarize it."""
+    scheduler.schedule_interviews(solver)
+    return scheduler.summarize()
+
+def print_progress(event):
+    """Progress callback of the command line: one line per event on stderr."""
+    line = f"[{event['phase']}] {event['done']}/{event['total']}, {event['booked']} interviews booked, {event['elapsed']:.1f}s"
+    if event['eta'] is not None and event['phase'] != 'done':
+        line += f", ETA {event['eta']:.1f}s"
+    print(line, file=sys.stderr)
+
+def save_profile(profiler, output_dir):
+    """Save a --profile run to OUTPUT_DIR/profile and print the time and memory of each phase."""
+    profile_dir = os.path.join(output_dir, 'profile')
+    profiler.save(profile_dir)
+    for phase in profiler.summary():
+        print(f"Profile {phase['Phase']}: {phase['Seconds']} s, peak {phase['Peak MB']} MB")
+    print(f"Profile saved to {profile_dir}/ (profile.collapsed for flame graphs, allocations.txt)")
+
+def save_rounds(scheduler, output_dir, validate=False, workbook=False, calendars=False, store=None):
+    """Save each round of a multi-round session to OUTPUT_DIR/<round> and a summary to OUTPUT_DIR/rounds_summary.csv.
+    
+    The bookings of all rounds are saved to the store, if given.
+    """
+    rows = []
+    errors = 0
+    for name, round_scheduler in scheduler.rounds:
+        round_dir = os.path.join(output_dir, re.sub(r'[\\/:*?"<>|]+', '_', name))
+        round_scheduler.save_schedule(round_dir)
+        if workbook:
+            round_scheduler.save_workbook(os.path.join(round_dir, 'schedule.xlsx'))
+        if calendars:
+            round_scheduler.save_calendars(os.path.join(round_dir, 'calendars'))
+        rows.append({'Round': name, **round_scheduler.summarize()})
+        if validate:
+            violations = round_scheduler.validate()
+            write_report(violations, os.path.join(round_dir, 'violations.csv'))
+            errors += sum(count for (severity, _), count in summarize_violations(violations).items() if severity == 'error')
+    
+    summary_df = pd.DataFrame(rows)
+    os.makedirs(output_dir, exist_ok=True)
+    summary_df.to_csv(os.path.join(output_dir, 'rounds_summary.csv'), index=False)
+    print(summary_df.to_string(index=False))
+    print(f"Rounds saved to {output_dir}/ (rounds_summary.csv and one directory per round)")
+    if store is not None:
+        scheduler.save_to_store(store)
+    if validate:
+        print(f"Validation: {errors} errors (see violations.csv of each round)")
+        if errors:
+            sys.exit(1)
 
 def main():
     parser = argparse.ArgumentParser(description='Schedule interviews based on availability and preferences.')
-    parser.add_argument('--proposer-file', required=True, help='CSV file with proposers\' availability')
-    parser.add_argument('--mentor-file', required=True, help='CSV file with mentors\' availability')
-    parser.add_argument('--preference-file', required=True, help='CSV file with mentors\' project preferences')
+    parser.add_argument('--proposer-file', help='CSV file with proposers\' availability')
+    parser.add_argument('--mentor-file', help='CSV file with mentors\' availability')
+    parser.add_argument('--preference-file', help='CSV file with mentors\' project preferences')
+    parser.add_argument('--db', help='SQLite cohort store to read the inputs from (when no input files are given) and save the bookings to')
     parser.add_argument('--output-dir', default='schedule_output', help='Directory to save schedule files')
+    parser.add_argument('--balance-load', action='store_true', help="Spread each mentor's interviews evenly over their available days")
+    parser.add_argument('--max-per-day', type=int, default=None, help='Maximum number of interviews per mentor per day')
+    parser.add_argument('--max-consecutive', type=int, default=None, help='Maximum number of back-to-back interviews per mentor')
+    parser.add_argument('--min-break', type=int, default=1, help='Free slots required between runs of interviews (used with --max-consecutive)')
+    parser.add_argument('--solver', default='greedy', choices=list(SOLVERS), help='Scheduling backend (cpsat requires OR-Tools)')
+    parser.add_argument('--time-limit', type=float, default=60.0, help='Time limit in seconds for the cpsat solver')
+    parser.add_argument('--no-warm-start', action='store_true', help='Do not start the cpsat solver from the greedy schedule')
+    parser.add_argument('--xlsx', action='store_true', help='Also save the schedule as one Excel workbook, OUTPUT_DIR/schedule.xlsx (requires openpyxl)')
+    parser.add_argument('--ics', action='store_true', help='Also save iCalendar files to OUTPUT_DIR/calendars')
+    parser.add_argument('--year', type=int, default=DEFAULT_YEAR, help='Year of form window slots such as "4/23 夜 (19:00 - 21:00)"')
+    parser.add_argument('--timezone', default=DEFAULT_TIMEZONE, help='IANA time zone of the slot labels')
+    parser.add_argument('--timezone-file', help='CSV file of mentors and projects that answered in their own time zone (name, time zone)')
+    parser.add_argument('--interview-minutes', type=int, default=None, help='Pack interviews of this length into the availability windows (schedule shows exact start and end times)')
+    parser.add_argument('--buffer-minutes', type=int, default=0, help='Minutes between two interviews with --interview-minutes')
+    parser.add_argument('--progress', action='store_true', help='Print progress (phase, interviews booked, ETA) to stderr while solving')
+    parser.add_argument('--deadline', type=float, default=None, help='Stop solving after this many seconds and save the schedule found so far')
+    parser.add_argument('--baseline-schedule', help='Previous complete_schedule.csv to keep as many interviews of as possible')
+    parser.add_argument('--analyze', action='store_true', help='Report bottlenecks to OUTPUT_DIR before solving and leave out interviews without a common slot')
+    parser.add_argument('--backups', type=int, default=None, help='Reserve up to this many ranked backup slots per interview (saved to OUTPUT_DIR/backup_slots.csv, see replace_interview.py)')
+    parser.add_argument('--validate', action='store_true', help='Validate the schedule after solving and exit with an error on violations')
+    parser.add_argument('--decompose', action='store_true', help='Solve independent groups of mentors and projects in parallel worker processes (see --workers)')
+    parser.add_argument('--profile', action='store_true', help='Profile loading, each solver pass and saving (cProfile and tracemalloc) into OUTPUT_DIR/profile')
+    parser.add_argument('--profile-top', type=int, default=20, help='Number of allocation sites listed per phase with --profile')
+    parser.add_argument('--scenario-file', help='JSON file with a list of what-if scenarios to compare instead of saving a schedule')
+    parser.add_argument('--round-file', help='JSON file with a list of selection rounds to schedule one after another (saved to OUTPUT_DIR/<round>)')
+    parser.add_argument('--joint-rounds', action='store_true', help='Solve the rounds of --round-file as one problem instead of in sequence')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes for scenarios and --decompose (default: number of CPUs)')
     
     args = parser.parse_args()
+    if args.round_file:
+        unsupported = [flag for flag, value in [('--backups', args.backups is not None), ('--decompose', args.decompose),
+                                                ('--baseline-schedule', args.baseline_schedule)] if value]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be combined with --round-file")
+    
+    profiler = PhaseProfiler(args.profile_top) if args.profile else None
+    if profiler is not None:
+        profiler.start('load')
+    
+    input_files = [args.proposer_file, args.mentor_file, args.preference_file]
+    store = ScheduleStore(args.db) if args.db else None
+    if all(input_files):
+        scheduler = InterviewScheduler(args.proposer_file, args.mentor_file, args.preference_file)
+        if store is not None:
+            store.write_availability_frame(PROPOSER, scheduler.proposer_availability)
+            store.write_availability_frame(MENTOR, scheduler.mentor_availability)
+            store.write_preferences(scheduler.mentor_preferences, replace=True)
+            store.commit()
+    elif store is not None and not any(input_files):
+        scheduler = InterviewScheduler.from_store(store)
+    else:
+        parser.error('--proposer-file, --mentor-file and --preference-file are required (unless reading from --db)')
+    if args.balance_load or args.max_per_day is not None or args.max_consecutive is not None:
+        scheduler.set_load_limits(args.max_per_day, args.max_consecutive, args.min_break, args.balance_load)
+    if args.timezone != DEFAULT_TIMEZONE or args.timezone_file or args.year != DEFAULT_YEAR:
+        entity_timezones = load_timezones_csv(args.timezone_file) if args.timezone_file else None
+        scheduler.set_timezones(args.timezone, entity_timezones, args.year)
+    if args.interview_minutes is not None:
+        num_windows = len(scheduler.time_slots)
+        num_slots = scheduler.set_interview_length(args.interview_minutes, args.buffer_minutes)
+        print(f"Packed {num_windows} time slots into {num_slots} interview slots of {args.interview_minutes} minutes "
+              f"({args.buffer_minutes} minute buffer)")
+    if args.baseline_schedule:
+        scheduler.set_baseline(read_schedule_csv(args.baseline_schedule))
+    if profiler is not None:
+        profiler.stop()
+        scheduler.profiler = profiler
+    
+    solver_options = {}
+    if args.solver == 'cpsat':
+        solver_options = {'time_limit': args.time_limit, 'warm_start': not args.no_warm_start}
+    solver = get_solver(args.solver, **solver_options)
+    
+    if args.scenario_file:
+        with open(args.scenario_file, encoding='utf-8') as f:
+            scenarios = json.load(f)
+        
+        with scheduler._profile('scenarios'):
+            comparison_df = scheduler.run_scenarios(scenarios, args.workers, solver)
+        os.makedirs(args.output_dir, exist_ok=True)
+        comparison_df.to_csv(os.path.join(args.output_dir, 'scenario_comparison.csv'), index=False)
+        
+        print(comparison_df.to_string(index=False))
+        print(f"Scenario comparison saved to {args.output_dir}/scenario_comparison.csv")
+        if profiler is not None:
+            save_profile(profiler, args.output_dir)
+        return
+    
+    if args.analyze:
+        with scheduler._profile('analyze'):
+            report = scheduler.analyze_feasibility(prune=True)
+        report.save(args.output_dir)
+        print(report.format_bottlenecks())
+        print(f"Feasibility report saved to {args.output_dir}/ ({len(scheduler.pruned_pairs)} interviews left out)")
+    
+    if args.round_file:
+        with open(args.round_file, encoding='utf-8') as f:
+            rounds = json.load(f)
+        try:
+            with scheduler._profile('rounds'):
+                scheduler.schedule_rounds(rounds, solver, args.joint_rounds, print_progress if args.progress else None, args.deadline)
+        except ValueError as e:
+            parser.error(str(e))
+        save_rounds(scheduler, args.output_dir, args.validate, args.xlsx, args.ics, store)
+        if profiler is not None:
+            save_profile(profiler, args.output_dir)
+        return
+    
+    # Ctrl-C stops the solve cleanly and keeps the interviews booked so far
+    cancel = threading.Event()
+    previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: cancel.set())
+    try:
+        with scheduler._profile('solve'):
+            if args.decompose:
+                stats = scheduler.schedule_components(solver, args.workers, print_progress if args.progress else None,
+                                                      args.deadline, cancel)
+            else:
+                stats = scheduler.schedule_interviews(solver, print_progress if args.progress else None, args.deadline, cancel)
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+    if 'stopped' in stats:
+        print(f"Solve stopped early ({stats['stopped']}); saving the "
+              f"{sum(len(mentors) for mentors in scheduler.schedule.values())} interviews booked so far")
+    if args.backups is not None:
+        with scheduler._profile('backups'):
+            num_covered = scheduler.reserve_backups(args.backups)
+        print(f"Backup slots: {num_covered}/{len(scheduler.backups)} interviews have at least one "
+              f"(see {args.output_dir}/backup_slots.csv)")
+    with scheduler._profile('save'):
+        scheduler.save_schedule(args.output_dir, store)
+        if args.xlsx:
+            num_sheets = scheduler.save_workbook(os.path.join(args.output_dir, 'schedule.xlsx'))
+        if args.ics:
+            num_events = scheduler.save_calendars(os.path.join(args.output_dir, 'calendars'))
+    if args.xlsx:
+        print(f"Workbook saved to {args.output_dir}/schedule.xlsx ({num_sheets} mentor sheets)")
+    if args.ics:
+        print(f"Calendar files saved to {args.output_dir}/calendars/ ({num_events} events)")
+    
+    if args.solver != 'greedy' or args.decompose:
+        print("Solver: " + ", ".join(f"{key} {value}" for key, value in stats.items()))
+    
+    if args.baseline_schedule:
+        write_changes(scheduler.diff_baseline(), os.path.join(args.output_dir, 'schedule_changes.csv'))
+        print(f"Changes from baseline: {stats['baseline moved']} moved, {stats['baseline added']} added, "
+              f"{stats['baseline removed']} removed (see {args.output_dir}/schedule_changes.csv)")
     
-    scheduler = InterviewScheduler(args.proposer_file, args.mentor_file, args.preference_file)
-    scheduler.schedule_interviews()
-    scheduler.save_schedule(args.output_dir)
+    if args.validate:
+        with scheduler._profile('validate'):
+            violations = scheduler.validate()
+            write_report(violations, os.path.join(args.output_dir, 'violations.csv'))
+        if profiler is not None:
+            save_profile(profiler, args.output_dir)
+        errors = sum(count for (severity, _), count in summarize_violations(violations).items() if severity == 'error')
+        print(f"Validation: {errors} errors, {len(violations) - errors} warnings (see {args.output_dir}/violations.csv)")
+        if errors:
+            sys.exit(1)
+    elif profiler is not None:
+        save_profile(profiler, args.output_dir)
     
+    balance = scheduler.load_balance()
+    print(f"Load balance: max {balance['Max Per Day']} interviews per mentor per day, "
+          f"mean {balance['Mean Per Day']}, per-day CV {balance['Per-Day Load CV']}")
     print(f"Scheduling complete. Results saved to {args.output_dir}/")
 
 if __name__ == "__main__":
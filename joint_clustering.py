@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Set-cover clustering of joint interviews.
+
+For a project wanted by several mentors, each time slot is described by a
+bitset of the interested mentors who are free in it (bit j = j-th mentor).
+The smallest set of slots whose bitsets cover every mentor gives the fewest
+sessions the proposer and mentors have to attend.
+"""
+
+# Above this many mentors per project the exact search falls back to greedy
+EXACT_COVER_MAX_MENTORS = 12
+
+def iter_bits(mask):
+    """Yield the indices of the set bits of an integer, lowest first."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+def count_bits(mask):
+    """Return the number of set bits of an integer."""
+    return bin(mask).count('1')
+
+def _greedy_cover(candidates, target):
+    """Greedy set cover: repeatedly take the slot covering most uncovered mentors (preferred slot on ties)."""
+    cover = []
+    covered = 0
+    while covered != target:
+        rank, slot_idx, mask = max(candidates, key=lambda c: (count_bits(c[2] & ~covered), -c[0]))
+        cover.append((slot_idx, mask))
+        covered |= mask
+    return sorted(cover)
+
+def min_slot_cover(slot_masks):
+    """
+    Find a minimum set of slots that covers every mentor appearing in any slot.
+
+    Breadth-first search over the covered-mentor bitsets finds an exact minimum
+    (there are at most 2^k states for k mentors); larger groups use greedy cover.
+
+    Among covers of the same size, slots listed earlier are preferred.
+
+    Args:
+        slot_masks: List of (slot_idx, mentor_mask) in order of preference (usually slot order)
+
+    Returns:
+        List of (slot_idx, mentor_mask) of the chosen slots, in slot order
+    """
+    target = 0
+    # Most preferred slot of each distinct mask, with its rank in the input
+    preferred = {}
+    for slot_idx, mask in slot_masks:
+        if mask:
+            target |= mask
+            preferred.setdefault(mask, (len(preferred), slot_idx))
+
+    if not target:
+        return []
+
+    # A mask contained in another one never helps a minimum cover
+    masks = [m for m in preferred if not any(m != other and m & other == m for other in preferred)]
+    candidates = sorted(preferred[m] + (m,) for m in masks)
+
+    if count_bits(target) > EXACT_COVER_MAX_MENTORS:
+        return _greedy_cover(candidates, target)
+
+    parents = {0: None}
+    frontier = [0]
+    while target not in parents:
+        next_frontier = []
+        for state in frontier:
+            for rank, slot_idx, mask in candidates:
+                new_state = state | mask
+                if new_state not in parents:
+                    parents[new_state] = (state, slot_idx, mask)
+                    next_frontier.append(new_state)
+        frontier = next_frontier
+
+    cover = []
+    state = target
+    while parents[state] is not None:
+        state, slot_idx, mask = parents[state]
+        cover.append((slot_idx, mask))
+
+    return sorted(cover)
+
+def assign_cover(cover):
+    """
+    Assign each mentor to the first slot of a cover that contains them.
+
+    Returns:
+        List of (slot_idx, mentor_mask) with disjoint masks, in slot order
+    """
+    assigned = 0
+    sessions = []
+    for slot_idx, mask in cover:
+        mask &= ~assigned
+        if mask:
+            sessions.append((slot_idx, mask))
+            assigned |= mask
+    return sessions
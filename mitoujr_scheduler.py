@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Single entry point for the scheduler and its helper scripts.
+
+    python mitoujr_scheduler.py <command> [options]
+
+Each command runs the main() of the script it wraps with the remaining
+arguments. Scripts are imported only when their command runs, so commands
+that work with the standard library only (validate, diff, ics, status,
+store) start without loading pandas or numpy.
+"""
+
+import importlib
+import sys
+
+# command: (module, description)
+COMMANDS = {
+    'schedule': ('interview_scheduler', 'Schedule interviews from availability and preference files'),
+    'analyze': ('feasibility', 'Report scheduling bottlenecks before solving'),
+    'cancel': ('replace_interview', 'Move a cancelled interview to a backup slot without solving again'),
+    'validate': ('validate_schedule', 'Check a schedule against availability and preferences'),
+    'diff': ('schedule_diff', 'List the interviews that moved between two schedules'),
+    'ics': ('ics_export', 'Export a schedule to iCalendar files'),
+    'xlsx': ('xlsx_export', 'Export a schedule to an Excel workbook with one sheet per mentor'),
+    'status': (None, 'Print a short summary of a schedule file'),
+    'store': ('schedule_store', 'Query a SQLite cohort store'),
+    'mentor-availability': ('create_mentor_availability', 'Convert the mentor Google Form export'),
+    'proposer-availability': ('create_proposer_availability', 'Convert the proposer Google Form export'),
+    'batch-proposer-availability': ('batch_create_proposer_availability', 'Convert and merge several proposer exports'),
+    'mentor-preferences': ('create_mentor_preferences', 'Convert the mentor preferences Google Form export'),
+    'generate': ('generate_test_data', 'Generate test data'),
+    'check': ('scheduler_checks', 'Check scheduler invariants and runtime and memory limits'),
+}
+
+PROG = 'mitoujr-scheduler'
+
+def print_usage(file=sys.stdout):
+    print(f"usage: {PROG} <command> [options]\n\ncommands:", file=file)
+    for command, (_, description) in COMMANDS.items():
+        print(f"  {command:<29}{description}", file=file)
+    print(f"\nRun '{PROG} <command> --help' for the options of a command.", file=file)
+
+def status_main():
+    """Summarize a complete_schedule.csv without loading pandas."""
+    import argparse
+    from schedule_io import read_schedule_csv, load_preferences_csv
+
+    parser = argparse.ArgumentParser(prog=f'{PROG} status', description='Print a short summary of a schedule file.')
+    parser.add_argument('--schedule-file', required=True, help='complete_schedule.csv produced by the scheduler')
+    parser.add_argument('--preference-file', help='CSV file with mentors\' project preferences (adds the coverage)')
+
+    args = parser.parse_args()
+
+    sessions = interviews = 0
+    mentors = set()
+    projects = set()
+    slots = []
+    for time_slot, project, session_mentors in read_schedule_csv(args.schedule_file):
+        sessions += 1
+        interviews += len(session_mentors)
+        mentors.update(session_mentors)
+        projects.add(project)
+        if not slots or slots[-1] != time_slot:
+            slots.append(time_slot)
+
+    print(f"Sessions: {sessions}")
+    print(f"Interviews: {interviews}")
+    print(f"Mentors: {len(mentors)}")
+    print(f"Projects: {len(projects)}")
+    if slots:
+        print(f"Time slots: {len(set(slots))} ({slots[0]} - {slots[-1]})")
+    if args.preference_file:
+        requested = sum(len(p) for p in load_preferences_csv(args.preference_file).values())
+        coverage = 100.0 * interviews / requested if requested else 100.0
+        print(f"Coverage: {interviews}/{requested} requested interviews ({coverage:.1f}%)")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print_usage()
+        return
+
+    command, args = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"{PROG}: unknown command '{command}'\n", file=sys.stderr)
+        print_usage(sys.stderr)
+        sys.exit(2)
+
+    # The wrapped scripts parse sys.argv themselves
+    sys.argv = [f'{PROG} {command}'] + args
+
+    module_name = COMMANDS[command][0]
+    if module_name is None:
+        status_main()
+    else:
+        importlib.import_module(module_name).main()
+
+if __name__ == "__main__":
+    main()
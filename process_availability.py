@@ -1,7 +1,10 @@
 import pandas as pd
+import logging
 import re
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
 def process_availability_string(available_slots_str, proposer_id, availability_df, time_slots, original_slots, slot_mapping):
     """
     Process an availability string and update the availability DataFrame.
@@ -13,65 +16,73 @@ def process_availability_string(available_slots_str, proposer_id, availability_d
         time_slots: List of hourly time slots
         original_slots: List of original time slots
         slot_mapping: Mapping from original slots to hourly slots
+    
+    Returns:
+        The matching strategy that succeeded ("direct", "comma", "partial" or "regex"), or None
     """
-    print(f"Processing availability for {proposer_id}: {available_slots_str[:100]}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Processing availability for %s: %s...", proposer_id, available_slots_str[:100])
     
-    matched = False
+    match_kind = None
     
     for orig_slot in original_slots:
         if orig_slot in available_slots_str:
-            matched = True
-            print(f"  Direct match found: {orig_slot}")
+            match_kind = "direct"
+            logger.debug("  Direct match found: %s", orig_slot)
             for hourly_slot in slot_mapping[orig_slot]:
                 availability_df.loc[hourly_slot, proposer_id] = True
     
-    if not matched:
+    if not match_kind:
         available_slots = [slot.strip() for slot in available_slots_str.split(',')]
-        print(f"  Trying comma-separated parsing, found {len(available_slots)} slots")
+        logger.debug("  Trying comma-separated parsing, found %d slots", len(available_slots))
         for slot in available_slots:
             for orig_slot in original_slots:
                 if orig_slot == slot:
-                    print(f"  Exact match found: {orig_slot}")
+                    logger.debug("  Exact match found: %s", orig_slot)
                     for hourly_slot in slot_mapping[orig_slot]:
                         availability_df.loc[hourly_slot, proposer_id] = True
-                    matched = True
+                    match_kind = "comma"
                     break
     
-    if not matched:
-        print("  Trying partial matching...")
+    if not match_kind:
+        logger.debug("  Trying partial matching...")
         for orig_slot in original_slots:
             date_part = orig_slot.split(' ')[0]  # e.g., "4/23"
             time_part = orig_slot.split(' ')[1]  # e.g., "夜"
             
             if date_part in available_slots_str and time_part in available_slots_str:
-                print(f"  Partial match found: {orig_slot} (date: {date_part}, time: {time_part})")
+                logger.debug("  Partial match found: %s (date: %s, time: %s)", orig_slot, date_part, time_part)
                 for hourly_slot in slot_mapping[orig_slot]:
                     availability_df.loc[hourly_slot, proposer_id] = True
-                matched = True
+                match_kind = "partial"
     
-    if not matched:
-        print("  Trying regex pattern matching...")
+    if not match_kind:
+        logger.debug("  Trying regex pattern matching...")
         date_pattern = r'(\d+/\d+)'
         dates = re.findall(date_pattern, available_slots_str)
         
         time_indicators = ["午前", "午後", "夜"]
         
         if dates:
-            print(f"  Found dates: {dates}")
+            logger.debug("  Found dates: %s", dates)
             for date in dates:
                 for time_indicator in time_indicators:
                     if time_indicator in available_slots_str:
                         potential_slot = f"{date} {time_indicator}"
-                        print(f"  Constructed potential slot: {potential_slot}")
+                        logger.debug("  Constructed potential slot: %s", potential_slot)
                         
                         for orig_slot in original_slots:
                             if potential_slot in orig_slot:
-                                print(f"  Matched with original slot: {orig_slot}")
+                                logger.debug("  Matched with original slot: %s", orig_slot)
                                 for hourly_slot in slot_mapping[orig_slot]:
                                     availability_df.loc[hourly_slot, proposer_id] = True
-                                matched = True
+                                match_kind = "regex"
+    
+    if not match_kind:
+        logger.debug("No availability matches found for %s", proposer_id)
+    elif logger.isEnabledFor(logging.INFO):
+        num_slots = int(availability_df[proposer_id].sum())
+        logger.info("Successfully marked %d time slots as available for %s (%s match)", num_slots, proposer_id, match_kind,
+                    extra={'proposer_id': proposer_id, 'match': match_kind, 'slots': num_slots})
     
-    if not matched:
-        print(f"  WARNING: No availability matches found for {proposer_id}")
-    else:
-        print(f"  Successfully marked {availability_df[proposer_id].sum()} time slots as available for {proposer_id}")
+    return match_kind
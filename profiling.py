@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-phase profiling of a scheduler run (--profile).
+
+Each phase (load, the solver passes, save) gets its own cProfile profile and
+tracemalloc statistics. The results are written as:
+
+- phases.csv: time, peak traced memory and net allocation of each phase
+- <phase>.prof: pstats files (python -m pstats, snakeviz, ...)
+- profile.collapsed / <phase>.collapsed: collapsed stacks in microseconds,
+  for flamegraph.pl, speedscope or inferno
+- allocations.txt: the source lines that allocated the most memory per phase
+
+cProfile only records caller-callee pairs, so the stacks are reconstructed by
+splitting each function's own time over its callers in proportion to the
+time spent in each call site (like other cProfile flamegraph converters).
+"""
+
+import cProfile
+import contextlib
+import csv
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+
+# Maximum depth of reconstructed stacks
+MAX_STACK_DEPTH = 64
+
+def _frame_label(func):
+    filename, lineno, name = func
+    if filename == '~':
+        # Built-in functions have no source location
+        return name.replace(';', ',')
+    return f"{name} ({os.path.basename(filename)}:{lineno})".replace(';', ',')
+
+def collapse_stats(stats):
+    """
+    Reconstruct collapsed stacks from pstats data.
+
+    Args:
+        stats: pstats.Stats(...).stats, {func: (cc, nc, tt, ct, callers)}
+
+    Returns:
+        {"root;...;func": seconds of own time}
+    """
+    stacks = defaultdict(float)
+    total_time = sum(entry[2] for entry in stats.values())
+    # Shares below this are not split further, which bounds the number of stacks
+    min_share = max(1e-6, total_time * 1e-4)
+
+    def walk(path, share):
+        callers = [(caller, edge) for caller, edge in stats[path[-1]][4].items()
+                   if caller in stats and caller not in path]
+        weights = [edge[3] if isinstance(edge, tuple) else edge for _, edge in callers]
+        total = sum(weights)
+        if not callers or total <= 0 or len(path) >= MAX_STACK_DEPTH or share < min_share:
+            stacks[';'.join(_frame_label(func) for func in reversed(path))] += share
+            return
+        for (caller, _), weight in zip(callers, weights):
+            walk(path + [caller], share * weight / total)
+
+    for func, (_, _, own_time, _, _) in stats.items():
+        if own_time > 0:
+            walk([func], own_time)
+    return stacks
+
+def _file_name(phase):
+    return re.sub(r'[^\w.-]+', '_', phase).strip('_') or 'phase'
+
+class PhaseProfiler:
+    """
+    cProfile and tracemalloc sections of a run.
+
+    Only one phase is active at a time: start() ends the current phase. A
+    phase that is entered again adds to its earlier measurements. Calls from
+    other threads than the one that created the profiler (e.g. solver
+    callbacks) are ignored, since cProfile only profiles its own thread.
+    """
+
+    def __init__(self, top=20, memory=True):
+        """
+        Args:
+            top: Number of allocation sites listed per phase
+            memory: If True, trace allocations with tracemalloc (slower)
+        """
+        self.top = top
+        self.memory = memory
+        self.current = None
+        self.phases = {}
+        self._started = None
+        self._snapshot = None
+        self._traced_before = 0
+        self._thread = threading.get_ident()
+
+    def start(self, phase):
+        """End the current phase (if any) and start measuring phase."""
+        if threading.get_ident() != self._thread:
+            return
+        self.stop()
+        if phase not in self.phases:
+            self.phases[phase] = {'profile': cProfile.Profile(), 'seconds': 0.0, 'peak': 0, 'net': 0,
+                                  'allocations': defaultdict(lambda: [0, 0])}
+        self.current = phase
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._snapshot = self._take_snapshot()
+            self._traced_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+        self.phases[phase]['profile'].enable()
+
+    def stop(self):
+        """End the current phase."""
+        if self.current is None or threading.get_ident() != self._thread:
+            return
+        entry = self.phases[self.current]
+        entry['profile'].disable()
+        entry['seconds'] += time.perf_counter() - self._started
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = self._take_snapshot()
+            entry['peak'] = max(entry['peak'], peak)
+            entry['net'] += current - self._traced_before
+            for stat in snapshot.compare_to(self._snapshot, 'lineno'):
+                if stat.size_diff or stat.count_diff:
+                    allocation = entry['allocations'][str(stat.traceback[0])]
+                    allocation[0] += stat.size_diff
+                    allocation[1] += stat.count_diff
+            self._snapshot = None
+        self.current = None
+
+    @staticmethod
+    def _take_snapshot():
+        # Leave out the allocations of tracemalloc itself
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+    @contextlib.contextmanager
+    def phase(self, phase):
+        """Context manager measuring a block as one phase."""
+        self.start(phase)
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def close(self):
+        """End the current phase and stop tracing allocations."""
+        self.stop()
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def summary(self):
+        """Return [{'Phase', 'Seconds', 'Peak MB', 'Net MB'}] in the order the phases were first entered."""
+        return [{'Phase': phase,
+                 'Seconds': round(entry['seconds'], 3),
+                 'Peak MB': round(entry['peak'] / 2**20, 2) if self.memory else '',
+                 'Net MB': round(entry['net'] / 2**20, 2) if self.memory else ''}
+                for phase, entry in self.phases.items()]
+
+    def save(self, output_dir):
+        """
+        Write the profiles of all phases to output_dir.
+
+        Returns:
+            Path of the combined collapsed stack file
+        """
+        self.close()
+        os.makedirs(output_dir, exist_ok=True)
+
+        with open(os.path.join(output_dir, 'phases.csv'), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['Phase', 'Seconds', 'Peak MB', 'Net MB'], lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(self.summary())
+
+        combined_path = os.path.join(output_dir, 'profile.collapsed')
+        with open(combined_path, 'w', encoding='utf-8') as combined:
+            for phase, entry in self.phases.items():
+                name = _file_name(phase)
+                entry['profile'].dump_stats(os.path.join(output_dir, f'{name}.prof'))
+                try:
+                    stats = pstats.Stats(entry['profile']).stats
+                except TypeError:
+                    # Nothing was recorded in this phase
+                    stats = {}
+                stacks = collapse_stats(stats)
+                with open(os.path.join(output_dir, f'{name}.collapsed'), 'w', encoding='utf-8') as f:
+                    for stack, seconds in sorted(stacks.items()):
+                        microseconds = round(seconds * 1e6)
+                        if microseconds:
+                            f.write(f"{stack} {microseconds}\n")
+                            combined.write(f"{phase.replace(';', ',')};{stack} {microseconds}\n")
+
+        if self.memory:
+            with open(os.path.join(output_dir, 'allocations.txt'), 'w', encoding='utf-8') as f:
+                for phase, entry in self.phases.items():
+                    f.write(f"== {phase}: peak {entry['peak'] / 2**20:.2f} MB, net {entry['net'] / 2**20:+.2f} MB\n")
+                    top = sorted(entry['allocations'].items(), key=lambda item: -abs(item[1][0]))[:self.top]
+                    for location, (size, count) in top:
+                        f.write(f"{size / 1024:+12.1f} KiB {count:+9d} blocks  {location}\n")
+                    f.write("\n")
+
+        return combined_path
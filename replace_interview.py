@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Replace a cancelled interview of a published schedule without solving again.
+
+The interview moves to its best backup slot that is still valid (from
+backup_slots.csv written by interview_scheduler.py --backups, or ranked now),
+and the freed slot goes to the first waitlisted project of the mentor. The
+updated complete_schedule.csv, per-mentor files and backup_slots.csv are
+saved to the output directory.
+
+    python replace_interview.py --proposer-file ... --mentor-file ... --preference-file ... \\
+        --schedule-file schedule_output/complete_schedule.csv --project P001 --mentor Mentor1
+"""
+
+import argparse
+import os
+from interview_scheduler import InterviewScheduler
+from schedule_diff import index_bookings
+from schedule_io import read_schedule_csv, read_backup_csv, load_timezones_csv
+from slot_times import DEFAULT_YEAR, DEFAULT_TIMEZONE
+
+def main():
+    parser = argparse.ArgumentParser(description='Move a cancelled interview to a backup slot and offer the freed slot to the waitlist.')
+    parser.add_argument('--proposer-file', required=True, help='CSV file with proposers\' availability')
+    parser.add_argument('--mentor-file', required=True, help='CSV file with mentors\' availability')
+    parser.add_argument('--preference-file', required=True, help='CSV file with mentors\' project preferences')
+    parser.add_argument('--schedule-file', required=True, help='Published complete_schedule.csv')
+    parser.add_argument('--backup-file', help='backup_slots.csv of the schedule (default: next to the schedule file if it exists, otherwise backups are ranked now)')
+    parser.add_argument('--project', required=True, help='Project ID of the cancelled interview')
+    parser.add_argument('--mentor', required=True, help='Mentor of the cancelled interview')
+    parser.add_argument('--no-show', action='store_true', help='The interview did not take place: only use later slots and do not offer its slot to the waitlist')
+    parser.add_argument('--after', help='Only use slots after this time slot (e.g. the current one)')
+    parser.add_argument('--backups', type=int, default=3, help='Number of backup slots per interview when they are ranked now')
+    parser.add_argument('--max-per-day', type=int, default=None, help='Maximum number of interviews per mentor per day')
+    parser.add_argument('--max-consecutive', type=int, default=None, help='Maximum number of back-to-back interviews per mentor')
+    parser.add_argument('--min-break', type=int, default=1, help='Free slots required between runs of interviews (used with --max-consecutive)')
+    parser.add_argument('--year', type=int, default=DEFAULT_YEAR, help='Year of form window slots, as given to the scheduler')
+    parser.add_argument('--timezone', default=DEFAULT_TIMEZONE, help='IANA time zone of the slot labels, as given to the scheduler')
+    parser.add_argument('--timezone-file', help='CSV file of mentors and projects that answered in their own time zone (name, time zone), as given to the scheduler')
+    parser.add_argument('--interview-minutes', type=int, default=None, help='Interview length the schedule was packed with, as given to the scheduler')
+    parser.add_argument('--buffer-minutes', type=int, default=0, help='Minutes between two interviews with --interview-minutes')
+    parser.add_argument('--output-dir', help='Directory to save the updated schedule files (default: the directory of the schedule file)')
+
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or os.path.dirname(args.schedule_file) or '.'
+    backup_file = args.backup_file
+    if backup_file is None:
+        default_file = os.path.join(os.path.dirname(args.schedule_file), 'backup_slots.csv')
+        backup_file = default_file if os.path.exists(default_file) else None
+
+    scheduler = InterviewScheduler(args.proposer_file, args.mentor_file, args.preference_file)
+    if args.max_per_day is not None or args.max_consecutive is not None:
+        scheduler.set_load_limits(args.max_per_day, args.max_consecutive, args.min_break, balance=False)
+    if args.timezone != DEFAULT_TIMEZONE or args.timezone_file or args.year != DEFAULT_YEAR:
+        entity_timezones = load_timezones_csv(args.timezone_file) if args.timezone_file else None
+        scheduler.set_timezones(args.timezone, entity_timezones, args.year)
+    if args.interview_minutes is not None:
+        scheduler.set_interview_length(args.interview_minutes, args.buffer_minutes)
+
+    bookings = list(read_schedule_csv(args.schedule_file))
+    booked_slot = index_bookings(bookings).get((args.project, args.mentor))
+    if booked_slot is None:
+        parser.error(f"{args.mentor} has no interview with {args.project} in {args.schedule_file}")
+    known = set(scheduler.time_slots)
+    if args.after is not None and args.after not in known:
+        parser.error(f"--after: unknown time slot '{args.after}'")
+    unknown = next((booking.time_slot for booking in bookings if booking.time_slot not in known), None)
+    if unknown is not None:
+        parser.error(f"Unknown time slot '{unknown}' in {args.schedule_file} (pass the --interview-minutes, "
+                     f"--timezone-file, --timezone and --year the schedule was made with)")
+
+    scheduler.set_schedule(bookings)
+    scheduler.reserve_backups(args.backups, read_backup_csv(backup_file) if backup_file else None)
+    after = args.after
+    if args.no_show and (after is None or scheduler.slot_index[after] < scheduler.slot_index[booked_slot]):
+        after = booked_slot
+
+    replacement, waitlisted = scheduler.cancel_interview(args.project, args.mentor, after)
+    scheduler.save_schedule(output_dir)
+
+    if replacement is not None:
+        print(f"Moved {args.project} with {args.mentor}: {booked_slot} -> {replacement}")
+    else:
+        print(f"No valid backup slot for {args.project} with {args.mentor}; the interview is unscheduled")
+    if waitlisted is not None:
+        print(f"Freed slot {booked_slot} given to waitlisted project {waitlisted}")
+    print(f"Updated schedule saved to {output_dir}/")
+
+if __name__ == "__main__":
+    main()
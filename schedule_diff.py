@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import csv
+import os
+from schedule_io import read_schedule_csv
+
+DIFF_COLUMNS = ['Change', 'Project ID', 'Mentor', 'Old Time Slot', 'New Time Slot']
+
+def index_bookings(bookings):
+    """
+    Index a schedule by interview.
+
+    Args:
+        bookings: Iterable of (time_slot, project, mentors)
+
+    Returns:
+        {(project, mentor): time_slot}
+    """
+    index = {}
+    for time_slot, project, mentors in bookings:
+        for mentor in mentors:
+            index[(project, mentor)] = time_slot
+    return index
+
+def diff_schedules(old_bookings, new_bookings):
+    """
+    Compare two schedules interview by interview.
+
+    Both schedules are indexed by (project, mentor) and joined through the hash
+    index, so the diff is linear in the number of bookings.
+
+    Args:
+        old_bookings: Iterable of (time_slot, project, mentors) of the previous schedule
+        new_bookings: Iterable of (time_slot, project, mentors) of the new schedule
+
+    Returns:
+        List of change dictionaries (see DIFF_COLUMNS) with Change "moved", "removed" or "added"
+    """
+    old_index = index_bookings(old_bookings)
+    new_index = index_bookings(new_bookings)
+
+    changes = []
+    for (project, mentor), old_slot in old_index.items():
+        new_slot = new_index.get((project, mentor))
+        if new_slot is None:
+            changes.append({'Change': 'removed', 'Project ID': project, 'Mentor': mentor,
+                            'Old Time Slot': old_slot, 'New Time Slot': ''})
+        elif new_slot != old_slot:
+            changes.append({'Change': 'moved', 'Project ID': project, 'Mentor': mentor,
+                            'Old Time Slot': old_slot, 'New Time Slot': new_slot})
+
+    for (project, mentor), new_slot in new_index.items():
+        if (project, mentor) not in old_index:
+            changes.append({'Change': 'added', 'Project ID': project, 'Mentor': mentor,
+                            'Old Time Slot': '', 'New Time Slot': new_slot})
+
+    return changes
+
+def affected_people(changes):
+    """Return the sorted mentors and projects that have to be notified of a list of changes."""
+    mentors = sorted({change['Mentor'] for change in changes})
+    projects = sorted({change['Project ID'] for change in changes})
+    return mentors, projects
+
+def count_changes(changes):
+    """Return {"moved": n, "added": n, "removed": n} for a list of changes."""
+    counts = {'moved': 0, 'added': 0, 'removed': 0}
+    for change in changes:
+        counts[change['Change']] += 1
+    return counts
+
+def write_changes(changes, output_file):
+    """Write a list of changes to a CSV file."""
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=DIFF_COLUMNS)
+        writer.writeheader()
+        writer.writerows(changes)
+
+def main():
+    parser = argparse.ArgumentParser(description='List the interviews that moved between two schedules.')
+    parser.add_argument('--old-schedule', required=True, help='Previous complete_schedule.csv')
+    parser.add_argument('--new-schedule', required=True, help='New complete_schedule.csv')
+    parser.add_argument('--output-file', default='schedule_changes.csv', help='CSV file to write the changes to')
+
+    args = parser.parse_args()
+
+    changes = diff_schedules(read_schedule_csv(args.old_schedule), read_schedule_csv(args.new_schedule))
+
+    output_dir = os.path.dirname(args.output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    write_changes(changes, args.output_file)
+
+    counts = count_changes(changes)
+    mentors, projects = affected_people(changes)
+    print(f"Changes: {counts['moved']} moved, {counts['added']} added, {counts['removed']} removed")
+    if changes:
+        print(f"Mentors to notify ({len(mentors)}): {', '.join(mentors)}")
+        print(f"Proposers to notify ({len(projects)}): {', '.join(projects)}")
+    print(f"Changes saved to {args.output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import csv
+from collections import namedtuple
+
+TRUE_VALUES = {'1', '1.0', 'true', 'yes'}
+
+SCHEDULE_COLUMNS = ['Time Slot', 'Project ID', 'Mentors']
+BACKUP_COLUMNS = ['Project ID', 'Mentor', 'Rank', 'Time Slot']
+
+# One session of a schedule: a project interviewed by one or more mentors in a time slot
+Booking = namedtuple('Booking', ['time_slot', 'project', 'mentors'])
+
+def read_schedule_csv(schedule_file):
+    """Stream Booking (time_slot, project, mentors) rows from a complete_schedule.csv file."""
+    with open(schedule_file, encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            mentors = [m.strip() for m in row['Mentors'].split(',') if m.strip()]
+            yield Booking(row['Time Slot'], row['Project ID'], mentors)
+
+def read_backup_csv(backup_file):
+    """Load a backup_slots.csv file as {(project, mentor): [time slots in rank order]}."""
+    backups = {}
+    with open(backup_file, encoding='utf-8', newline='') as f:
+        rows = sorted(csv.DictReader(f), key=lambda row: int(row['Rank']))
+    for row in rows:
+        backups.setdefault((row['Project ID'], row['Mentor']), []).append(row['Time Slot'])
+    return backups
+
+def write_csv_rows(file_path, columns, rows):
+    """Write an iterable of row dictionaries to a CSV file one row at a time (same format as DataFrame.to_csv)."""
+    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+
+def write_schedule_csv(bookings, file_path):
+    """Write (time_slot, project, mentors) rows as a complete_schedule.csv file."""
+    write_csv_rows(file_path, SCHEDULE_COLUMNS,
+                   ({'Time Slot': slot, 'Project ID': project, 'Mentors': ', '.join(mentors)}
+                    for slot, project, mentors in bookings))
+
+def load_availability_bitsets(file_path):
+    """
+    Load an availability CSV (time slots as rows, entities as columns) as bitsets.
+    
+    Returns:
+        Tuple of (list of time slots, {entity: int bitset with bit i = available in slot i})
+    """
+    with open(file_path, encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        entities = next(reader)[1:]
+        bits = [0] * len(entities)
+        time_slots = []
+        for slot_idx, row in enumerate(reader):
+            time_slots.append(row[0])
+            slot_bit = 1 << slot_idx
+            for j, value in enumerate(row[1:]):
+                if value.strip().lower() in TRUE_VALUES:
+                    bits[j] |= slot_bit
+    
+    return time_slots, dict(zip(entities, bits))
+
+def load_preferences_csv(file_path):
+    """Load a mentor preferences CSV as {mentor: [projects]}."""
+    preferences = {}
+    with open(file_path, encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row in reader:
+            if row and row[0]:
+                preferences[row[0]] = [project for project in row[1:] if project.strip()]
+    return preferences
+
+def load_timezones_csv(file_path):
+    """
+    Load a CSV of people who answered in their own time zone as {name: IANA time zone}.
+    
+    The first column is a mentor name or project ID and the second a time zone
+    such as "Europe/Berlin"; the first row is a header.
+    """
+    timezones = {}
+    with open(file_path, encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row in reader:
+            if len(row) >= 2 and row[0].strip() and row[1].strip():
+                timezones[row[0].strip()] = row[1].strip()
+    return timezones
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Optional SQLite store for a selection cohort.
+
+One database file holds the time slots, the availability of mentors and
+proposers (one bitset per entity, bit i = slot_idx i), the mentor preferences
+and the booked interviews. The converters and the scheduler read and write
+single rows, so updating one mentor or querying one mentor's schedule does not
+rewrite or load the whole cohort. Only the standard library is needed.
+"""
+
+import argparse
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS slots (
+    slot_idx INTEGER PRIMARY KEY,
+    label TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS entities (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    availability BLOB NOT NULL,
+    PRIMARY KEY (kind, name)
+);
+CREATE TABLE IF NOT EXISTS preferences (
+    mentor TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    PRIMARY KEY (mentor, rank)
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    project TEXT NOT NULL,
+    mentor TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    PRIMARY KEY (project, mentor, slot)
+);
+CREATE INDEX IF NOT EXISTS bookings_mentor_slot ON bookings (mentor, slot);
+CREATE INDEX IF NOT EXISTS bookings_project ON bookings (project);
+"""
+
+# Entity kinds in the entities table
+MENTOR = 'mentor'
+PROPOSER = 'proposer'
+
+def _to_blob(bits):
+    return bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+
+def _from_blob(blob):
+    return int.from_bytes(blob, 'little')
+
+class ScheduleStore:
+    """SQLite database of one cohort (a local file, or ":memory:")."""
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self.conn.commit()
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def commit(self):
+        self.conn.commit()
+
+    def time_slots(self):
+        """Return all time slot labels in slot order."""
+        return [label for (label,) in self.conn.execute("SELECT label FROM slots ORDER BY slot_idx")]
+
+    def _slot_indices(self, labels):
+        """Return the slot_idx of each label, adding unknown labels after the existing slots."""
+        known = dict(self.conn.execute("SELECT label, slot_idx FROM slots"))
+        next_idx = max(known.values(), default=-1) + 1
+        for label in labels:
+            if label not in known:
+                known[label] = next_idx
+                self.conn.execute("INSERT INTO slots (slot_idx, label) VALUES (?, ?)", (next_idx, label))
+                next_idx += 1
+        return [known[label] for label in labels]
+
+    def write_availability(self, kind, time_slots, availability, replace=False):
+        """
+        Insert or replace the availability of some entities.
+
+        Args:
+            kind: MENTOR or PROPOSER
+            time_slots: Slot labels the bitsets refer to (bit i = time_slots[i])
+            availability: {entity: int bitset}
+            replace: If True, availability holds all entities of the kind; the others
+                are deleted with their preferences and bookings
+        """
+        if replace:
+            self._delete_missing(kind, availability)
+        positions = self._slot_indices(time_slots)
+        identity = positions == list(range(len(positions)))
+        rows = []
+        for name, bits in availability.items():
+            if not identity:
+                stored = 0
+                for i, position in enumerate(positions):
+                    if (bits >> i) & 1:
+                        stored |= 1 << position
+                bits = stored
+            rows.append((kind, name, _to_blob(bits)))
+        self.conn.executemany("INSERT OR REPLACE INTO entities (kind, name, availability) VALUES (?, ?, ?)", rows)
+
+    def write_availability_frame(self, kind, availability_df, replace=True):
+        """Store an availability DataFrame (time slots as rows, entities as columns), by default replacing all entities of the kind."""
+        time_slots = [str(slot) for slot in availability_df.index]
+        availability = {}
+        for name in availability_df.columns:
+            bits = 0
+            for i, value in enumerate(availability_df[name].tolist()):
+                if value:
+                    bits |= 1 << i
+            availability[str(name)] = bits
+        self.write_availability(kind, time_slots, availability, replace)
+
+    def read_availability(self, kind):
+        """
+        Return the availability of all entities of a kind.
+
+        Returns:
+            Tuple of (list of time slots, {entity: int bitset with bit i = time_slots[i]})
+        """
+        time_slots = self.time_slots()
+        rows = self.conn.execute("SELECT name, availability FROM entities WHERE kind = ? ORDER BY rowid", (kind,))
+        return time_slots, {name: _from_blob(blob) for name, blob in rows}
+
+    def delete_entity(self, kind, name):
+        """Remove a mentor or proposer together with their preferences and bookings."""
+        self.conn.execute("DELETE FROM entities WHERE kind = ? AND name = ?", (kind, name))
+        column = 'mentor' if kind == MENTOR else 'project'
+        self.conn.execute(f"DELETE FROM bookings WHERE {column} = ?", (name,))
+        if kind == MENTOR:
+            self.conn.execute("DELETE FROM preferences WHERE mentor = ?", (name,))
+        else:
+            self.conn.execute("DELETE FROM preferences WHERE project = ?", (name,))
+
+    def _delete_missing(self, kind, names):
+        stored = [name for (name,) in self.conn.execute("SELECT name FROM entities WHERE kind = ?", (kind,))]
+        for name in stored:
+            if name not in names:
+                self.delete_entity(kind, name)
+
+    def write_preferences(self, preferences, replace=False):
+        """
+        Insert or replace the preferences of some mentors.
+
+        A mentor keeps their position in the mentor order when their preferences
+        are replaced; new mentors are added at the end.
+
+        Args:
+            preferences: {mentor: [projects]}
+            replace: If True, preferences holds all mentors; the preferences of
+                the others are deleted
+        """
+        if replace:
+            stored = [mentor for (mentor,) in self.conn.execute("SELECT DISTINCT mentor FROM preferences")]
+            self.conn.executemany("DELETE FROM preferences WHERE mentor = ?",
+                                  [(mentor,) for mentor in stored if mentor not in preferences])
+        positions = dict(self.conn.execute("SELECT mentor, MIN(position) FROM preferences GROUP BY mentor"))
+        next_position = max(positions.values(), default=-1) + 1
+        for mentor, projects in preferences.items():
+            position = positions.get(mentor)
+            if position is None:
+                position = next_position
+                next_position += 1
+            self.conn.execute("DELETE FROM preferences WHERE mentor = ?", (mentor,))
+            self.conn.executemany(
+                "INSERT INTO preferences (mentor, position, rank, project) VALUES (?, ?, ?, ?)",
+                [(mentor, position, rank, project) for rank, project in enumerate(projects)])
+
+    def read_preferences(self):
+        """Return {mentor: [projects]} in mentor and preference order."""
+        preferences = {}
+        for mentor, project in self.conn.execute("SELECT mentor, project FROM preferences ORDER BY position, rank"):
+            preferences.setdefault(mentor, []).append(project)
+        return preferences
+
+    def write_bookings(self, bookings, replace=True):
+        """
+        Store booked interviews.
+
+        Args:
+            bookings: Iterable of (time_slot, project, mentors)
+            replace: If True, the stored schedule is replaced; otherwise the bookings
+                are added (e.g. those of another selection round)
+        """
+        if replace:
+            self.conn.execute("DELETE FROM bookings")
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO bookings (project, mentor, slot) VALUES (?, ?, ?)",
+            ((project, mentor, slot) for slot, project, mentors in bookings for mentor in mentors))
+
+    def cancel_booking(self, project, mentor, slot=None):
+        """Remove an interview from the stored schedule (in every slot it is booked, unless slot is given)."""
+        if slot is None:
+            self.conn.execute("DELETE FROM bookings WHERE project = ? AND mentor = ?", (project, mentor))
+        else:
+            self.conn.execute("DELETE FROM bookings WHERE project = ? AND mentor = ? AND slot = ?", (project, mentor, slot))
+
+    def read_bookings(self, project=None):
+        """
+        Yield (time_slot, project, mentors) of the stored schedule in slot order.
+
+        Args:
+            project: Only return the sessions of this project
+        """
+        query = ("SELECT b.slot, b.project, b.mentor FROM bookings b LEFT JOIN slots s ON s.label = b.slot"
+                 + (" WHERE b.project = ?" if project is not None else "")
+                 + " ORDER BY s.slot_idx, b.slot, b.project, b.rowid")
+        current = None
+        mentors = []
+        for slot, session_project, mentor in self.conn.execute(query, () if project is None else (project,)):
+            if (slot, session_project) != current:
+                if current is not None:
+                    yield current[0], current[1], mentors
+                current = (slot, session_project)
+                mentors = []
+            mentors.append(mentor)
+        if current is not None:
+            yield current[0], current[1], mentors
+
+    def mentor_schedule(self, mentor):
+        """Return [(time_slot, project)] of one mentor in slot order (uses the (mentor, slot) index)."""
+        return self.conn.execute(
+            "SELECT b.slot, b.project FROM bookings b LEFT JOIN slots s ON s.label = b.slot"
+            " WHERE b.mentor = ? ORDER BY s.slot_idx", (mentor,)).fetchall()
+
+    def counts(self):
+        """Return the number of slots, mentors, proposers, requested interviews and booked interviews."""
+        count = lambda query, *params: self.conn.execute(query, params).fetchone()[0]
+        return {
+            'Time Slots': count("SELECT COUNT(*) FROM slots"),
+            'Mentors': count("SELECT COUNT(*) FROM entities WHERE kind = ?", MENTOR),
+            'Proposers': count("SELECT COUNT(*) FROM entities WHERE kind = ?", PROPOSER),
+            'Requested Interviews': count("SELECT COUNT(*) FROM preferences"),
+            'Booked Interviews': count("SELECT COUNT(*) FROM bookings"),
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Query a SQLite cohort store.')
+    parser.add_argument('--db', required=True, help='SQLite database file')
+    parser.add_argument('--mentor', help='Print the schedule of one mentor')
+    parser.add_argument('--project', help='Print the interviews of one project')
+
+    args = parser.parse_args()
+
+    with ScheduleStore(args.db) as store:
+        if args.mentor:
+            for slot, project in store.mentor_schedule(args.mentor):
+                print(f"{slot}\t{project}")
+        elif args.project:
+            for slot, project, mentors in store.read_bookings(args.project):
+                print(f"{slot}\t{', '.join(mentors)}")
+        else:
+            for key, value in store.counts().items():
+                print(f"{key}: {value}")
+
+if __name__ == "__main__":
+    main()
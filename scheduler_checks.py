@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Regression checks for the scheduler and its solvers.
+
+Property checks run every engine on many small generated cohorts and check
+the invariants of each schedule: no errors from validate() (no mentor
+double-booking, every booking inside both availabilities, only requested
+interviews, each at most once), the load limits and the mentor cap hold,
+and no engine schedules fewer interviews than the greedy baseline: per
+cohort for the engines that start from it or reproduce it (cpsat with its
+warm start, decompose), and over all cohorts for the other heuristics,
+which win on some cohorts and lose on others.
+
+Scale checks run fixed seeded cohorts and fail when the runtime or the peak
+memory (traced Python and numpy allocations) of solving and saving the
+schedule exceeds the limits stored in scheduler_thresholds.json. The limits
+are ratios to a small reference cohort measured in the same run, so they
+hold on faster and slower machines alike.
+
+The property checks also run as tests (tests/test_scheduler_properties.py).
+
+    python scheduler_checks.py                      # all checks, exit code 1 on failure
+    python scheduler_checks.py --skip-scale --seeds 200
+    python scheduler_checks.py --update-thresholds  # after an intended change
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from generate_test_data import generate_cohort, AVAILABILITY_PATTERNS
+from interview_scheduler import InterviewScheduler
+from solvers import get_solver
+from validate_schedule import summarize_violations
+
+THRESHOLDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scheduler_thresholds.json')
+
+# Engines that are different heuristics, compared with greedy over all cohorts
+# rather than per cohort, and the share of the greedy total they must reach
+HEURISTIC_ENGINES = {'lazy'}
+HEURISTIC_COVERAGE = 0.99
+
+# Headroom given to the measured ratios by --update-thresholds
+TIME_MARGIN = 3.0
+MEMORY_MARGIN = 1.5
+
+# Runs per case; the fastest is compared, which filters out timer noise
+TIME_REPEATS = 3
+
+def make_scheduler(num_proposers, num_mentors, seed, pattern='uniform'):
+    """Create a scheduler for a generated cohort (the same data as generate_test_data.py --seed)."""
+    proposers, mentors, preferences = generate_cohort(num_proposers, num_mentors, seed, pattern, pattern)
+    return InterviewScheduler.from_data(proposers, mentors,
+                                        {mentor: list(row) for mentor, row in zip(preferences.index, preferences.to_numpy())})
+
+def get_engines(cpsat_time_limit=2.0):
+    """Return {name: function(scheduler)} of the engines to check, greedy first (cpsat if installed and a time limit is given)."""
+    engines = {
+        'greedy': lambda scheduler: scheduler.schedule_interviews(get_solver('greedy')),
+        'lazy': lambda scheduler: scheduler.schedule_interviews(get_solver('lazy')),
+        'decompose': lambda scheduler: scheduler.schedule_components(get_solver('greedy'), max_workers=1),
+    }
+    if cpsat_time_limit and importlib.util.find_spec('ortools') is not None:
+        engines['cpsat'] = lambda scheduler: scheduler.schedule_interviews(
+            get_solver('cpsat', time_limit=cpsat_time_limit, num_workers=1))
+    return engines
+
+def property_case(seed):
+    """Return the cohort size, availability pattern and limits checked for one seed."""
+    rng = random.Random(seed)
+    case = {
+        'seed': seed,
+        'proposers': rng.randint(8, 60),
+        'mentors': rng.randint(2, 10),
+        'pattern': rng.choice(AVAILABILITY_PATTERNS),
+        'max_per_day': None,
+        'max_consecutive': None,
+        'max_mentors_per_project': None,
+    }
+    if seed % 3 == 1:
+        case['max_per_day'] = rng.randint(1, 3)
+    elif seed % 3 == 2:
+        case['max_consecutive'] = rng.randint(1, 2)
+    if seed % 4 == 3:
+        case['max_mentors_per_project'] = rng.randint(1, 2)
+    return case
+
+def count_interviews(scheduler):
+    return sum(len(mentors) for mentors in scheduler.schedule.values())
+
+def check_schedule(scheduler, case):
+    """
+    Check the invariants of a solved schedule.
+
+    Returns:
+        List of failure messages (empty if the schedule is valid)
+    """
+    failures = []
+    for (severity, check), count in sorted(summarize_violations(scheduler.validate()).items()):
+        if severity == 'error':
+            failures.append(f"{count} {check}")
+
+    load = scheduler.get_mentor_load()
+    if case['max_per_day'] is not None and load['Max Per Day'].max() > case['max_per_day']:
+        failures.append(f"{load['Max Per Day'].max()} interviews per day (limit {case['max_per_day']})")
+    if case['max_consecutive'] is not None and load['Longest Run'].max() > case['max_consecutive']:
+        failures.append(f"{load['Longest Run'].max()} back-to-back interviews (limit {case['max_consecutive']})")
+
+    if case['max_mentors_per_project'] is not None:
+        per_project = {}
+        for (project, _), mentors in scheduler.schedule.items():
+            per_project[project] = per_project.get(project, 0) + len(mentors)
+        if max(per_project.values(), default=0) > case['max_mentors_per_project']:
+            failures.append(f"{max(per_project.values())} mentors for one project (cap {case['max_mentors_per_project']})")
+
+    return failures
+
+def run_property_case(seed, engines):
+    """
+    Run every engine on the generated cohort of one seed and check the schedules.
+
+    Returns:
+        Tuple of ({engine: interviews}, list of failure messages)
+    """
+    case = property_case(seed)
+    base = make_scheduler(case['proposers'], case['mentors'], seed, case['pattern'])
+    if case['max_per_day'] is not None or case['max_consecutive'] is not None:
+        base.set_load_limits(case['max_per_day'], case['max_consecutive'], balance=seed % 2 == 0)
+    base.max_mentors_per_project = case['max_mentors_per_project']
+
+    failures = []
+    results = {}
+    for name, run in engines.items():
+        scheduler = base.fork()
+        run(scheduler)
+        results[name] = scheduler
+        label = f"seed {seed} {name} ({case['proposers']}x{case['mentors']} {case['pattern']})"
+        failures.extend(f"{label}: {failure}" for failure in check_schedule(scheduler, case))
+
+        greedy = results['greedy']
+        if name not in HEURISTIC_ENGINES and count_interviews(scheduler) < count_interviews(greedy):
+            failures.append(f"{label}: {count_interviews(scheduler)} interviews, "
+                            f"fewer than greedy ({count_interviews(greedy)})")
+        if name == 'decompose' and scheduler.schedule != greedy.schedule:
+            failures.append(f"{label}: schedule differs from greedy without decomposition")
+
+    return {name: count_interviews(scheduler) for name, scheduler in results.items()}, failures
+
+def check_heuristic_totals(totals):
+    """Compare the interviews of the heuristic engines over all cohorts with greedy; return failure messages."""
+    failures = []
+    for name in HEURISTIC_ENGINES & set(totals):
+        if totals[name] < HEURISTIC_COVERAGE * totals['greedy']:
+            failures.append(f"{name}: {totals[name]} interviews over all cohorts, "
+                            f"fewer than {HEURISTIC_COVERAGE:.0%} of greedy ({totals['greedy']})")
+    return failures
+
+def run_property_checks(num_seeds, engines, verbose=False):
+    """
+    Run every engine on num_seeds generated cohorts and check their schedules.
+
+    Returns:
+        List of failure messages
+    """
+    failures = []
+    totals = {name: 0 for name in engines}
+    for seed in range(num_seeds):
+        counts, case_failures = run_property_case(seed, engines)
+        failures.extend(case_failures)
+        for name, count in counts.items():
+            totals[name] += count
+        if verbose:
+            print(f"seed {seed}: " + ", ".join(f"{name} {count}" for name, count in counts.items()))
+
+    return failures + check_heuristic_totals(totals)
+
+def measure_case(case):
+    """
+    Solve one scale case and save its schedule files (to a temporary directory).
+
+    The runtime (the fastest of TIME_REPEATS runs) is measured without
+    tracing, then the peak memory in another run with tracemalloc, which
+    would slow the timed runs down.
+
+    Returns:
+        Tuple of (seconds, peak MB, interviews)
+    """
+    base = make_scheduler(case['proposers'], case['mentors'], case['seed'], case.get('pattern', 'uniform'))
+    if case.get('max_per_day') is not None:
+        base.set_load_limits(case['max_per_day'], balance=False)
+
+    def solve():
+        scheduler = base.fork()
+        scheduler.schedule_interviews(get_solver(case['solver']))
+        with tempfile.TemporaryDirectory() as output_dir:
+            scheduler.save_schedule(output_dir)
+        return scheduler
+
+    seconds = None
+    for _ in range(TIME_REPEATS):
+        start = time.perf_counter()
+        scheduler = solve()
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    tracemalloc.start()
+    try:
+        solve()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return seconds, peak / 2**20, count_interviews(scheduler)
+
+def run_scale_checks(thresholds, update=False):
+    """
+    Measure every scale case and compare it with its limits.
+
+    The runtime and peak memory of each case are divided by those of the
+    reference cohort measured on the same machine, and the ratios are compared.
+
+    Args:
+        thresholds: {'reference': case dictionary, 'cases': [case dictionaries]}
+            as stored in scheduler_thresholds.json
+        update: If True, store the measured ratios (with headroom) instead of comparing
+
+    Returns:
+        List of failure messages
+    """
+    reference_seconds, reference_mb, _ = measure_case(thresholds['reference'])
+    print(f"Reference {thresholds['reference']['name']}: {reference_seconds:.3f} s, {reference_mb:.2f} MB peak")
+
+    failures = []
+    for case in thresholds['cases']:
+        seconds, peak_mb, interviews = measure_case(case)
+        time_ratio = seconds / reference_seconds
+        memory_ratio = peak_mb / reference_mb
+        print(f"{case['name']}: {seconds:.2f} s, x{time_ratio:.1f} (limit x{case.get('max_time_ratio')}), "
+              f"{peak_mb:.1f} MB peak, x{memory_ratio:.1f} (limit x{case.get('max_memory_ratio')}), {interviews} interviews")
+
+        if update:
+            case['max_time_ratio'] = round(time_ratio * TIME_MARGIN, 1)
+            case['max_memory_ratio'] = round(memory_ratio * MEMORY_MARGIN, 1)
+            case['min_interviews'] = interviews
+            continue
+        if time_ratio > case['max_time_ratio']:
+            failures.append(f"{case['name']}: {time_ratio:.1f} times the reference runtime exceeds x{case['max_time_ratio']}")
+        if memory_ratio > case['max_memory_ratio']:
+            failures.append(f"{case['name']}: {memory_ratio:.1f} times the reference peak memory exceeds x{case['max_memory_ratio']}")
+        if interviews < case['min_interviews']:
+            failures.append(f"{case['name']}: {interviews} interviews, fewer than {case['min_interviews']}")
+
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description='Check scheduler invariants on generated cohorts and runtime and memory at scale.')
+    parser.add_argument('--seeds', type=int, default=60, help='Number of generated cohorts for the property checks')
+    parser.add_argument('--thresholds', default=THRESHOLDS_FILE, help='JSON file with the scale cases and their limits')
+    parser.add_argument('--skip-properties', action='store_true', help='Only run the scale checks')
+    parser.add_argument('--skip-scale', action='store_true', help='Only run the property checks')
+    parser.add_argument('--cpsat-time-limit', type=float, default=2.0, help='Time limit per cohort for the cpsat solver (checked when OR-Tools is installed; 0 skips it)')
+    parser.add_argument('--update-thresholds', action='store_true', help='Store the measured runtime and memory ratios (with headroom) as the new limits')
+    parser.add_argument('--verbose', action='store_true', help='Print the interviews scheduled by each engine per cohort')
+
+    args = parser.parse_args()
+
+    failures = []
+    if not args.skip_properties:
+        engines = get_engines(args.cpsat_time_limit)
+        property_failures = run_property_checks(args.seeds, engines, args.verbose)
+        print(f"Property checks: {args.seeds} cohorts x {len(engines)} engines ({', '.join(engines)}), "
+              f"{len(property_failures)} failures")
+        failures.extend(property_failures)
+
+    if not args.skip_scale:
+        with open(args.thresholds, encoding='utf-8') as f:
+            thresholds = json.load(f)
+        scale_failures = run_scale_checks(thresholds, args.update_thresholds)
+        if args.update_thresholds:
+            with open(args.thresholds, 'w', encoding='utf-8') as f:
+                json.dump(thresholds, f, indent=2)
+                f.write('\n')
+            print(f"Thresholds updated in {args.thresholds}")
+        print(f"Scale checks: {len(thresholds['cases'])} cases, {len(scale_failures)} failures")
+        failures.extend(scale_failures)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
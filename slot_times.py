@@ -0,0 +1,160 @@
+import re
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+# Year of the form windows, which only carry month and day
+DEFAULT_YEAR = 2024
+
+# Time zone the slot labels are written in, unless set per mentor or proposer
+DEFAULT_TIMEZONE = "Asia/Tokyo"
+
+HOURLY_SLOT_FORMAT = "%Y/%m/%d %I:%M %p"
+WINDOW_PATTERN = re.compile(r'(\d+)/(\d+)\s+[^\(]+\((\d+):(\d+)\s*-\s*(\d+):(\d+)\)')
+# Interview slots packed into the windows (see pack_intervals): "2024/04/23 07:00 PM - 07:30 PM"
+INTERVAL_SLOT_PATTERN = re.compile(r'(\d{4}/\d{2}/\d{2}) (\d{2}:\d{2} [AP]M) - (\d{2}:\d{2} [AP]M)$')
+
+def slot_datetimes(time_slot, year=DEFAULT_YEAR):
+    """
+    Return the start and end of a time slot as naive local datetimes.
+    
+    Handles hourly slots ("2024/04/23 07:00 PM", one hour long), form windows
+    ("4/23 夜 (19:00 - 21:00)") and packed interview slots ("2024/04/23 07:00 PM
+    - 07:30 PM"). Unknown formats return (None, None).
+    
+    Args:
+        time_slot: Time slot label
+        year: Year of form windows
+    """
+    try:
+        start = datetime.strptime(time_slot, HOURLY_SLOT_FORMAT)
+        return start, start + timedelta(hours=1)
+    except ValueError:
+        pass
+    
+    match = INTERVAL_SLOT_PATTERN.match(time_slot)
+    if match:
+        date, start_time, end_time = match.groups()
+        start = datetime.strptime(f"{date} {start_time}", HOURLY_SLOT_FORMAT)
+        end = datetime.strptime(f"{date} {end_time}", HOURLY_SLOT_FORMAT)
+        # An interview ending after midnight
+        return start, end if end > start else end + timedelta(days=1)
+    
+    match = WINDOW_PATTERN.match(time_slot)
+    if not match:
+        return None, None
+    
+    month, day, start_hour, start_minute, end_hour, end_minute = map(int, match.groups())
+    return (datetime(year, month, day, start_hour, start_minute),
+            datetime(year, month, day, end_hour, end_minute))
+
+def split_into_hourly_slots(time_slot, year=DEFAULT_YEAR):
+    """
+    Split a form window into hourly slots.
+    
+    Example: "4/23 夜 (19:00 - 21:00)" -> ["2024/04/23 07:00 PM", "2024/04/23 08:00 PM"]
+    """
+    match = WINDOW_PATTERN.match(time_slot)
+    if not match:
+        return []
+    
+    start, end = slot_datetimes(time_slot, year)
+    
+    hourly_slots = []
+    current_time = start
+    while current_time < end:
+        hourly_slots.append(current_time.strftime(HOURLY_SLOT_FORMAT))
+        current_time += timedelta(hours=1)
+    
+    return hourly_slots
+
+def slot_epoch_minutes(time_slot, year=DEFAULT_YEAR, tz=DEFAULT_TIMEZONE):
+    """
+    Return the start and end of a time slot as UTC epoch minutes.
+    
+    Args:
+        time_slot: Time slot label, read as local time in tz
+        year: Year of form windows
+        tz: IANA time zone name of the label (e.g. "Asia/Tokyo")
+    
+    Returns:
+        Tuple of (start, end) integers, or (None, None) for unknown formats
+    """
+    start, end = slot_datetimes(time_slot, year)
+    if start is None:
+        return None, None
+    
+    zone = ZoneInfo(tz)
+    return (int(start.replace(tzinfo=zone).timestamp()) // 60,
+            int(end.replace(tzinfo=zone).timestamp()) // 60)
+
+def epoch_minute_datetime(minute, tz=None):
+    """Convert a UTC epoch minute into an aware datetime (in UTC, or in the time zone tz)."""
+    moment = datetime.fromtimestamp(minute * 60, timezone.utc)
+    return moment.astimezone(ZoneInfo(tz)) if tz else moment
+
+def format_local_slot(start, tz):
+    """Render the start of a slot in a time zone, e.g. "2024/04/23 12:00 PM CEST"."""
+    return epoch_minute_datetime(start, tz).strftime(HOURLY_SLOT_FORMAT + " %Z")
+
+def format_interval_slot(start, end, tz=DEFAULT_TIMEZONE):
+    """Label an interview slot from UTC epoch minutes in a time zone, e.g. "2024/04/23 07:00 PM - 07:30 PM"."""
+    return (epoch_minute_datetime(start, tz).strftime(HOURLY_SLOT_FORMAT) + " - "
+            + epoch_minute_datetime(end, tz).strftime("%I:%M %p"))
+
+def pack_intervals(intervals, length, buffer=0):
+    """
+    Lay out back-to-back interviews of a fixed length in a union of intervals.
+    
+    A sweep over the intervals sorted by start merges overlapping and adjacent
+    ones (consecutive hourly slots, or windows such as 午後 (13:00 - 17:00) and
+    夕方 (16:00 - 18:00)) into free stretches. Each stretch then holds as many
+    interviews as fit from its start, separated by buffer minutes, so no two
+    interview slots overlap.
+    
+    Args:
+        intervals: Iterable of (start, end) epoch minutes (None for unknown slots)
+        length: Interview length in minutes
+        buffer: Minutes between two interviews
+    
+    Returns:
+        Sorted list of (start, end) epoch minutes of the interview slots
+    """
+    packed = []
+    stretch = None
+    for start, end in sorted(interval for interval in intervals if interval[0] is not None) + [(None, None)]:
+        if stretch is not None and start is not None and start <= stretch[1]:
+            stretch[1] = max(stretch[1], end)
+            continue
+        if stretch is not None:
+            slot_start = stretch[0]
+            while slot_start + length <= stretch[1]:
+                packed.append((slot_start, slot_start + length))
+                slot_start += length + buffer
+        stretch = [start, end]
+    return packed
+
+def covered_slots(slot_minutes, intervals):
+    """
+    Return the indices of the slots that lie completely inside a union of intervals.
+    
+    Args:
+        slot_minutes: List of (start, end) epoch minutes per slot (None for unknown slots)
+        intervals: Iterable of (start, end) epoch minutes, e.g. available slots in another time zone
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    
+    starts = [interval[0] for interval in merged]
+    covered = []
+    for i, (start, end) in enumerate(slot_minutes):
+        if start is None:
+            continue
+        k = bisect_right(starts, start) - 1
+        if k >= 0 and end <= merged[k][1]:
+            covered.append(i)
+    return covered
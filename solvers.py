@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Scheduling backends for InterviewScheduler.
+
+A solver receives a scheduler whose indexes are built (slot index, availability
+and booked-slot bitsets) and books interviews through scheduler._book(). It
+returns a dictionary of statistics.
+
+Between units of work a solver calls scheduler._checkpoint(phase, done, total),
+which reports progress and returns True when the solve has to stop (deadline
+or cancellation); the solver then returns with the interviews booked so far.
+"""
+
+import heapq
+import itertools
+import time
+from collections import Counter
+import numpy as np
+
+def _bit_matrix(bitsets, num_slots):
+    """Unpack int slot bitsets into a (num_slots, len(bitsets)) matrix of 0/1."""
+    num_bytes = (num_slots + 7) // 8
+    packed = np.frombuffer(b''.join(bits.to_bytes(num_bytes, 'little') for bits in bitsets), dtype=np.uint8)
+    return np.unpackbits(packed.reshape(len(bitsets), num_bytes), axis=1, bitorder='little')[:, :num_slots].T
+
+class Solver:
+    """Base class of the scheduling backends."""
+
+    name = None
+
+    def solve(self, scheduler):
+        """Book interviews on the scheduler and return a dictionary of statistics."""
+        raise NotImplementedError
+
+class GreedySolver(Solver):
+    """
+    The original three-pass greedy heuristic.
+
+    The algorithm prioritizes:
+    1. Scheduling interviews where multiple mentors want to interview the same project
+    2. Scheduling consecutive interviews for mentors
+    3. Using earlier time slots
+    """
+
+    name = 'greedy'
+
+    def solve(self, scheduler):
+        start = time.perf_counter()
+        self._run_passes(scheduler)
+        return {'solver': self.name, 'seconds': round(time.perf_counter() - start, 3)}
+
+    def _run_passes(self, scheduler):
+        # Interviews of a baseline schedule that are still valid stay where they were
+        scheduler._book_baseline()
+        mentor_to_projects, project_to_mentors = scheduler._get_interview_requests()
+        
+        # Sort projects by number of interested mentors (descending)
+        sorted_projects = sorted(project_to_mentors.keys(), 
+                                key=lambda p: len(project_to_mentors[p]), 
+                                reverse=True)
+        
+        # First pass: Cluster projects with multiple mentors into as few joint interviews as possible
+        for k, project in enumerate(sorted_projects):
+            if scheduler._checkpoint('greedy pass 1', k, len(sorted_projects)):
+                return
+            mentors = project_to_mentors[project]
+            
+            if len(mentors) > 1:
+                for selected_slot, cluster_mentors in scheduler._cluster_joint_interviews(project, mentors):
+                    # Schedule this joint interview
+                    scheduler._book(project, selected_slot, cluster_mentors)
+                    
+                    # Mark this project as scheduled for these mentors
+                    for mentor in cluster_mentors:
+                        if project in mentor_to_projects[mentor]:
+                            mentor_to_projects[mentor].remove(project)
+        
+        # Second pass: Schedule remaining interviews, prioritizing consecutive slots
+        # Sort mentors by number of remaining projects (descending)
+        sorted_mentors = sorted(mentor_to_projects.keys(), 
+                               key=lambda m: len(mentor_to_projects[m]), 
+                               reverse=True)
+        
+        if scheduler.balance_load:
+            # Fill the mentors' days evenly: first at most one interview per mentor per
+            # day, then two, and so on, instead of packing the earliest days first
+            max_level = max(Counter(scheduler.slot_day).values(), default=0)
+            if scheduler.max_interviews_per_day is not None:
+                max_level = min(max_level, scheduler.max_interviews_per_day)
+            for level in range(1, max_level + 1):
+                for k, mentor in enumerate(sorted_mentors):
+                    if scheduler._checkpoint('greedy pass 2', (level - 1) * len(sorted_mentors) + k,
+                                             max_level * len(sorted_mentors)):
+                        return
+                    for _ in scheduler._iter_block_placements(mentor, mentor_to_projects[mentor], level):
+                        pass
+        else:
+            for k, mentor in enumerate(sorted_mentors):
+                if scheduler._checkpoint('greedy pass 2', k, len(sorted_mentors)):
+                    return
+                for _ in scheduler._iter_block_placements(mentor, mentor_to_projects[mentor]):
+                    pass
+        
+        # Third pass: Handle any remaining unscheduled interviews
+        for k, (mentor, projects) in enumerate(mentor_to_projects.items()):
+            if scheduler._checkpoint('greedy pass 3', k, len(mentor_to_projects)):
+                return
+            for project in projects:
+                # Find common availability
+                common_slots = scheduler._get_common_availability(project, [mentor])
+                
+                if common_slots:
+                    # Use the earliest available slot
+                    for slot in common_slots:
+                        # Check if this slot is still available for this mentor
+                        if scheduler._is_mentor_free(mentor, slot) and scheduler._within_load_limits(mentor, slot):
+                            # Schedule this interview (joining an existing interview if any)
+                            scheduler._book(project, slot, [mentor])
+                            break
+
+class LazyHeapSolver(Solver):
+    """
+    Greedy backend that pops the best feasible (mentor, project, slot) candidate from a heap.
+
+    Candidates are not materialized up front: each requested interview walks
+    its slots lazily (most potential joint mentors first, then earliest), and
+    only its current best candidate is in the heap. Priorities are
+    (joint-interview size, adjacency to the mentor's bookings, earliness); the
+    number of still-pending mentors available per (project, slot) is cached and
+    updated on each booking. After a booking, only the candidates it improves
+    are pushed again: the other mentors joining the same session, and for each
+    neighbouring slot of the mentor the single pending project that fits it
+    best. Stale entries are re-scored when popped, so the heap traffic grows
+    with the number of bookings rather than with the pending requests.
+    """
+
+    name = 'lazy'
+
+    def solve(self, scheduler):
+        start = time.perf_counter()
+        scheduler._book_baseline()
+        mentor_to_projects, project_to_mentors = scheduler._get_interview_requests()
+        num_slots = len(scheduler.time_slots)
+        follows = scheduler._slot_follows
+        mentor_bits = scheduler.mentor_bits
+        proposer_bits = scheduler.proposer_bits
+
+        already_booked = {(mentor, project) for (project, slot), mentors in scheduler.schedule.items() for mentor in mentors}
+        pending = {(mentor, project) for mentor, projects in mentor_to_projects.items() for project in projects
+                   if (mentor, project) not in already_booked}
+
+        # Pending interested mentors available per (slot, project), from one matrix product
+        # of the availability (slots x mentors) and the pending requests (mentors x projects)
+        projects = list(project_to_mentors)
+        project_column = {project: j for j, project in enumerate(projects)}
+        mentor_column = {mentor: i for i, mentor in enumerate(mentor_to_projects)}
+        proposer_matrix = _bit_matrix([proposer_bits.get(project, 0) for project in project_column], num_slots)
+        mentor_matrix = _bit_matrix([mentor_bits.get(mentor, 0) for mentor in mentor_column], num_slots)
+        requests = np.zeros((len(mentor_column), len(project_column)), dtype=np.int32)
+        for mentor, project in pending:
+            requests[mentor_column[mentor], project_column[project]] = 1
+        potential = proposer_matrix * (mentor_matrix.astype(np.int32) @ requests)
+        ranked_slots = {}
+
+        def project_slots(project):
+            """Slots of a project ranked by how many interested mentors are available (built on first use)."""
+            if project not in ranked_slots:
+                counts = potential[:, project_column[project]]
+                ranked = np.argsort(-counts, kind='stable')
+                ranked_slots[project] = ranked[:np.count_nonzero(counts)].tolist()
+            return ranked_slots[project]
+
+        # Position of each requested interview in its project's ranked slots; a plain
+        # index per pair is much smaller than a suspended generator
+        positions = {}
+
+        def next_candidate(mentor, project):
+            """Return the next ranked slot where the mentor is available and free, or None."""
+            bits = mentor_bits.get(mentor, 0) & ~scheduler._mentor_booked[mentor]
+            ranked = project_slots(project)
+            k = positions.get((mentor, project), 0)
+            while k < len(ranked) and not (bits >> ranked[k]) & 1:
+                k += 1
+            positions[(mentor, project)] = k + 1
+            return ranked[k] if k < len(ranked) else None
+
+        def priority(mentor, project, slot_idx):
+            joint = len(scheduler.schedule.get((project, scheduler.time_slots[slot_idx]), ())) + int(potential[slot_idx, project_column[project]])
+            booked = scheduler._mentor_booked[mentor]
+            adjacent = 0
+            if slot_idx > 0 and follows[slot_idx] and (booked >> (slot_idx - 1)) & 1:
+                adjacent += 1
+            if slot_idx + 1 < num_slots and follows[slot_idx + 1] and (booked >> (slot_idx + 1)) & 1:
+                adjacent += 1
+            # (-joint, -adjacent, slot_idx) as one integer, which compares faster in the heap
+            return ((2 - adjacent) - 3 * joint) * num_slots + slot_idx
+
+        heap = []
+        counter = itertools.count()
+        pops = pushes = 0
+
+        def push(mentor, project, slot_idx, from_ranking):
+            nonlocal pushes
+            pushes += 1
+            heapq.heappush(heap, (priority(mentor, project, slot_idx), next(counter), mentor, project, slot_idx, from_ranking))
+
+        def push_next(pair):
+            mentor, project = pair
+            free = mentor_bits.get(mentor, 0) & ~scheduler._mentor_booked[mentor] & proposer_bits.get(project, 0)
+            slot_idx = next_candidate(*pair) if free else None
+            if slot_idx is not None:
+                push(mentor, project, slot_idx, True)
+
+        # The first candidates are collected and heapified at once
+        for pair in sorted(pending):
+            slot_idx = next_candidate(*pair)
+            if slot_idx is not None:
+                heap.append((priority(*pair, slot_idx), next(counter), *pair, slot_idx, True))
+        heapq.heapify(heap)
+        pushes = len(heap)
+
+        num_requests = len(pending)
+        while heap:
+            if scheduler._checkpoint('lazy', num_requests - len(pending), num_requests):
+                break
+            stored, _, mentor, project, slot_idx, from_ranking = heapq.heappop(heap)
+            pops += 1
+            pair = (mentor, project)
+            if pair not in pending:
+                continue
+
+            slot = scheduler.time_slots[slot_idx]
+            if not scheduler._is_mentor_free(mentor, slot) or not scheduler._within_load_limits(mentor, slot):
+                if from_ranking:
+                    push_next(pair)
+                continue
+
+            current = priority(mentor, project, slot_idx)
+            if current > stored:
+                # Stale entry: the candidate got worse since it was pushed
+                heapq.heappush(heap, (current, next(counter), mentor, project, slot_idx, from_ranking))
+                continue
+
+            scheduler._book(project, slot, [mentor])
+            pending.discard(pair)
+            row, column = mentor_column[mentor], project_column[project]
+            requests[row, column] = 0
+            potential[:, column] -= mentor_matrix[:, row] & proposer_matrix[:, column]
+
+            # Other interested mentors can now join this session
+            for other in project_to_mentors[project]:
+                if (other, project) in pending and (mentor_bits.get(other, 0) >> slot_idx) & 1:
+                    push(other, project, slot_idx, False)
+
+            # The mentor's neighbouring slots now extend a consecutive block
+            for neighbour in (slot_idx - 1, slot_idx + 1):
+                if (0 <= neighbour < num_slots and follows[max(slot_idx, neighbour)]
+                        and (mentor_bits.get(mentor, 0) >> neighbour) & 1 and not (scheduler._mentor_booked[mentor] >> neighbour) & 1):
+                    # Only the pending project that fits the slot best, most joint mentors first
+                    scores = np.where(requests[mentor_column[mentor]] & proposer_matrix[neighbour], potential[neighbour], 0)
+                    best = int(scores.argmax())
+                    if scores[best]:
+                        push(mentor, projects[best], neighbour, False)
+
+        return {'solver': self.name, 'pushes': pushes, 'pops': pops,
+                'seconds': round(time.perf_counter() - start, 3)}
+
+class CPSATSolver(Solver):
+    """
+    Exact backend using the OR-Tools CP-SAT solver.
+
+    One boolean per (mentor, project, slot) where both are available. Each
+    requested interview is booked at most once, a mentor has at most one
+    interview per slot, and the mentor load limits become linear constraints.
+    The objective maximizes, in decreasing weight: interviews scheduled,
+    interviews kept in their baseline slot (when a baseline is set), fewer
+    sessions (joint interviews), fewer mentor working days, earlier slots.
+
+    The greedy schedule is passed as a hint (warm start). When the time limit
+    stops the search early, the best schedule found is used and the gap to the
+    proven bound is reported.
+    """
+
+    name = 'cpsat'
+
+    def __init__(self, time_limit=60.0, warm_start=True, num_workers=8):
+        self.time_limit = time_limit
+        self.warm_start = warm_start
+        self.num_workers = num_workers
+
+    def solve(self, scheduler):
+        try:
+            from ortools.sat.python import cp_model
+        except ImportError:
+            raise ImportError("The cpsat solver requires OR-Tools (pip install ortools)")
+
+        start = time.perf_counter()
+        mentor_to_projects, _ = scheduler._get_interview_requests()
+        num_slots = len(scheduler.time_slots)
+        w_interview, w_session, w_day = 100 * num_slots, 10 * num_slots, 2 * num_slots
+        # Keeping a baseline interview outweighs any session, day and earliness saving of moving it
+        w_keep = 20 * num_slots
+        baseline = scheduler.baseline or {}
+
+        # Interviews already in the schedule are kept as they are
+        already_booked = {(project, mentor) for (project, slot), mentors in scheduler.schedule.items() for mentor in mentors}
+
+        model = cp_model.CpModel()
+        x = {}
+        by_mentor_slot = {}
+        by_session = {}
+        by_mentor_day = {}
+        for mentor, projects in mentor_to_projects.items():
+            mentor_free = scheduler.mentor_bits.get(mentor, 0) & ~scheduler._mentor_booked[mentor]
+            for project in projects:
+                if (project, mentor) in already_booked:
+                    continue
+                pair_vars = []
+                common = mentor_free & scheduler.proposer_bits.get(project, 0)
+                slot_idx = 0
+                while common:
+                    if common & 1:
+                        var = model.NewBoolVar(f"x_{len(x)}")
+                        x[(mentor, project, slot_idx)] = var
+                        pair_vars.append(var)
+                        by_mentor_slot.setdefault((mentor, slot_idx), []).append(var)
+                        by_session.setdefault((project, slot_idx), []).append(var)
+                        by_mentor_day.setdefault((mentor, scheduler.slot_day[slot_idx]), []).append((slot_idx, var))
+                    common >>= 1
+                    slot_idx += 1
+                if len(pair_vars) > 1:
+                    model.AddAtMostOne(pair_vars)
+
+        for variables in by_mentor_slot.values():
+            if len(variables) > 1:
+                model.AddAtMostOne(variables)
+
+        objective = []
+        sessions = {}
+        for (project, slot_idx), variables in by_session.items():
+            existing = (project, scheduler.time_slots[slot_idx]) in scheduler.schedule
+            if not existing:
+                session = model.NewBoolVar(f"y_{len(sessions)}")
+                sessions[(project, slot_idx)] = session
+                for var in variables:
+                    model.AddImplication(var, session)
+                objective.append(-w_session * session)
+
+        mentor_days = {}
+        for (mentor, day), day_vars in by_mentor_day.items():
+            variables = [var for _, var in day_vars]
+            if not scheduler._mentor_day_count[(mentor, day)]:
+                day_used = model.NewBoolVar(f"z_{len(mentor_days)}")
+                mentor_days[(mentor, day)] = day_used
+                for var in variables:
+                    model.AddImplication(var, day_used)
+                objective.append(-w_day * day_used)
+            if scheduler.max_interviews_per_day is not None:
+                # Earlier bookings can already exceed a limit set later; then no more are added that day
+                model.Add(sum(variables) <= max(0, scheduler.max_interviews_per_day - scheduler._mentor_day_count[(mentor, day)]))
+
+        if scheduler.max_consecutive is not None:
+            self._add_run_limits(model, scheduler, mentor_to_projects, by_mentor_slot)
+
+        for (mentor, project, slot_idx), var in x.items():
+            weight = w_interview - slot_idx
+            if baseline.get((project, mentor)) == scheduler.time_slots[slot_idx]:
+                weight += w_keep
+            objective.append(weight * var)
+
+        model.Maximize(sum(objective))
+
+        hint = None
+        if self.warm_start:
+            hint = scheduler.fork()
+            hint.schedule = dict(scheduler.schedule)
+            hint.schedule_interviews(GreedySolver(), deadline=scheduler._remaining_time(), cancel=scheduler._cancel)
+            hinted = {(mentor, project, scheduler.slot_index[slot])
+                      for (project, slot), mentors in hint.schedule.items() for mentor in mentors}
+            for key, var in x.items():
+                model.AddHint(var, key in hinted)
+            for (project, slot_idx), session in sessions.items():
+                model.AddHint(session, (project, scheduler.time_slots[slot_idx]) in hint.schedule)
+            hinted_days = {(mentor, scheduler.slot_day[slot_idx]) for mentor, _, slot_idx in hinted}
+            for key, day_used in mentor_days.items():
+                model.AddHint(day_used, key in hinted_days)
+
+        solver = cp_model.CpSolver()
+        remaining = scheduler._remaining_time()
+        solver.parameters.max_time_in_seconds = self.time_limit if remaining is None else min(self.time_limit, remaining)
+        solver.parameters.num_search_workers = self.num_workers
+
+        class ProgressCallback(cp_model.CpSolverSolutionCallback):
+            """Report each improving solution and stop the search when the solve is cancelled."""
+
+            def on_solution_callback(self):
+                bound = self.BestObjectiveBound()
+                if scheduler._checkpoint('cpsat', round(self.ObjectiveValue()), round(bound)):
+                    self.StopSearch()
+
+        status = solver.Solve(model, ProgressCallback())
+        # Marks the solve as stopped when the time limit was cut short by the deadline
+        scheduler._checkpoint('cpsat', 1, 1)
+
+        stats = {'solver': self.name, 'status': solver.StatusName(status), 'variables': len(x)}
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            for (mentor, project, slot_idx), var in x.items():
+                if solver.Value(var):
+                    scheduler._book(project, scheduler.time_slots[slot_idx], [mentor])
+            objective_value = solver.ObjectiveValue()
+            bound = solver.BestObjectiveBound()
+            stats['objective'] = objective_value
+            stats['bound'] = bound
+            stats['gap'] = round(abs(bound - objective_value) / max(1.0, abs(bound)), 6)
+        elif hint is not None:
+            # No solution within the time limit: fall back to the greedy schedule
+            for (project, slot), mentors in hint.schedule.items():
+                new_mentors = [m for m in mentors if m not in scheduler.schedule.get((project, slot), [])]
+                if new_mentors:
+                    scheduler._book(project, slot, new_mentors)
+            stats['status'] += ' (greedy fallback)'
+
+        stats['seconds'] = round(time.perf_counter() - start, 3)
+        return stats
+
+    def _add_run_limits(self, model, scheduler, mentor_to_projects, by_mentor_slot):
+        """
+        Limit back-to-back interviews: any max_consecutive + min_break_slots
+        directly following slots hold at most max_consecutive interviews.
+
+        This is exact for min_break_slots = 1 and slightly stricter than the
+        greedy run rule for longer breaks.
+        """
+        window = scheduler.max_consecutive + scheduler.min_break_slots
+        num_slots = len(scheduler.time_slots)
+        for mentor in mentor_to_projects:
+            booked = scheduler._mentor_booked[mentor]
+            for first in range(num_slots - window + 1):
+                if any(not scheduler._slot_follows[i] for i in range(first + 1, first + window)):
+                    continue
+                variables = []
+                fixed = 0
+                for i in range(first, first + window):
+                    variables.extend(by_mentor_slot.get((mentor, i), []))
+                    fixed += (booked >> i) & 1
+                if variables and len(variables) + fixed > scheduler.max_consecutive:
+                    model.Add(sum(variables) <= max(0, scheduler.max_consecutive - fixed))
+
+SOLVERS = {
+    GreedySolver.name: GreedySolver,
+    LazyHeapSolver.name: LazyHeapSolver,
+    CPSATSolver.name: CPSATSolver,
+}
+
+def get_solver(name, **options):
+    """Create a solver backend by name ("greedy", "lazy" or "cpsat")."""
+    if name not in SOLVERS:
+        raise ValueError(f"Unknown solver '{name}' (choose from {', '.join(SOLVERS)})")
+    return SOLVERS[name](**options)
@@ -0,0 +1,29 @@
+"""Tests of backup slots and the waitlist."""
+
+import pytest
+from scheduler_checks import make_scheduler
+from solvers import get_solver
+
+def booked_scheduler():
+    scheduler = make_scheduler(40, 8, 2)
+    scheduler.schedule_interviews(get_solver('greedy'))
+    scheduler.reserve_backups()
+    return scheduler
+
+def test_cancel_rejects_unknown_after_slot():
+    scheduler = booked_scheduler()
+    project, slot = next(iter(scheduler.schedule))
+    mentor = scheduler.schedule[(project, slot)][0]
+
+    with pytest.raises(ValueError, match='Unknown time slot'):
+        scheduler.cancel_interview(project, mentor, after='5/7 夜')
+    # The interview is left booked
+    assert mentor in scheduler.schedule[(project, slot)]
+
+def test_cancel_keeps_schedule_valid():
+    scheduler = booked_scheduler()
+    for project, slot in list(scheduler.schedule)[:5]:
+        mentors = scheduler.schedule.get((project, slot))
+        if mentors:
+            scheduler.cancel_interview(project, mentors[0])
+    assert not [v for v in scheduler.validate() if v['Severity'] == 'error']
@@ -0,0 +1,28 @@
+"""Tests of the converters' JSONL log shared by worker processes."""
+
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from conversion_log import configure_logging
+
+NUM_RECORDS = 200
+
+def log_records(worker):
+    for i in range(NUM_RECORDS):
+        logging.getLogger('test').info("matched", extra={'proposer_id': f"W{worker}-{i}", 'slots': ['x' * 500]})
+    logging.shutdown()
+    return worker
+
+def test_workers_append_whole_lines(tmp_path):
+    jsonl_file = str(tmp_path / 'conversion.jsonl')
+    configure_logging('WARNING', jsonl_file)
+    logging.getLogger('test').info("start")
+    with ProcessPoolExecutor(max_workers=4, initializer=configure_logging, initargs=('WARNING', jsonl_file, 'a')) as executor:
+        list(executor.map(log_records, range(4)))
+    logging.getLogger('test').info("done")
+    configure_logging('WARNING')
+
+    with open(jsonl_file, encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f]
+    assert len(entries) == 4 * NUM_RECORDS + 2
+    assert entries[0]['message'] == 'start' and entries[-1]['message'] == 'done'
@@ -0,0 +1,38 @@
+"""Tests of the feasibility pre-analysis."""
+
+import pandas as pd
+from interview_scheduler import InterviewScheduler
+from solvers import get_solver
+
+SLOTS = ['2024/04/23 07:00 PM', '2024/04/23 08:00 PM', '2024/04/24 07:00 PM', '2024/04/24 08:00 PM']
+
+def small_scheduler():
+    # A is free on both days, B only on the first; P4 is never free when a mentor is
+    proposers = pd.DataFrame({'P1': [True, False, False, False], 'P2': [False, False, True, True],
+                              'P3': [True, True, False, False], 'P4': [False, False, False, False]}, index=SLOTS)
+    mentors = pd.DataFrame({'A': [True, True, True, True], 'B': [True, True, False, False]}, index=SLOTS)
+    return InterviewScheduler.from_data(proposers, mentors, {'A': ['P1', 'P2', 'P3', 'P4'], 'B': ['P2', 'P3']})
+
+def test_max_per_day_caps_capacity_and_prunes_pairs():
+    scheduler = small_scheduler()
+    scheduler.set_load_limits(max_per_day=1, balance=False)
+    report = scheduler.analyze_feasibility(prune=True)
+
+    assert scheduler.pruned_pairs == {('A', 'P4'): 'No common availability', ('B', 'P2'): 'No common availability'}
+    mentors = report.mentors.set_index('Mentor')
+    assert mentors.loc['A', ['Requested', 'Feasible Requests', 'Free Slots', 'Capacity', 'Shortfall']].tolist() == [4, 3, 4, 2, 1]
+    assert mentors.loc['B', ['Requested', 'Feasible Requests', 'Free Slots', 'Capacity', 'Shortfall']].tolist() == [2, 1, 2, 1, 0]
+    assert report.bottleneck_mentors()['Mentor'].tolist() == ['A']
+    # P1 and P3 (A and B) compete in the first slot, P3 alone in the second, P2 (A) on the second day
+    assert report.slots['Competing Pairs'].tolist() == [3, 2, 1, 1]
+    assert report.days['Competing Pairs'].tolist() == [5, 2]
+
+def test_pruned_pairs_are_left_out_and_reported():
+    scheduler = small_scheduler()
+    scheduler.analyze_feasibility(prune=True)
+    scheduler.schedule_interviews(get_solver('greedy'))
+
+    reasons = {(row['Mentor'], row['Project ID']): row['Reason'] for row in scheduler._get_unscheduled_interviews()}
+    assert {pair: reasons[pair] for pair in scheduler.pruned_pairs} == scheduler.pruned_pairs
+    mentor_to_projects, _ = scheduler._get_interview_requests()
+    assert 'P4' not in mentor_to_projects['A'] and 'P2' not in mentor_to_projects['B']
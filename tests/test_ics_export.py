@@ -0,0 +1,51 @@
+"""Tests of the iCalendar export."""
+
+from ics_export import _fold, export_ics, render_event
+
+GOLDEN_EVENT = (
+    "BEGIN:VEVENT\r\n"
+    "UID:23a7a43fbee75372847f745620448476928352d2@mitoujr-scheduler\r\n"
+    "DTSTAMP:20240401T000000Z\r\n"
+    "DTSTART:20240423T100000Z\r\n"
+    "DTEND:20240423T120000Z\r\n"
+    "SUMMARY:二次選考面接 P001 (田中太郎\\, 鈴木四郎\\, 佐藤次郎\r\n"
+    " \\, Smith\\; Jr.)\r\n"
+    "DESCRIPTION:Project: P001\\nMentors: 田中太郎\\, 鈴木四郎\\, 佐藤次\r\n"
+    " 郎\\, Smith\\; Jr.\\nTime Slot: 4/23 夜 (19:00 - 21:00)\r\n"
+    "END:VEVENT\r\n"
+)
+
+def test_render_event_golden():
+    event = render_event('4/23 夜 (19:00 - 21:00)', 'P001', ['田中太郎', '鈴木四郎', '佐藤次郎', 'Smith; Jr.'],
+                         stamp='20240401T000000Z')
+
+    assert event == GOLDEN_EVENT
+
+def test_render_event_skips_unknown_slots():
+    assert render_event('未定', 'P001', ['田中太郎']) is None
+
+def test_long_japanese_summary_folds_on_character_boundaries():
+    line = "SUMMARY:" + "二次選考面接" * 20
+    folded = _fold(line)
+    lines = folded.split('\r\n')
+
+    assert len(lines) > 2
+    # 3-octet characters: 8 + 22 * 3 = 74 octets on the first line, a space + 24 * 3 = 73 on the next ones
+    assert [len(part.encode('utf-8')) for part in lines[:2]] == [74, 73]
+    assert all(len(part.encode('utf-8')) <= 75 for part in lines)
+    assert all(part.startswith(' ') for part in lines[1:])
+    assert folded.replace('\r\n ', '') == line
+
+def test_short_lines_are_not_folded():
+    assert _fold("SUMMARY:面接") == "SUMMARY:面接"
+
+def test_export_ics_writes_feeds(tmp_path):
+    bookings = [('4/23 夜 (19:00 - 21:00)', 'P001', ['田中太郎', '鈴木四郎']), ('未定', 'P002', ['田中太郎'])]
+
+    assert export_ics(bookings, str(tmp_path)) == 1
+    combined = (tmp_path / 'all_interviews.ics').read_bytes().decode('utf-8')
+    assert combined.startswith("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n")
+    assert combined.endswith("END:VCALENDAR\r\n")
+    assert combined.count("BEGIN:VEVENT") == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        'all_interviews.ics', 'mentor_田中太郎.ics', 'mentor_鈴木四郎.ics', 'proposer_P001.ics']
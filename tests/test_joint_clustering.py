@@ -0,0 +1,41 @@
+"""Tests of the set cover of joint interviews."""
+
+from joint_clustering import EXACT_COVER_MAX_MENTORS, assign_cover, min_slot_cover
+
+def bits(*indices):
+    return sum(1 << i for i in indices)
+
+def covered(cover):
+    mask = 0
+    for _, slot_mask in cover:
+        mask |= slot_mask
+    return mask
+
+def test_exact_cover_beats_greedy():
+    # Greedy takes the largest slot 0 first and then needs slots 1 and 2; slots 1 and 2 alone cover everyone
+    slot_masks = [(0, bits(0, 1, 2, 3)), (1, bits(0, 1, 4)), (2, bits(2, 3, 5))]
+
+    assert min_slot_cover(slot_masks) == [(1, bits(0, 1, 4)), (2, bits(2, 3, 5))]
+
+def test_exact_cover_prefers_earlier_slots():
+    slot_masks = [(3, bits(0)), (5, bits(1)), (7, bits(0, 1)), (8, bits(0, 1))]
+
+    assert min_slot_cover(slot_masks) == [(7, bits(0, 1))]
+
+def test_large_groups_fall_back_to_greedy():
+    extra = range(6, EXACT_COVER_MAX_MENTORS + 1)
+    slot_masks = [(0, bits(0, 1, 2, 3, *extra)), (1, bits(0, 1, 4, *extra[:4])), (2, bits(2, 3, 5, *extra[4:]))]
+    target = covered(slot_masks)
+    assert bin(target).count('1') > EXACT_COVER_MAX_MENTORS
+
+    cover = min_slot_cover(slot_masks)
+    # The greedy cover is valid, but one slot larger than the optimum of slots 1 and 2
+    assert covered(cover) == target
+    assert [slot_idx for slot_idx, _ in cover] == [0, 1, 2]
+
+def test_assign_cover_gives_each_mentor_one_session():
+    cover = min_slot_cover([(0, bits(0, 1, 2, 3)), (1, bits(0, 1, 4)), (2, bits(2, 3, 5)), (4, bits(5, 6))])
+    sessions = assign_cover(cover)
+
+    assert covered(sessions) == bits(*range(7))
+    assert sum(bin(mask).count('1') for _, mask in sessions) == 7
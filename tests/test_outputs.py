@@ -0,0 +1,14 @@
+"""Tests of the schedule outputs."""
+
+from scheduler_checks import make_scheduler
+from solvers import get_solver
+
+def test_bookings_are_chronological():
+    scheduler = make_scheduler(60, 6, 0)
+    scheduler.schedule_interviews(get_solver('greedy'))
+    slots = [booking.time_slot for booking in scheduler.iter_bookings()]
+
+    assert len(slots) == len(scheduler.schedule)
+    # "2024/04/26 09:00 AM" comes before "2024/04/26 01:00 PM", unlike in string order
+    assert [scheduler.slot_index[slot] for slot in slots] == sorted(scheduler.slot_index[slot] for slot in slots)
+    assert slots != sorted(slots)
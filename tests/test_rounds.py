@@ -0,0 +1,61 @@
+"""Tests of multi-round scheduling."""
+
+import os
+import pandas as pd
+import pytest
+from interview_scheduler import save_rounds
+from scheduler_checks import make_scheduler
+from solvers import get_solver
+
+def shortlist_rounds(scheduler):
+    # The second round is a shortlist of the first: every pair comes back
+    shortlist = sorted(scheduler.projects)[:5]
+    return [{'name': 'first'}, {'name': 'second', 'projects': shortlist}]
+
+def check_rounds(scheduler):
+    seen = {}
+    for name, round_scheduler in scheduler.rounds:
+        assert not [v for v in round_scheduler.validate() if v['Severity'] == 'error']
+        for (project, slot), mentors in round_scheduler.schedule.items():
+            for mentor in mentors:
+                assert project in round_scheduler.mentor_preferences[mentor]
+                assert (mentor, slot) not in seen, f"{mentor} booked twice in {slot}"
+                seen[(mentor, slot)] = name
+    assert len(seen) == sum(len(mentors) for mentors in scheduler.schedule.values())
+
+@pytest.mark.parametrize('joint', [False, True])
+def test_shortlist_round_repeats_pairs(joint):
+    scheduler = make_scheduler(30, 6, 1)
+    rounds = shortlist_rounds(scheduler)
+    scheduler.schedule_rounds(rounds, get_solver('greedy'), joint=joint)
+
+    assert [name for name, _ in scheduler.rounds] == ['first', 'second']
+    check_rounds(scheduler)
+    second = dict(scheduler.rounds)['second']
+    assert second.schedule
+    assert {project for project, _ in second.schedule} <= set(rounds[1]['projects'])
+    # Projects of the shortlist are interviewed again by mentors of the first round
+    first_pairs = {(project, mentor) for (project, _), mentors in dict(scheduler.rounds)['first'].schedule.items()
+                   for mentor in mentors}
+    assert first_pairs & {(project, mentor) for (project, _), mentors in second.schedule.items() for mentor in mentors}
+
+def test_schedule_round_keeps_earlier_bookings():
+    scheduler = make_scheduler(30, 6, 1)
+    rounds = shortlist_rounds(scheduler)
+    scheduler.schedule_round('first', scheduler.round_preferences(rounds[0]), get_solver('greedy'))
+    first = dict(scheduler.schedule)
+    scheduler.schedule_round('second', scheduler.round_preferences(rounds[1]), get_solver('greedy'))
+
+    assert all(set(mentors) <= set(scheduler.schedule[key]) for key, mentors in first.items())
+    check_rounds(scheduler)
+
+def test_save_rounds(tmp_path):
+    scheduler = make_scheduler(30, 6, 1)
+    scheduler.schedule_rounds(shortlist_rounds(scheduler), get_solver('greedy'), joint=True)
+    save_rounds(scheduler, str(tmp_path), validate=True)
+
+    summary = pd.read_csv(tmp_path / 'rounds_summary.csv')
+    assert summary['Round'].tolist() == ['first', 'second']
+    for name in ['first', 'second']:
+        assert os.path.exists(tmp_path / name / 'complete_schedule.csv')
+        assert os.path.exists(tmp_path / name / 'violations.csv')
@@ -0,0 +1,30 @@
+"""Tests of what-if scenario deltas."""
+
+from scheduler_checks import make_scheduler
+from solvers import get_solver
+
+def test_add_window_splits_into_hourly_slots():
+    scheduler = make_scheduler(20, 3, 0)
+    forked = scheduler.apply_scenario({'add_slots': ['5/7 夜 (19:00 - 21:00)', scheduler.time_slots[0]]})
+
+    assert forked.time_slots[len(scheduler.time_slots):] == ['2024/05/07 07:00 PM', '2024/05/07 08:00 PM']
+    assert forked.proposer_availability.index.is_unique
+    assert forked.proposer_availability.loc[scheduler.time_slots[0]].all()
+    assert not scheduler.proposer_availability.loc[scheduler.time_slots[0]].all()
+
+def test_drop_window_drops_its_hourly_slots():
+    scheduler = make_scheduler(20, 3, 0)
+    forked = scheduler.apply_scenario({'drop_slots': ['4/23 夜 (19:00 - 21:00)']})
+
+    assert not [slot for slot in forked.time_slots if slot.startswith('2024/04/23')]
+    assert len(forked.time_slots) == len(scheduler.time_slots) - 2
+
+def test_earlier_slot_is_added_in_order():
+    scheduler = make_scheduler(20, 3, 0)
+    forked = scheduler.apply_scenario({'add_slots': ['4/1 夜 (19:00 - 21:00)']})
+
+    assert forked.time_slots[:2] == ['2024/04/01 07:00 PM', '2024/04/01 08:00 PM']
+    assert forked.time_slots[2:] == scheduler.time_slots
+    assert forked.mentor_availability.index.tolist() == forked.time_slots
+    forked.schedule_interviews(get_solver('greedy'))
+    assert not [v for v in forked.validate() if v['Severity'] == 'error']
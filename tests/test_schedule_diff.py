@@ -0,0 +1,53 @@
+"""Tests of schedule diffs."""
+
+from schedule_diff import affected_people, count_changes, diff_schedules, write_changes
+
+OLD = [('2024/04/23 07:00 PM', 'P001', ['田中太郎', '鈴木四郎']),
+       ('2024/04/23 08:00 PM', 'P002', ['田中太郎']),
+       ('2024/04/24 07:00 PM', 'P003', ['佐藤次郎'])]
+
+def by_interview(changes):
+    return {(change['Project ID'], change['Mentor']): change for change in changes}
+
+def test_identical_schedules_have_no_changes():
+    assert diff_schedules(OLD, list(OLD)) == []
+
+def test_moved_added_and_removed():
+    new = [('2024/04/23 07:00 PM', 'P001', ['田中太郎', '鈴木四郎']),
+           ('2024/04/24 08:00 PM', 'P002', ['田中太郎']),
+           ('2024/04/25 07:00 PM', 'P004', ['佐藤次郎'])]
+    changes = by_interview(diff_schedules(OLD, new))
+
+    assert changes == {
+        ('P002', '田中太郎'): {'Change': 'moved', 'Project ID': 'P002', 'Mentor': '田中太郎',
+                             'Old Time Slot': '2024/04/23 08:00 PM', 'New Time Slot': '2024/04/24 08:00 PM'},
+        ('P003', '佐藤次郎'): {'Change': 'removed', 'Project ID': 'P003', 'Mentor': '佐藤次郎',
+                             'Old Time Slot': '2024/04/24 07:00 PM', 'New Time Slot': ''},
+        ('P004', '佐藤次郎'): {'Change': 'added', 'Project ID': 'P004', 'Mentor': '佐藤次郎',
+                             'Old Time Slot': '', 'New Time Slot': '2024/04/25 07:00 PM'},
+    }
+    assert count_changes(changes.values()) == {'moved': 1, 'added': 1, 'removed': 1}
+    assert affected_people(changes.values()) == (['佐藤次郎', '田中太郎'], ['P002', 'P003', 'P004'])
+
+def test_changed_mentor_set():
+    # 鈴木四郎 leaves the joint session, 佐藤次郎 joins it and 田中太郎 stays
+    new = [('2024/04/23 07:00 PM', 'P001', ['田中太郎', '佐藤次郎'])] + OLD[1:]
+    changes = by_interview(diff_schedules(OLD, new))
+
+    assert {key: change['Change'] for key, change in changes.items()} == {
+        ('P001', '鈴木四郎'): 'removed', ('P001', '佐藤次郎'): 'added'}
+
+def test_split_session_moves_one_mentor():
+    new = [('2024/04/23 07:00 PM', 'P001', ['田中太郎']), ('2024/04/24 07:00 PM', 'P001', ['鈴木四郎'])] + OLD[1:]
+    changes = diff_schedules(OLD, new)
+
+    assert [(change['Change'], change['Mentor'], change['New Time Slot']) for change in changes] == [
+        ('moved', '鈴木四郎', '2024/04/24 07:00 PM')]
+
+def test_write_changes_round_trips(tmp_path):
+    path = tmp_path / 'schedule_changes.csv'
+    write_changes(diff_schedules(OLD, OLD[:1]), str(path))
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'Change,Project ID,Mentor,Old Time Slot,New Time Slot'
+    assert len(lines) == 3
@@ -0,0 +1,30 @@
+"""Tests of the SQLite cohort store."""
+
+from schedule_store import ScheduleStore, MENTOR, PROPOSER
+
+def test_import_deletes_missing_entities_and_preferences():
+    store = ScheduleStore(':memory:')
+    slots = ['2024/04/23 07:00 PM', '2024/04/23 08:00 PM']
+    store.write_availability(MENTOR, slots, {'M1': 1, 'M2': 3}, replace=True)
+    store.write_availability(PROPOSER, slots, {'P1': 1, 'P2': 2}, replace=True)
+    store.write_preferences({'M1': ['P1'], 'M2': ['P1', 'P2']}, replace=True)
+    store.write_bookings([(slots[0], 'P1', ['M1', 'M2'])])
+
+    # A new form without M2 and P2
+    store.write_availability(MENTOR, slots, {'M1': 3}, replace=True)
+    store.write_availability(PROPOSER, slots, {'P1': 3}, replace=True)
+    store.write_preferences({'M1': ['P1']}, replace=True)
+
+    assert store.read_availability(MENTOR)[1] == {'M1': 3}
+    assert store.read_availability(PROPOSER)[1] == {'P1': 3}
+    assert store.read_preferences() == {'M1': ['P1']}
+    assert list(store.read_bookings()) == [(slots[0], 'P1', ['M1'])]
+
+def test_same_interview_in_two_rounds():
+    store = ScheduleStore(':memory:')
+    store.write_bookings([('2024/04/23 07:00 PM', 'P1', ['M1'])])
+    store.write_bookings([('2024/05/07 07:00 PM', 'P1', ['M1'])], replace=False)
+
+    assert [slot for slot, _ in store.mentor_schedule('M1')] == ['2024/04/23 07:00 PM', '2024/05/07 07:00 PM']
+    store.cancel_booking('P1', 'M1', '2024/04/23 07:00 PM')
+    assert [slot for slot, _ in store.mentor_schedule('M1')] == ['2024/05/07 07:00 PM']
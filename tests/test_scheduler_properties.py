@@ -0,0 +1,25 @@
+"""Property checks of every engine on generated cohorts (see scheduler_checks.py)."""
+
+import functools
+import pytest
+from scheduler_checks import get_engines, run_property_case, check_heuristic_totals
+
+NUM_SEEDS = 12
+ENGINES = get_engines(cpsat_time_limit=1.0)
+
+@functools.lru_cache(maxsize=None)
+def solve_case(seed):
+    return run_property_case(seed, ENGINES)
+
+@pytest.mark.parametrize('seed', range(NUM_SEEDS))
+def test_schedules_are_valid(seed):
+    _, failures = solve_case(seed)
+    assert failures == []
+
+def test_heuristic_coverage():
+    totals = {name: 0 for name in ENGINES}
+    for seed in range(NUM_SEEDS):
+        counts, _ = solve_case(seed)
+        for name, count in counts.items():
+            totals[name] += count
+    assert check_heuristic_totals(totals) == []
@@ -0,0 +1,48 @@
+"""Tests of interview packing into availability windows."""
+
+from slot_times import covered_slots, pack_intervals, slot_epoch_minutes
+
+def minutes(*slots):
+    return [slot_epoch_minutes(slot) for slot in slots]
+
+def test_length_not_a_multiple_of_the_slot_length():
+    # Two hourly slots hold two 45 minute interviews with 15 minutes left over
+    start, _ = slot_epoch_minutes('2024/04/23 07:00 PM')
+    packed = pack_intervals(minutes('2024/04/23 07:00 PM', '2024/04/23 08:00 PM'), 45)
+
+    assert packed == [(start, start + 45), (start + 45, start + 90)]
+
+def test_buffer_between_interviews():
+    start, _ = slot_epoch_minutes('2024/04/23 07:00 PM')
+    packed = pack_intervals(minutes('2024/04/23 07:00 PM', '2024/04/23 08:00 PM'), 50, buffer=10)
+
+    assert packed == [(start, start + 50), (start + 60, start + 110)]
+
+def test_gap_between_slots():
+    # An interview never spans the free hour at 8 PM
+    first, _ = slot_epoch_minutes('2024/04/23 07:00 PM')
+    second, _ = slot_epoch_minutes('2024/04/23 09:00 PM')
+    packed = pack_intervals(minutes('2024/04/23 07:00 PM', '2024/04/23 09:00 PM'), 40)
+
+    assert packed == [(first, first + 40), (second, second + 40)]
+
+def test_day_boundary():
+    start, _ = slot_epoch_minutes('2024/04/23 11:00 PM')
+    intervals = minutes('2024/04/24 12:00 AM', '2024/04/23 11:00 PM')
+    packed = pack_intervals(intervals, 90)
+
+    assert packed == [(start, start + 90)]
+    slot_minutes = minutes('2024/04/23 11:00 PM - 12:30 AM', '2024/04/24 12:00 AM - 01:30 AM')
+    assert slot_minutes[0] == (start, start + 90)
+    assert covered_slots(slot_minutes, intervals) == [0]
+
+def test_single_slot_interview():
+    start, end = slot_epoch_minutes('2024/04/23 07:00 PM')
+    assert pack_intervals([(start, end)], 60) == [(start, end)]
+    assert pack_intervals([(start, end)], 61) == []
+
+def test_covered_slots_skips_unknown_and_partial_slots():
+    slot_minutes = minutes('2024/04/23 07:00 PM - 07:30 PM', '2024/04/23 07:45 PM - 08:15 PM', 'unknown')
+    intervals = minutes('2024/04/23 07:00 PM')
+
+    assert covered_slots(slot_minutes, intervals) == [0]
@@ -0,0 +1,50 @@
+"""Tests of the solver backends on schedules that already hold bookings."""
+
+from collections import Counter
+import importlib.util
+import pandas as pd
+import pytest
+from interview_scheduler import InterviewScheduler
+from scheduler_checks import make_scheduler
+from solvers import get_solver
+
+pytestmark = pytest.mark.skipif(importlib.util.find_spec('ortools') is None, reason='OR-Tools is not installed')
+
+def day_counts(scheduler):
+    scheduler._ensure_slot_days()
+    return Counter((mentor, scheduler.slot_day[scheduler.slot_index[slot]])
+                   for (project, slot), mentors in scheduler.schedule.items() for mentor in mentors)
+
+def test_cpsat_existing_load_above_limits():
+    scheduler = make_scheduler(40, 5, 1)
+    scheduler.schedule_interviews(get_solver('greedy'))
+    days = day_counts(scheduler)
+    assert max(days.values()) > 1
+    # Keep only the bookings on days with several interviews, so requested interviews are left to schedule
+    scheduler.set_schedule([(slot, project, mentors) for (project, slot), mentors in scheduler.schedule.items()
+                            if any(days[(mentor, scheduler.slot_day[scheduler.slot_index[slot]])] > 1 for mentor in mentors)])
+    existing = day_counts(scheduler)
+    scheduler.set_load_limits(1, 1, balance=False)
+
+    stats = scheduler.schedule_interviews(get_solver('cpsat', time_limit=5, num_workers=1, warm_start=False))
+
+    assert stats['status'] in ('OPTIMAL', 'FEASIBLE')
+    after = day_counts(scheduler)
+    assert sum(after.values()) > sum(existing.values())
+    # Days already over the limit get no further interviews, the others at most one
+    for key, count in after.items():
+        assert count == existing[key] if existing[key] else count <= 1
+
+def test_cpsat_warm_start_joins_existing_session():
+    slots = ['2024/04/23 07:00 PM', '2024/04/23 08:00 PM']
+    mentors = ['A', 'B', 'C']
+    scheduler = InterviewScheduler.from_data(pd.DataFrame({'P1': [True, True]}, index=slots),
+                                             pd.DataFrame(True, index=slots, columns=mentors),
+                                             {mentor: ['P1'] for mentor in mentors})
+    scheduler.set_schedule([(slots[0], 'P1', ['A'])])
+
+    stats = scheduler.schedule_interviews(get_solver('cpsat', time_limit=3, num_workers=1, warm_start=True))
+
+    assert stats['status'] in ('OPTIMAL', 'FEASIBLE')
+    assert sorted(mentor for session in scheduler.schedule.values() for mentor in session) == mentors
+    assert all(isinstance(session, tuple) for session in scheduler.schedule.values())
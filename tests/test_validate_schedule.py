@@ -0,0 +1,49 @@
+"""Tests of the standalone validator against schedules made by the scheduler."""
+
+import os
+from generate_test_data import generate_cohort, write_matrix_csv
+from interview_scheduler import InterviewScheduler
+from solvers import get_solver
+from validate_schedule import validate_files, summarize_violations
+
+def write_cohort(directory, num_proposers=40, num_mentors=6, seed=0):
+    proposers, mentors, preferences = generate_cohort(num_proposers, num_mentors, seed)
+    files = {
+        'proposer_file': os.path.join(directory, 'proposer_availability.csv'),
+        'mentor_file': os.path.join(directory, 'mentor_availability.csv'),
+        'preference_file': os.path.join(directory, 'mentor_preferences.csv'),
+    }
+    write_matrix_csv(proposers.astype(int), files['proposer_file'])
+    write_matrix_csv(mentors.astype(int), files['mentor_file'])
+    write_matrix_csv(preferences, files['preference_file'])
+    return files, list(mentors.columns), list(proposers.columns)
+
+def count_errors(violations):
+    return sum(count for (severity, _), count in summarize_violations(violations).items() if severity == 'error')
+
+def test_timezone_shifted_schedule(tmp_path):
+    files, mentors, projects = write_cohort(str(tmp_path))
+    # One hour behind the slot labels, so shifted answers still overlap the evening slots
+    entity_timezones = {mentors[0]: 'Asia/Shanghai', mentors[1]: 'Asia/Shanghai', projects[0]: 'Asia/Shanghai'}
+    timezone_file = os.path.join(str(tmp_path), 'timezones.csv')
+    with open(timezone_file, 'w', encoding='utf-8') as f:
+        f.write('Name,Time Zone\n')
+        f.writelines(f"{name},{tz}\n" for name, tz in entity_timezones.items())
+
+    scheduler = InterviewScheduler(files['proposer_file'], files['mentor_file'], files['preference_file'])
+    scheduler.set_timezones(entity_timezones=entity_timezones)
+    scheduler.schedule_interviews(get_solver('greedy'))
+    output_dir = os.path.join(str(tmp_path), 'out')
+    scheduler.save_schedule(output_dir)
+    schedule_file = os.path.join(output_dir, 'complete_schedule.csv')
+
+    shifted = [slot for (project, slot), booked in scheduler.schedule.items()
+               if project == projects[0] or set(booked) & {mentors[0], mentors[1]}]
+    assert shifted
+
+    violations = validate_files(schedule_file, files['proposer_file'], files['mentor_file'], files['preference_file'],
+                                timezone_file=timezone_file)
+    assert count_errors(violations) == 0
+    # Without the time zones, the shifted bookings fall outside the answers as written
+    unshifted = validate_files(schedule_file, files['proposer_file'], files['mentor_file'], files['preference_file'])
+    assert count_errors(unshifted) > 0
@@ -0,0 +1,38 @@
+"""Tests of the Excel workbook export."""
+
+import pytest
+from xlsx_export import export_workbook, sheet_title
+
+openpyxl = pytest.importorskip('openpyxl')
+
+BOOKINGS = [('2024/04/23 07:00 PM', 'P001', ['田中太郎', 'Smith [guest]']),
+            ('2024/04/24 07:00 PM', 'P002', ['田中太郎'])]
+
+def rows(sheet):
+    return [list(row) for row in sheet.iter_rows(values_only=True)]
+
+def test_export_workbook_round_trips(tmp_path):
+    path = tmp_path / 'out' / 'schedule.xlsx'
+    unscheduled = [{'Mentor': '鈴木四郎', 'Project ID': 'P003', 'Reason': 'No common availability'}]
+
+    assert export_workbook(BOOKINGS, str(path), unscheduled=unscheduled, summary={'Coverage (%)': 66.7}) == 2
+
+    workbook = openpyxl.load_workbook(path)
+    assert workbook.sheetnames == ['Summary', 'Schedule', 'Smith _guest_', '田中太郎', 'Unscheduled']
+    assert rows(workbook['Schedule']) == [['Time Slot', 'Project ID', 'Mentors'],
+                                          ['2024/04/23 07:00 PM', 'P001', '田中太郎, Smith [guest]'],
+                                          ['2024/04/24 07:00 PM', 'P002', '田中太郎']]
+    assert rows(workbook['田中太郎']) == [['Time Slot', 'Project ID'],
+                                      ['2024/04/23 07:00 PM', 'P001'], ['2024/04/24 07:00 PM', 'P002']]
+    assert rows(workbook['Unscheduled']) == [['Mentor', 'Project ID', 'Reason'],
+                                             ['鈴木四郎', 'P003', 'No common availability']]
+    assert dict(rows(workbook['Summary'])[1:]) == {'Sessions': 2, 'Scheduled Interviews': 3, 'Mentors': 2,
+                                                   'Projects': 2, 'Unscheduled Interviews': 1, 'Coverage (%)': 66.7}
+
+def test_sheet_titles_are_unique_and_valid():
+    used = {'summary'}
+    assert sheet_title('Summary', used) == 'Summary (2)'
+    assert sheet_title('a/b:c', used) == 'a_b_c'
+    long_name = 'x' * 40
+    assert sheet_title(long_name, used) == 'x' * 31
+    assert sheet_title(long_name, used) == 'x' * 27 + ' (2)'
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import csv
+import os
+import sys
+from collections import Counter
+from schedule_io import read_schedule_csv, load_availability_bitsets, load_preferences_csv, load_timezones_csv
+from slot_times import DEFAULT_YEAR, DEFAULT_TIMEZONE, INTERVAL_SLOT_PATTERN, slot_epoch_minutes, covered_slots
+
+# Checks reported as errors; the others are warnings
+ERROR_CHECKS = {
+    'unknown_slot', 'unknown_project', 'unknown_mentor', 'duplicate_row',
+    'mentor_double_booking', 'proposer_unavailable', 'mentor_unavailable',
+    'not_requested', 'duplicate_interview',
+}
+
+REPORT_COLUMNS = ['Severity', 'Check', 'Time Slot', 'Project ID', 'Mentor', 'Detail']
+
+def _violation(check, time_slot='', project='', mentor='', detail=''):
+    return {
+        'Severity': 'error' if check in ERROR_CHECKS else 'warning',
+        'Check': check,
+        'Time Slot': time_slot,
+        'Project ID': project,
+        'Mentor': mentor,
+        'Detail': detail,
+    }
+
+def validate_schedule(bookings, time_slots, proposer_bits, mentor_bits, mentor_preferences):
+    """
+    Check every constraint of a schedule in one pass over its bookings.
+
+    All checks use hash sets or availability bitsets, so the run time is
+    linear in the number of bookings plus the number of preferences.
+
+    Args:
+        bookings: Iterable of (time_slot, project, mentors)
+        time_slots: List of time slots of the availability files
+        proposer_bits: {project: bitset of available slots}
+        mentor_bits: {mentor: bitset of available slots}
+        mentor_preferences: {mentor: [projects]}
+
+    Returns:
+        List of violation dictionaries (see REPORT_COLUMNS)
+    """
+    slot_index = {slot: i for i, slot in enumerate(time_slots)}
+    requested = {(mentor, project) for mentor, projects in mentor_preferences.items() for project in projects}
+
+    violations = []
+    sessions = set()
+    mentor_slots = set()
+    interviews = Counter()
+
+    for time_slot, project, mentors in bookings:
+        slot_idx = slot_index.get(time_slot)
+        if slot_idx is None:
+            violations.append(_violation('unknown_slot', time_slot, project, detail='Time slot is not in the availability files'))
+
+        if (project, time_slot) in sessions:
+            violations.append(_violation('duplicate_row', time_slot, project, detail='Project appears twice in the same slot'))
+        sessions.add((project, time_slot))
+
+        if project not in proposer_bits:
+            violations.append(_violation('unknown_project', time_slot, project, detail='Project has no availability data'))
+        elif slot_idx is not None and not (proposer_bits[project] >> slot_idx) & 1:
+            violations.append(_violation('proposer_unavailable', time_slot, project, detail='Proposer is not available in this slot'))
+
+        for mentor in mentors:
+            if (mentor, time_slot) in mentor_slots:
+                violations.append(_violation('mentor_double_booking', time_slot, project, mentor,
+                                             'Mentor has another interview in this slot'))
+            mentor_slots.add((mentor, time_slot))
+
+            if mentor not in mentor_bits:
+                violations.append(_violation('unknown_mentor', time_slot, project, mentor, 'Mentor has no availability data'))
+            elif slot_idx is not None and not (mentor_bits[mentor] >> slot_idx) & 1:
+                violations.append(_violation('mentor_unavailable', time_slot, project, mentor, 'Mentor is not available in this slot'))
+
+            if (mentor, project) not in requested:
+                violations.append(_violation('not_requested', time_slot, project, mentor, 'Mentor did not ask to interview this project'))
+
+            interviews[(mentor, project)] += 1
+            if interviews[(mentor, project)] == 2:
+                violations.append(_violation('duplicate_interview', time_slot, project, mentor,
+                                             'Mentor interviews this project more than once'))
+
+    for mentor, projects in mentor_preferences.items():
+        for project in projects:
+            if (mentor, project) not in interviews:
+                violations.append(_violation('missing_interview', project=project, mentor=mentor,
+                                             detail='Requested interview is not scheduled'))
+
+    return violations
+
+def summarize_violations(violations):
+    """Return {(severity, check): count} for a list of violations."""
+    return Counter((v['Severity'], v['Check']) for v in violations)
+
+def write_report(violations, report_file):
+    """Write violations to a CSV report."""
+    with open(report_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(violations)
+
+def shift_timezones(time_slots, entity_bits, entity_timezones, year=DEFAULT_YEAR, tz=DEFAULT_TIMEZONE):
+    """
+    Move the availability of people who answered in their own time zone onto the slots (--timezone-file).
+    
+    As in InterviewScheduler.set_timezones, a slot is available if it lies
+    completely inside the person's available time read in their own zone.
+    The bitsets are updated in place.
+    """
+    slot_minutes = None
+    for entity, bits in entity_bits.items():
+        entity_tz = entity_timezones.get(entity, tz)
+        if entity_tz == tz:
+            continue
+        if slot_minutes is None:
+            slot_minutes = [slot_epoch_minutes(slot, year, tz) for slot in time_slots]
+        available = [slot_epoch_minutes(slot, year, entity_tz) for i, slot in enumerate(time_slots) if (bits >> i) & 1]
+        shifted = 0
+        for k in covered_slots(slot_minutes, [interval for interval in available if interval[0] is not None]):
+            shifted |= 1 << k
+        entity_bits[entity] = shifted
+
+def add_packed_slots(packed_slots, time_slots, proposer_bits, mentor_bits, year=DEFAULT_YEAR, tz=DEFAULT_TIMEZONE):
+    """
+    Add interview slots packed into the windows (--interview-minutes) to the availability bitsets.
+    
+    A packed slot is available to a mentor or proposer if it lies completely
+    inside their available windows, as when the schedule was made.
+    
+    Returns:
+        Extended list of time slots (the bitsets are updated in place)
+    """
+    window_minutes = [slot_epoch_minutes(slot, year, tz) for slot in time_slots]
+    packed_minutes = [slot_epoch_minutes(slot, year, tz) for slot in packed_slots]
+    for entity_bits in (proposer_bits, mentor_bits):
+        for entity, bits in entity_bits.items():
+            available = [window_minutes[i] for i in range(len(time_slots)) if (bits >> i) & 1 and window_minutes[i][0] is not None]
+            for k in covered_slots(packed_minutes, available):
+                bits |= 1 << (len(time_slots) + k)
+            entity_bits[entity] = bits
+    return time_slots + list(packed_slots)
+
+def validate_files(schedule_file, proposer_file, mentor_file, preference_file, year=DEFAULT_YEAR, tz=DEFAULT_TIMEZONE,
+                   timezone_file=None):
+    """Load a schedule CSV and the scheduler inputs, and validate the schedule."""
+    time_slots, proposer_bits = load_availability_bitsets(proposer_file)
+    mentor_slots, mentor_bits = load_availability_bitsets(mentor_file)
+    if mentor_slots != time_slots:
+        # Align the mentor bitsets to the proposer file's slot order
+        position = {slot: i for i, slot in enumerate(time_slots)}
+        realigned = {}
+        for mentor, bits in mentor_bits.items():
+            aligned = 0
+            for i, slot in enumerate(mentor_slots):
+                if (bits >> i) & 1 and slot in position:
+                    aligned |= 1 << position[slot]
+            realigned[mentor] = aligned
+        mentor_bits = realigned
+
+    if timezone_file:
+        entity_timezones = load_timezones_csv(timezone_file)
+        shift_timezones(time_slots, proposer_bits, entity_timezones, year, tz)
+        shift_timezones(time_slots, mentor_bits, entity_timezones, year, tz)
+
+    known = set(time_slots)
+    packed_slots = [slot for slot in dict.fromkeys(booking.time_slot for booking in read_schedule_csv(schedule_file))
+                    if slot not in known and INTERVAL_SLOT_PATTERN.match(slot)]
+    if packed_slots:
+        time_slots = add_packed_slots(packed_slots, time_slots, proposer_bits, mentor_bits, year, tz)
+
+    preferences = load_preferences_csv(preference_file)
+
+    return validate_schedule(read_schedule_csv(schedule_file), time_slots, proposer_bits, mentor_bits, preferences)
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate an interview schedule against availability and preferences.')
+    parser.add_argument('--schedule-file', required=True, help='complete_schedule.csv produced by the scheduler')
+    parser.add_argument('--proposer-file', required=True, help='CSV file with proposers\' availability')
+    parser.add_argument('--mentor-file', required=True, help='CSV file with mentors\' availability')
+    parser.add_argument('--preference-file', required=True, help='CSV file with mentors\' project preferences')
+    parser.add_argument('--report-file', help='CSV file to write the violations to')
+    parser.add_argument('--year', type=int, default=DEFAULT_YEAR, help='Year of form window slots (used for packed interview slots and time zones)')
+    parser.add_argument('--timezone', default=DEFAULT_TIMEZONE, help='IANA time zone of the slot labels (used for packed interview slots and time zones)')
+    parser.add_argument('--timezone-file', help='CSV file of mentors and projects that answered in their own time zone (name, time zone), as given to the scheduler')
+    parser.add_argument('--strict', action='store_true', help='Also fail on warnings (e.g. requested interviews that are not scheduled)')
+
+    args = parser.parse_args()
+
+    violations = validate_files(args.schedule_file, args.proposer_file, args.mentor_file, args.preference_file,
+                                args.year, args.timezone, args.timezone_file)
+
+    if args.report_file:
+        report_dir = os.path.dirname(args.report_file)
+        if report_dir:
+            os.makedirs(report_dir, exist_ok=True)
+        write_report(violations, args.report_file)
+
+    counts = summarize_violations(violations)
+    errors = sum(count for (severity, _), count in counts.items() if severity == 'error')
+    warnings = sum(count for (severity, _), count in counts.items() if severity == 'warning')
+
+    for (severity, check), count in sorted(counts.items()):
+        print(f"- {severity} {check}: {count}")
+    print(f"Validation finished: {errors} errors, {warnings} warnings")
+
+    if errors or (args.strict and warnings):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
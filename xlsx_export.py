@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Export a schedule to a single Excel workbook (also opens in Google Sheets).
+
+The workbook has a Summary sheet, the complete Schedule, one sheet per mentor
+and an Unscheduled sheet. It is written with openpyxl's write-only mode,
+which streams the rows to disk, so memory stays flat for large cohorts.
+openpyxl is optional and only imported when a workbook is written.
+"""
+
+import argparse
+import csv
+import os
+import re
+from schedule_io import SCHEDULE_COLUMNS, read_schedule_csv
+
+UNSCHEDULED_COLUMNS = ['Mentor', 'Project ID', 'Reason']
+
+# Excel limits sheet titles to 31 characters without []:*?/\
+MAX_TITLE_LENGTH = 31
+INVALID_TITLE_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+def sheet_title(name, used):
+    """
+    Return a valid sheet title for name that is not in used (compared case-insensitively), and add it to used.
+    """
+    base = INVALID_TITLE_CHARS.sub('_', str(name)).strip("'") or 'Sheet'
+    title = base[:MAX_TITLE_LENGTH]
+    n = 2
+    while title.lower() in used:
+        suffix = f" ({n})"
+        title = base[:MAX_TITLE_LENGTH - len(suffix)] + suffix
+        n += 1
+    used.add(title.lower())
+    return title
+
+def _add_sheet(workbook, title, columns, width=22):
+    from openpyxl.utils import get_column_letter
+    sheet = workbook.create_sheet(title)
+    for i in range(1, len(columns) + 1):
+        sheet.column_dimensions[get_column_letter(i)].width = width
+    sheet.append(columns)
+    return sheet
+
+def export_workbook(bookings, file_path, mentor_sheets=None, unscheduled=(), summary=None):
+    """
+    Write a schedule workbook row by row.
+
+    Args:
+        bookings: Iterable of (time_slot, project, mentors), sorted by time slot
+        file_path: Path of the .xlsx file
+        mentor_sheets: Optional iterable of (mentor, columns, row dictionaries), consumed
+            after bookings; by default each mentor's sessions are collected from bookings
+        unscheduled: Iterable of {'Mentor', 'Project ID', 'Reason'} dictionaries
+        summary: Optional {metric: value} added to the Summary sheet
+
+    Returns:
+        Number of mentor sheets written
+    """
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise ImportError("The workbook output requires openpyxl (pip install openpyxl)")
+
+    workbook = Workbook(write_only=True)
+    used = set()
+    # The summary comes first but is filled in last, from the counts gathered on the way
+    summary_sheet = _add_sheet(workbook, sheet_title('Summary', used), ['Metric', 'Value'], width=28)
+    schedule_sheet = _add_sheet(workbook, sheet_title('Schedule', used), SCHEDULE_COLUMNS)
+
+    sessions = interviews = 0
+    projects = set()
+    collected = {}
+    for time_slot, project, mentors in bookings:
+        schedule_sheet.append([time_slot, project, ', '.join(mentors)])
+        sessions += 1
+        interviews += len(mentors)
+        projects.add(project)
+        if mentor_sheets is None:
+            for mentor in mentors:
+                collected.setdefault(mentor, []).append({'Time Slot': time_slot, 'Project ID': project})
+
+    if mentor_sheets is None:
+        mentor_sheets = ((mentor, ['Time Slot', 'Project ID'], rows) for mentor, rows in sorted(collected.items()))
+    num_mentor_sheets = 0
+    for mentor, columns, rows in mentor_sheets:
+        sheet = _add_sheet(workbook, sheet_title(mentor, used), columns)
+        for row in rows:
+            sheet.append([row.get(column, '') for column in columns])
+        num_mentor_sheets += 1
+
+    unscheduled_sheet = _add_sheet(workbook, sheet_title('Unscheduled', used), UNSCHEDULED_COLUMNS)
+    num_unscheduled = 0
+    for row in unscheduled:
+        unscheduled_sheet.append([row[column] for column in UNSCHEDULED_COLUMNS])
+        num_unscheduled += 1
+
+    counts = {
+        'Sessions': sessions,
+        'Scheduled Interviews': interviews,
+        'Mentors': num_mentor_sheets,
+        'Projects': len(projects),
+        'Unscheduled Interviews': num_unscheduled,
+    }
+    for metric, value in {**counts, **(summary or {})}.items():
+        summary_sheet.append([metric, value])
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    workbook.save(file_path)
+    return num_mentor_sheets
+
+def _read_unscheduled_csv(file_path):
+    with open(file_path, encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+def main():
+    parser = argparse.ArgumentParser(description='Export a schedule to an Excel workbook with one sheet per mentor.')
+    parser.add_argument('--schedule-file', required=True, help='complete_schedule.csv produced by the scheduler')
+    parser.add_argument('--unscheduled-file', help='unscheduled_interviews.csv (default: next to the schedule file if it exists)')
+    parser.add_argument('--output-file', default='schedule.xlsx', help='Workbook to write')
+
+    args = parser.parse_args()
+
+    unscheduled_file = args.unscheduled_file
+    if unscheduled_file is None:
+        default_file = os.path.join(os.path.dirname(args.schedule_file), 'unscheduled_interviews.csv')
+        unscheduled_file = default_file if os.path.exists(default_file) else None
+
+    num_sheets = export_workbook(read_schedule_csv(args.schedule_file), args.output_file,
+                                 unscheduled=_read_unscheduled_csv(unscheduled_file) if unscheduled_file else ())
+    print(f"Workbook saved to {args.output_file} ({num_sheets} mentor sheets)")
+
+if __name__ == "__main__":
+    main()